@@ -1,6 +1,8 @@
 # Common algorithm implementations (C) KFW 2025
 from datastructs import *
-from typing import Iterable 
+from itertools import chain
+import math
+from typing import Callable, Iterable, Iterator
 
 # ------------- Searching algorithms -------------
 
@@ -60,3 +62,263 @@ def quickSort(iterable: Iterable) -> Iterable:
 
 def insertionSort(iterable: Iterable) -> Iterable:
     pass
+
+
+# ------------- Graph algorithms -------------
+# Each works on a Graph or a CSRGraph & the traversals are generators, so they stop as soon as 
+# the caller stops consuming them
+
+def bfs(graph: Graph | CSRGraph, source: int) -> Iterator:
+    """
+    Yields (vertex, depth) pairs in breadth-first order from source, where depth is the number of edges 
+    on the shortest path to the vertex
+    """
+
+    seen: bytearray = bytearray(len(graph))
+    seen[source] = 1
+    queue: Queue = Queue()
+    queue.enqueue((source, 0))
+    while queue.length:
+        u, depth = queue.dequeue()
+        yield u, depth
+        for v, _ in graph.neighbors(u):
+            if not seen[v]:
+                seen[v] = 1
+                queue.enqueue((v, depth + 1))
+
+def dfs(graph: Graph | CSRGraph, source: int) -> Iterator:
+    """
+    Yields vertices in depth-first pre-order from source, visiting neighbours in the order the graph 
+    stores them. Uses a Stack rather than recursion so deep graphs cannot overflow the call stack
+    """
+
+    seen: bytearray = bytearray(len(graph))
+    stack: Stack = Stack()
+    stack.push(source)
+    while len(stack):
+        u: int = stack.pop()
+        if seen[u]:
+            continue
+        seen[u] = 1
+        yield u
+        # Push in reverse so the first neighbour is visited first
+        for v in reversed([v for v, _ in graph.neighbors(u)]):
+            if not seen[v]:
+                stack.push(v)
+
+def dijkstra(graph: Graph | CSRGraph, source: int) -> Iterator:
+    """
+    Yields (vertex, distance, parent) triples in order of increasing distance from source, with a parent 
+    of None for source. Each vertex has at most one entry in the heap, whose priority is lowered by 
+    decreaseKey when a shorter path is found
+
+    :raises ValueError: If a negative edge weight is reached
+    """
+
+    handles: list = [None] * len(graph)
+    parents: list = [None] * len(graph)
+    done: bytearray = bytearray(len(graph))
+    heap: IndexedMinHeap = IndexedMinHeap()
+    handles[source] = heap.insert(source, 0)
+    while len(heap):
+        dist: int | float = heap.heap[0].priority
+        u: int = heap.delete()
+        done[u] = 1
+        yield u, dist, parents[u]
+        for v, weight in graph.neighbors(u):
+            if weight < 0:
+                raise ValueError("Dijkstra's algorithm cannot use negative edge weights")
+            if done[v]:
+                continue
+            handle: HeapHandle = handles[v]
+            if handle is None:
+                handles[v] = heap.insert(v, dist + weight)
+                parents[v] = u
+            elif dist + weight < handle.priority:
+                heap.decreaseKey(handle, dist + weight)
+                parents[v] = u
+
+def shortestPath(graph: Graph | CSRGraph, source: int, target: int) -> tuple:
+    """
+    Returns the (distance, path) of the shortest path from source to target, stopping Dijkstra's 
+    algorithm once target is reached, or (math.inf, []) if target cannot be reached
+    """
+
+    parents: dict = {}
+    for u, dist, parent in dijkstra(graph, source):
+        parents[u] = parent
+        if u == target:
+            return dist, _path(parents, target)
+    return math.inf, []
+
+def aStar(graph: Graph | CSRGraph, source: int, target: int, heuristic: Callable[[int], int | float]) -> tuple:
+    """
+    Returns the (distance, path) of the shortest path from source to target, or (math.inf, []) if target 
+    cannot be reached. Vertices are expanded in order of distance plus heuristic(vertex), so a heuristic 
+    that never overestimates the distance to target finds the shortest path while expanding fewer vertices 
+    than Dijkstra's algorithm. A vertex reached by a shorter path after being expanded is expanded again
+
+    :raises ValueError: If a negative edge weight is reached
+    """
+
+    dists: dict = {source: 0}
+    parents: dict = {source: None}
+    handles: dict = {}
+    heap: IndexedMinHeap = IndexedMinHeap()
+    handles[source] = heap.insert(source, heuristic(source))
+    while len(heap):
+        u: int = heap.delete()
+        if u == target:
+            return dists[u], _path(parents, target)
+        for v, weight in graph.neighbors(u):
+            if weight < 0:
+                raise ValueError("A* search cannot use negative edge weights")
+            dist: int | float = dists[u] + weight
+            if v in dists and dists[v] <= dist:
+                continue
+            dists[v] = dist
+            parents[v] = u
+            handle: HeapHandle | None = handles.get(v)
+            if handle is not None and handle in heap:
+                heap.decreaseKey(handle, dist + heuristic(v))
+            else:
+                handles[v] = heap.insert(v, dist + heuristic(v))
+    return math.inf, []
+
+def topologicalSort(graph: Graph | CSRGraph) -> Iterator:
+    """
+    Yields the vertices of a directed graph so that every edge goes from an earlier vertex to a later one, 
+    using Kahn's algorithm. The error for a cycle is raised once the vertices outside it have been yielded
+
+    :raises ValueError: If the graph is undirected or has a cycle
+    """
+
+    if not graph.directed:
+        raise ValueError("Only directed graphs can be topologically sorted")
+
+    indegree: list = [0] * len(graph)
+    for u in graph:
+        for v, _ in graph.neighbors(u):
+            indegree[v] += 1
+    queue: Queue = Queue()
+    for u in graph:
+        if not indegree[u]:
+            queue.enqueue(u)
+
+    count: int = 0
+    while queue.length:
+        u: int = queue.dequeue()
+        count += 1
+        yield u
+        for v, _ in graph.neighbors(u):
+            indegree[v] -= 1
+            if not indegree[v]:
+                queue.enqueue(v)
+    if count != len(graph):
+        raise ValueError("Graph has a cycle")
+
+def connectedComponents(graph: Graph | CSRGraph) -> Iterator:
+    """
+    Yields the vertices of each connected component as a list, in order of their smallest vertex. 
+    Edges of a directed graph are followed both ways, giving its weakly connected components
+    """
+
+    reverse: Graph | CSRGraph | None = graph.transpose() if graph.directed else None
+    seen: bytearray = bytearray(len(graph))
+    for start in graph:
+        if seen[start]:
+            continue
+        seen[start] = 1
+        component: list = [start]
+        stack: Stack = Stack()
+        stack.push(start)
+        while len(stack):
+            u: int = stack.pop()
+            edges: Iterable = graph.neighbors(u) if reverse is None else chain(graph.neighbors(u), reverse.neighbors(u))
+            for v, _ in edges:
+                if not seen[v]:
+                    seen[v] = 1
+                    component.append(v)
+                    stack.push(v)
+        yield component
+
+def bidirectionalSearch(graph: Graph | CSRGraph, source: int, target: int) -> list:
+    """
+    Returns a path from source to target with the fewest edges, or an empty list if there is none. 
+    Breadth-first searches from both ends expand the smaller frontier a whole level at a time, 
+    visiting far fewer vertices than a single search on graphs that branch widely. The backward 
+    search follows the edges of a directed graph in reverse
+
+    :raises IndexError: If source or target is not a vertex
+    """
+
+    if not (0 <= source < len(graph) and 0 <= target < len(graph)):
+        raise IndexError("Vertex out of bounds")
+    if source == target:
+        return [source]
+
+    reverse: Graph | CSRGraph = graph.transpose()
+    forward: dict = {source: None}
+    backward: dict = {target: None}
+    forwardFrontier: list = [source]
+    backwardFrontier: list = [target]
+    while forwardFrontier and backwardFrontier:
+        if len(forwardFrontier) <= len(backwardFrontier):
+            forwardFrontier, meet = _expand(graph, forwardFrontier, forward, backward)
+        else:
+            backwardFrontier, meet = _expand(reverse, backwardFrontier, backward, forward)
+        if meet is not None:
+            path: list = _path(forward, meet)
+            v: int | None = backward[meet]
+            while v is not None:
+                path.append(v)
+                v = backward[v]
+            return path
+    return []
+
+def kruskal(graph: Graph | CSRGraph) -> Iterator:
+    """
+    Yields the (u, v, weight) edges of a minimum spanning forest of an undirected graph in order of 
+    increasing weight, using a DisjointSet to skip edges that would form a cycle. Stopping after 
+    n - k edges leaves k clusters of closely connected vertices
+
+    :raises ValueError: If the graph is directed
+    """
+
+    if graph.directed:
+        raise ValueError("Spanning trees can only be found for undirected graphs")
+
+    # Each undirected edge is stored at both of its ends, so only take it from the smaller one
+    edges: list = sorted(((weight, u, v) for u in graph for v, weight in graph.neighbors(u) if u < v), key=lambda edge: edge[0])
+    sets: DisjointSet = DisjointSet(len(graph))
+    merges: int = 0
+    for weight, u, v in edges:
+        if merges == len(graph) - 1:
+            return
+        if sets.union(u, v):
+            merges += 1
+            yield u, v, weight
+
+def _expand(graph: Graph | CSRGraph, frontier: list, parents: dict, other: dict) -> tuple:
+    """ Expands a search frontier by one level & returns the next frontier with a vertex reached by the other search, if any """
+
+    nextFrontier: list = []
+    for u in frontier:
+        for v, _ in graph.neighbors(u):
+            if v not in parents:
+                parents[v] = u
+                if v in other:
+                    return nextFrontier, v
+                nextFrontier.append(v)
+    return nextFrontier, None
+
+def _path(parents: dict, target: int) -> list:
+    """ Follows parents back from target & returns the path from the start of the search to target """
+
+    path: list = []
+    v: int | None = target
+    while v is not None:
+        path.append(v)
+        v = parents[v]
+    path.reverse()
+    return path
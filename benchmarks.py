@@ -0,0 +1,407 @@
+# Benchmarks for data structure & algorithm implementations (C) KFW 2025
+# Run with: python benchmarks.py
+import algorithms
+from datastructs import *
+import array
+import io
+import os
+import pickle
+import random
+import threading
+import time
+
+
+def timeIt(fn: Callable, repeat: int = 3) -> float:
+    """
+    Returns the best wall clock time in seconds of calling fn repeat times
+    """
+
+    best: float = float("inf")
+    for _ in range(repeat):
+        start: float = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def printRow(name: str, *cols: any) -> None:
+    print(f"{name:<28}" + "".join(f"{col:>14}" for col in cols))
+
+
+# ------------- Heaps -------------
+
+def benchHeaps(n: int = 100_000) -> None:
+    """
+    Compares the binary, d-ary, indexed & pairing heaps on a bulk insert/delete workload 
+    and a Dijkstra-like workload mixing deletions with decrease-key
+    """
+
+    rng = random.Random(0)
+    values: list = [rng.random() for _ in range(n)]
+
+    def pushPop(make: Callable) -> Callable:
+        def run() -> None:
+            heap = make()
+            for val in values:
+                heap.insert(val)
+            while len(heap):
+                heap.delete()
+        return run
+
+    def pushPopKeyed(make: Callable) -> Callable:
+        def run() -> None:
+            heap = make()
+            for val in values:
+                heap.insert(val, val)
+            while len(heap):
+                heap.delete()
+        return run
+
+    def decreaseKey(make: Callable) -> Callable:
+        def run() -> None:
+            heap = make()
+            handles: list = [heap.insert(i, val) for i, val in enumerate(values)]
+            for i, handle in enumerate(handles):
+                # Every other deletion is preceded by lowering the priority of a random element
+                if i % 2 == 0 and len(heap):
+                    target = handles[rng.randrange(n)]
+                    if target.priority > 0 and target in heap:
+                        heap.decreaseKey(target, target.priority / 2)
+                heap.delete()
+        return run
+
+    print(f"Heaps (n={n})")
+    printRow("heap", "push+pop (s)", "decrease (s)")
+    printRow("MinHeap", f"{timeIt(pushPop(MinHeap)):.3f}", "-")
+    for d in (4, 8):
+        printRow(f"DAryHeap(d={d})", f"{timeIt(pushPop(lambda: DAryHeap(d=d))):.3f}", "-")
+    printRow("IndexedMinHeap", f"{timeIt(pushPopKeyed(IndexedMinHeap)):.3f}", f"{timeIt(decreaseKey(IndexedMinHeap)):.3f}")
+    printRow("PairingHeap", f"{timeIt(pushPopKeyed(PairingHeap)):.3f}", f"{timeIt(decreaseKey(PairingHeap)):.3f}")
+    print()
+
+
+# ------------- Buffers -------------
+
+def benchCircularBuffer(n: int = 1_000_000, chunk: int = 1000) -> None:
+    """
+    Compares per-element insert/remove against bulk write/read through a telemetry sized window
+    """
+
+    samples: array.array = array.array("d", (float(i) for i in range(n)))
+    chunks: list = [samples[i:i + chunk] for i in range(0, n, chunk)]
+
+    def perElement() -> None:
+        cb = CircularBuffer(4096, float)
+        for val in samples:
+            cb.insert(val)
+            cb.remove()
+
+    def bulk() -> None:
+        cb = CircularBuffer(4096, float)
+        for block in chunks:
+            cb.write(block)
+            cb.read(chunk)
+
+    print(f"CircularBuffer (n={n}, chunk={chunk})")
+    printRow("mode", "time (s)", "samples/s")
+    for name, fn in (("insert/remove", perElement), ("write/read", bulk)):
+        t: float = timeIt(fn)
+        printRow(name, f"{t:.3f}", f"{n / t:,.0f}")
+    print()
+
+
+# ------------- Concurrent queues -------------
+
+def benchBlockingQueue(n: int = 200_000, batch: int = 256) -> None:
+    """
+    Measures BlockingQueue throughput with varying numbers of producer & consumer threads, 
+    for single element & batched operations, and compares SPSCRing for one producer & consumer
+    """
+
+    def run(producers: int, consumers: int, batched: bool) -> Callable:
+        def consume(q: BlockingQueue) -> None:
+            while True:
+                if batched:
+                    items: list = q.getMany(batch)
+                    done: int = items.count(None)
+                    if done:
+                        # Hand any extra end markers back to the other consumers
+                        for _ in range(done - 1):
+                            q.put(None)
+                        return
+                elif q.get() is None:
+                    return
+
+        def produce(q: BlockingQueue, count: int) -> None:
+            if batched:
+                for start in range(0, count, batch):
+                    q.putMany(range(start, min(start + batch, count)))
+            else:
+                for i in range(count):
+                    q.put(i)
+
+        def bench() -> None:
+            q = BlockingQueue(4096)
+            threads: list = [threading.Thread(target=produce, args=(q, n // producers)) for _ in range(producers)]
+            readers: list = [threading.Thread(target=consume, args=(q,)) for _ in range(consumers)]
+            for thread in threads + readers:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            for _ in range(consumers):
+                q.put(None)
+            for thread in readers:
+                thread.join()
+        return bench
+
+    def spsc() -> None:
+        ring = SPSCRing(4096, int)
+
+        def produce() -> None:
+            for start in range(0, n, batch):
+                items = range(start, min(start + batch, n))
+                written: int = 0
+                while written < len(items):
+                    count: int = ring.write(items[written:])
+                    if count == 0:
+                        time.sleep(0)
+                    written += count
+
+        def consume() -> None:
+            received: int = 0
+            while received < n:
+                count: int = len(ring.read(batch))
+                if count == 0:
+                    time.sleep(0)
+                received += count
+
+        threads: list = [threading.Thread(target=produce), threading.Thread(target=consume)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    print(f"Concurrent queues (n={n}, batch={batch})")
+    printRow("producers x consumers", "put/get/s", "batched/s")
+    for producers, consumers in ((1, 1), (2, 2), (4, 4), (4, 1), (1, 4)):
+        single: float = timeIt(run(producers, consumers, False), repeat=1)
+        batched: float = timeIt(run(producers, consumers, True), repeat=1)
+        printRow(f"{producers} x {consumers}", f"{n / single:,.0f}", f"{n / batched:,.0f}")
+    printRow("SPSCRing 1 x 1", "-", f"{n / timeIt(spsc, repeat=1):,.0f}")
+    print()
+
+
+# ------------- Matrices -------------
+
+def benchMatrixMultiply(sizes: tuple = (128, 256, 512)) -> None:
+    """
+    Compares a naive triple loop over lists against the tiled & Strassen products of the pure python Matrix
+    """
+
+    rng = random.Random(0)
+
+    def naive(a: list, b: list) -> list:
+        n, k, m = len(a), len(b), len(b[0])
+        out: list = [[0.0] * m for _ in range(n)]
+        for i in range(n):
+            for j in range(m):
+                total: float = 0.0
+                for p in range(k):
+                    total += a[i][p] * b[p][j]
+                out[i][j] = total
+        return out
+
+    print("Matrix multiply (pure python)")
+    printRow("size", "naive (s)", "tiled (s)", "strassen (s)")
+    for size in sizes:
+        values: list = [[rng.random() for _ in range(size)] for _ in range(size)]
+        m = Matrix.fromList(values, backend="python")
+        printRow(f"{size} x {size}",
+                 f"{timeIt(lambda: naive(values, values), repeat=1):.3f}",
+                 f"{timeIt(lambda: m.multiply(m, threshold=None), repeat=1):.3f}",
+                 f"{timeIt(lambda: m.multiply(m), repeat=1):.3f}")
+    print()
+
+
+def benchParallelMatrix(size: int = 256, addSize: int = 2000) -> None:
+    """
+    Measures how add & multiply scale when the rows are split between 1 up to every core
+    """
+
+    rng = random.Random(0)
+    m = Matrix.fromList([[rng.random() for _ in range(size)] for _ in range(size)], backend="python")
+    big = Matrix.fromList([[rng.random() for _ in range(addSize)] for _ in range(addSize)], backend="python")
+
+    print(f"Parallel matrix (multiply {size} x {size}, add {addSize} x {addSize}, pure python)")
+    printRow("workers", "multiply (s)", "add (s)")
+    for workers in sorted({1, 2, 4, os.cpu_count() or 1}):
+        # Start the pool before timing so only the work is measured
+        m.multiply(m, workers=workers)
+        printRow(str(workers), f"{timeIt(lambda: m.multiply(m, workers=workers), repeat=1):.3f}",
+                 f"{timeIt(lambda: big.add(big, workers=workers), repeat=1):.3f}")
+    print()
+
+
+# ------------- Serialization -------------
+
+def benchSerialization(n: int = 200_000) -> None:
+    """
+    Compares dump & load against pickle for structures of n values, showing the time to write, 
+    the time to load from a warm in-memory file & the size written
+    """
+
+    rng = random.Random(0)
+    values: list = [rng.randrange(n * 10) for _ in range(n)]
+    linked = SinglyLL()
+    tree = BST()
+    table = HashTable(n // 8)
+    for val in values:
+        linked.insertTail(val)
+        tree.insert(val)
+        table.insert(val)
+    side: int = int(n ** 0.5)
+    m = Matrix.fromList([[rng.random() for _ in range(side)] for _ in range(side)], backend="python")
+
+    def binary(structure: any) -> tuple:
+        f = io.BytesIO()
+        write: float = timeIt(lambda: (f.seek(0), f.truncate(), structure.dump(f)), repeat=1)
+        read: float = timeIt(lambda: (f.seek(0), type(structure).load(f)), repeat=1)
+        return f"{write:.3f}", f"{read:.3f}", f"{len(f.getvalue()):,}"
+
+    def pickled(structure: any) -> tuple:
+        try:
+            data: bytes = pickle.dumps(structure)
+        except RecursionError:
+            return "recursion", "-", "-"
+        write: float = timeIt(lambda: pickle.dumps(structure), repeat=1)
+        read: float = timeIt(lambda: pickle.loads(data), repeat=1)
+        return f"{write:.3f}", f"{read:.3f}", f"{len(data):,}"
+
+    print(f"Serialization (n={n})")
+    printRow("structure", "dump (s)", "load (s)", "bytes")
+    for name, structure in (("SinglyLL", linked), ("BST", tree), ("HashTable", table), (f"Matrix {side} x {side}", m)):
+        printRow(f"{name} dump/load", *binary(structure))
+        printRow(f"{name} pickle", *pickled(structure))
+    print()
+
+
+# ------------- Graphs -------------
+
+def benchGraphTraversal(n: int = 200_000, degree: int = 5) -> None:
+    """
+    Compares traversals of a random directed graph with n vertices & about n * degree edges stored as 
+    a mutable adjacency list & as its frozen CSR form
+    """
+
+    rng = random.Random(0)
+    graph = Graph.fromEdges(((rng.randrange(n), rng.randrange(n), rng.random()) for _ in range(n * degree)), n, directed=True)
+    frozen = graph.freeze()
+
+    print(f"Graph traversal (n={n}, edges={graph.edgeCount:,})")
+    printRow("algorithm", "adjacency (s)", "CSR (s)")
+    for name, run in (("bfs", lambda g: sum(1 for _ in algorithms.bfs(g, 0))),
+                      ("dfs", lambda g: sum(1 for _ in algorithms.dfs(g, 0))),
+                      ("dijkstra", lambda g: sum(1 for _ in algorithms.dijkstra(g, 0))),
+                      ("components", lambda g: sum(1 for _ in algorithms.connectedComponents(g)))):
+        printRow(name, f"{timeIt(lambda: run(graph), repeat=1):.3f}", f"{timeIt(lambda: run(frozen), repeat=1):.3f}")
+    print()
+
+
+# ------------- Prefix trees -------------
+
+def benchPrefixQueries(n: int = 100_000, queries: int = 200) -> None:
+    """
+    Compares answering prefix queries over n random words by scanning a list of the keys against 
+    a Trie & a RadixTree, along with the time to bulk build each tree from the sorted keys
+    """
+
+    rng = random.Random(0)
+    keys: list = sorted({"".join(rng.choice("abcdefghij") for _ in range(rng.randint(4, 12))) for _ in range(n)})
+    prefixes: list = ["".join(rng.choice("abcdefghij") for _ in range(3)) for _ in range(queries)]
+
+    print(f"Prefix queries (n={len(keys)}, queries={queries})")
+    printRow("structure", "build (s)", "queries (s)")
+    printRow("list scan", "-", f"{timeIt(lambda: [[k for k in keys if k.startswith(p)] for p in prefixes], repeat=1):.3f}")
+    for cls in (Trie, RadixTree):
+        build: float = timeIt(lambda: cls.fromSorted(keys), repeat=1)
+        tree = cls.fromSorted(keys)
+        printRow(cls.__name__, f"{build:.3f}", f"{timeIt(lambda: [list(tree.keysWithPrefix(p)) for p in prefixes], repeat=1):.3f}")
+    print()
+
+
+# ------------- Range queries -------------
+
+def benchRangeQueries(n: int = 100_000, ops: int = 2000) -> None:
+    """
+    Compares alternating point updates & range sum / min queries over n elements, recomputing over 
+    an Array slice each time against a FenwickTree & SegmentTree
+    """
+
+    rng = random.Random(0)
+    arr = Array(n, int)
+    for _ in range(n):
+        arr.append(rng.randrange(1000))
+    workload: list = []
+    for _ in range(ops):
+        l: int = rng.randrange(n)
+        workload.append((rng.randrange(n), rng.randrange(1000), l, rng.randint(l + 1, n)))
+
+    def scan() -> None:
+        for i, val, l, r in workload:
+            arr.arr[i] = val
+            sum(arr[l:r])
+            min(arr[l:r])
+
+    def trees(fenwick: FenwickTree, segment: SegmentTree) -> None:
+        for i, val, l, r in workload:
+            fenwick.set(i, val)
+            segment.set(i, val)
+            fenwick.rangeSum(l, r)
+            segment.query(l, r)
+
+    print(f"Range queries (n={n}, ops={ops})")
+    printRow("structure", "build (s)", "ops (s)")
+    printRow("Array slices", "-", f"{timeIt(scan, repeat=1):.3f}")
+    build: float = timeIt(lambda: (FenwickTree(arr), SegmentTree(arr, min)), repeat=1)
+    printRow("Fenwick + segment tree", f"{build:.3f}", f"{timeIt(lambda: trees(FenwickTree(arr), SegmentTree(arr, min)), repeat=1) - build:.3f}")
+    print()
+
+
+def benchStaticRangeMin(n: int = 100_000, queries: int = 20_000) -> None:
+    """
+    Compares answering a batch of range minimum queries over n read-only elements with Array slices, 
+    a SegmentTree, a SqrtDecomposition & a SparseTable, including the time to build each
+    """
+
+    rng = random.Random(0)
+    arr = Array(n, int)
+    for _ in range(n):
+        arr.append(rng.randrange(1_000_000))
+    ranges: list = []
+    for _ in range(queries):
+        l: int = rng.randrange(n)
+        ranges.append((l, rng.randint(l + 1, min(l + 1000, n))))
+
+    print(f"Static range min (n={n}, queries={queries})")
+    printRow("structure", "build (s)", "queries (s)")
+    printRow("Array slices", "-", f"{timeIt(lambda: [min(arr[l:r]) for l, r in ranges], repeat=1):.3f}")
+    segment = SegmentTree(arr, min)
+    printRow("SegmentTree", f"{timeIt(lambda: SegmentTree(arr, min), repeat=1):.3f}", 
+             f"{timeIt(lambda: [segment.query(l, r) for l, r in ranges], repeat=1):.3f}")
+    for cls in (SqrtDecomposition, SparseTable):
+        structure = cls(arr, min)
+        printRow(cls.__name__, f"{timeIt(lambda: cls(arr, min), repeat=1):.3f}", f"{timeIt(lambda: structure.queryMany(ranges), repeat=1):.3f}")
+    print()
+
+
+if __name__ == "__main__":
+    benchHeaps()
+    benchCircularBuffer()
+    benchBlockingQueue()
+    benchMatrixMultiply()
+    benchParallelMatrix()
+    benchSerialization()
+    benchGraphTraversal()
+    benchPrefixQueries()
+    benchRangeQueries()
+    benchStaticRangeMin()
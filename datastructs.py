@@ -1,6 +1,288 @@
 # Common & custom data structures interface & implementation (C) KFW 2025 
+import array
+import asyncio
+import atexit
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
+from itertools import accumulate, chain, islice, repeat
+import mmap
+from multiprocessing import shared_memory
+import math
+import operator
+import os
+import pickle
+import random
+import struct
+import sys
+import threading
+import time
+from typing import Callable, Iterable, Iterator, Sequence
 
-class Array:
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def _identity(val: any) -> any:
+    return val
+
+
+# Marks lazily deleted entries
+_REMOVED = object()
+
+# array.array typecodes used to store python numeric types 
+_TYPECODES: dict = {int: "q", float: "d"}
+_FLOAT_TYPECODES: str = "fd"
+
+# Value of an empty cell in a floating point matrix
+_EMPTY: float = float("nan")
+
+
+def _typecode(type: any) -> str | None:
+    """ Returns the array.array typecode for a python type or typecode, None if it cannot be stored in a typed array """
+
+    if isinstance(type, str):
+        return type if len(type) == 1 and type in array.typecodes else None
+    return _TYPECODES.get(type)
+
+
+def _elementType(type: any) -> any:
+    """ Returns the python type of values held for a python type or typecode """
+
+    if not isinstance(type, str):
+        return type
+    return str if type in "uw" else float if type in _FLOAT_TYPECODES else int
+
+
+def _checkIndex(index: int, length: int) -> int:
+    """ Converts a negative index to a positive one & checks it is within bounds """
+
+    if index < 0:
+        index += length
+    if index < 0 or index >= length:
+        raise IndexError("Index out of bounds")
+    return index
+
+
+def _view(source: any, indices: range) -> any:
+    """ 
+    Returns a view of the given indexes of a container's storage without copying. The view looks the storage 
+    up through the container on every access, so the container can still grow or be cleared while it exists. 
+    Storage that can never be resized (a memoryview of a memory map) is viewed with a memoryview
+    """
+
+    storage: any = getattr(source, source._storage)
+    if not isinstance(storage, memoryview):
+        return SliceView(source, indices, source._storage)
+
+    if len(indices) == 0:
+        return storage[0:0]
+    stop: int | None = indices.stop if indices.stop >= 0 else None
+    return storage[indices.start:stop:indices.step]
+
+
+class SliceView:
+    """
+    Slice view - A window onto a slice of another structure that holds only the indexes of the slice. 
+              Reads & writes go through to the underlying structure so no elements are copied.
+
+    Attributes:
+    -----------
+    source:
+        The structure being viewed, indexable by position
+    indices: range
+        The positions within the source that the view covers
+    field: str | None
+        The attribute of the source holding its elements, None to index the source itself
+    """
+
+    def __init__(self, source: any, indices: range, field: str | None = None) -> None:
+        self.source: any = source
+        self.indices: range = indices
+        self.field: str | None = field
+
+    def __len__(self) -> int:
+        return len(self.indices)
+
+    def __iter__(self) -> Iterator:
+        for i in self.indices:
+            yield self.__storage()[i]
+
+    def __contains__(self, val: any) -> bool:
+        return any(item == val for item in self)
+
+    def __getitem__(self, index: int | slice) -> any:
+        if isinstance(index, slice):
+            return SliceView(self.source, self.indices[index], self.field)
+        return self.__storage()[self.indices[_checkIndex(index, len(self.indices))]]
+
+    def __setitem__(self, index: int, val: any) -> None:
+        self.__storage()[self.indices[_checkIndex(index, len(self.indices))]] = val
+
+    def __repr__(self) -> str:
+        return f"SliceView({list(self)})"
+
+    def tolist(self) -> list:
+        """ Returns a copy of the viewed elements as a list """
+
+        return list(self)
+
+    def __storage(self) -> any:
+        return self.source if self.field is None else getattr(self.source, self.field)
+
+
+class _Sequence:
+    """
+    Helper base class for containers, giving membership tests through iteration & indexing. Containers 
+    that keep their elements in order in an array name it in _storage, so indexing reads it directly 
+    & slices are views of it; other containers are indexed by walking from the front in O(n)
+    """
+
+    # The attribute holding the elements in order from index 0, None for linked containers
+    _storage: str | None = None
+
+    def __contains__(self, val: any) -> bool:
+        return any(item == val for item in self)
+
+    def __getitem__(self, index: int | slice) -> any:
+        """
+        Returns the element at a given index, or a view of a slice without copying it. 
+        Linked containers only support integer indexes, use itertools.islice to iterate over a range of elements
+
+        :raises IndexError: If specified index is out of the container bounds
+        """
+
+        if self._storage is None:
+            try:
+                return next(islice(self, _checkIndex(index, len(self)), None))
+            except StopIteration:
+                # The container holds fewer elements than its length says
+                raise IndexError("Index out of bounds") from None
+        if isinstance(index, slice):
+            return _view(self, range(len(self))[index])
+        return getattr(self, self._storage)[_checkIndex(index, len(self))]
+
+
+# Header of memory mapped files: magic, version, typecode, rows, columns & the number of elements in use
+_MMAP_HEADER: struct.Struct = struct.Struct("<4sBc2xqqq")
+_MMAP_MAGIC: bytes = b"DSMM"
+
+
+def _openMmap(path: str, typecode: str, rows: int, cols: int) -> tuple:
+    """ 
+    Memory maps a file of rows x cols elements after a fixed size header, creating it filled with zeros 
+    if it does not exist. Returns the map & the number of elements in use recorded in the header
+
+    :raises ValueError: If an existing file does not hold elements of the given type & shape
+    """
+
+    create: bool = not os.path.exists(path) or os.path.getsize(path) == 0
+    with open(path, "w+b" if create else "r+b") as f:
+        if create:
+            f.truncate(_MMAP_HEADER.size + rows * cols * array.array(typecode).itemsize)
+            f.write(_MMAP_HEADER.pack(_MMAP_MAGIC, 1, typecode.encode(), rows, cols, 0))
+        data: mmap.mmap = mmap.mmap(f.fileno(), 0)
+
+    magic, _, code, fileRows, fileCols, length = _MMAP_HEADER.unpack_from(data)
+    if magic != _MMAP_MAGIC or (code.decode(), fileRows, fileCols) != (typecode, rows, cols):
+        data.close()
+        raise ValueError(f"{path} does not hold {rows} x {cols} elements of type {typecode}")
+    return data, length
+
+
+# Header of files written by dump: magic, version, byte order & the length of the class name that follows
+_DUMP_HEADER: struct.Struct = struct.Struct("<4sBcH")
+_DUMP_MAGIC: bytes = b"DSBF"
+# Header of each section of values: kind, typecode & number of elements (bytes for pickled sections)
+_SECTION: struct.Struct = struct.Struct("<ccQ")
+
+
+def _dump(fileobj: any, obj: any, *sections: Iterable) -> None:
+    """ 
+    Writes a structure to a binary file object as its class name followed by sections of values. 
+    Typed arrays & sequences of ints, floats or strings are written as raw buffers, 
+    any other values are pickled as one flat list
+    """
+
+    name: bytes = type(obj).__name__.encode()
+    order: bytes = b"l" if sys.byteorder == "little" else b"b"
+    fileobj.write(_DUMP_HEADER.pack(_DUMP_MAGIC, 1, order, len(name)) + name + struct.pack("<I", len(sections)))
+    for values in sections:
+        if isinstance(values, (array.array, memoryview)) or (np is not None and isinstance(values, np.ndarray)):
+            _writeBuffer(fileobj, values)
+            continue
+
+        values = list(values)
+        if all(type(val) is str for val in values):
+            # Strings are written as their lengths followed by one utf-8 blob
+            fileobj.write(_SECTION.pack(b"s", b"q", len(values)))
+            fileobj.write(array.array("q", map(len, values)).tobytes())
+            blob: bytes = "".join(values).encode()
+            fileobj.write(struct.pack("<Q", len(blob)) + blob)
+            continue
+
+        for kind, typecode in ((int, "q"), (float, "d")):
+            if all(type(val) is kind for val in values):
+                try:
+                    _writeBuffer(fileobj, array.array(typecode, values))
+                    break
+                except OverflowError:
+                    pass
+        else:
+            data: bytes = pickle.dumps(values, pickle.HIGHEST_PROTOCOL)
+            fileobj.write(_SECTION.pack(b"p", b"B", len(data)) + data)
+
+
+def _writeBuffer(fileobj: any, values: any) -> None:
+    """ Writes a typed array, memoryview or numpy array as its raw bytes """
+
+    if isinstance(values, array.array):
+        typecode: str = values.typecode
+    elif isinstance(values, memoryview):
+        typecode = values.format
+    else:
+        typecode = values.dtype.char
+        values = np.ascontiguousarray(values)
+    raw: memoryview = memoryview(values).cast("B")
+    fileobj.write(_SECTION.pack(b"a", typecode.encode(), len(raw) // array.array(typecode).itemsize))
+    fileobj.write(raw)
+
+
+def _load(fileobj: any, cls: type) -> list:
+    """ 
+    Reads the sections of values of a structure written by _dump. Sections of numbers are 
+    returned as typed arrays, strings & pickled values as lists
+
+    :raises ValueError: If the file does not hold a dump of the given class
+    """
+
+    magic, _, order, size = _DUMP_HEADER.unpack(fileobj.read(_DUMP_HEADER.size))
+    name: str = fileobj.read(size).decode()
+    if magic != _DUMP_MAGIC or name != cls.__name__:
+        raise ValueError(f"File does not hold a dump of a {cls.__name__}")
+    swap: bool = order != (b"l" if sys.byteorder == "little" else b"b")
+
+    sections: list = []
+    for _ in range(struct.unpack("<I", fileobj.read(4))[0]):
+        kind, typecode, count = _SECTION.unpack(fileobj.read(_SECTION.size))
+        if kind == b"p":
+            sections.append(pickle.loads(fileobj.read(count)))
+            continue
+
+        values: array.array = array.array(typecode.decode())
+        values.frombytes(fileobj.read(count * values.itemsize))
+        if swap:
+            values.byteswap()
+        if kind == b"s":
+            text: str = fileobj.read(struct.unpack("<Q", fileobj.read(8))[0]).decode()
+            ends: list = list(accumulate(values))
+            values = [text[start:end] for start, end in zip(chain((0,), ends), ends)]
+        sections.append(values)
+    return sections
+
+
+class Array(_Sequence):
     """
     Static array - A structure consisting of elements of the same type, identifiable by an index, 
                 stored contiguosly in memory. It's size is not changeable
@@ -16,9 +298,15 @@ class Array:
         The maximum capacity of the array
     length: int
         The number of elements the array currently contains
+    mmap: mmap.mmap | None
+        The memory map of the file storing the array, if opened with openMmap
     
     Methods:
     --------
+    openMmap(path, size, type)
+        Opens an array of numbers stored in a file
+    flush() / close()
+        Writes a memory mapped array back to its file & closes it
     append(val)
         Adds an element to the end of the array
     delete(val)
@@ -39,14 +327,65 @@ class Array:
         Finds an element in the array and returns its inded
     print()
         Prints contents of the array
+    dump(fileobj) / load(fileobj)
+        Writes to or reads from a binary file object
     """
 
+    _storage: str = "arr"
+    mmap: 'mmap.mmap | None' = None
+
     def __init__(self, size: int, type: any) -> None:
         self.arr: list = [None] * size
         self.type = type
         self.size: int = size
         self.length: int = 0
 
+    def __len__(self) -> int:
+        return self.length
+
+    def __iter__(self) -> Iterator:
+        return islice(self.arr, self.length)
+
+    @classmethod
+    def openMmap(cls, path: str, size: int, type: any) -> 'Array':
+        """
+        Opens an array of numbers stored in a file, creating it if it does not exist. The elements are 
+        read & written through a memory map, so the file is paged in as it is used & slices are views of it
+
+        :raises TypeError: If the type cannot be stored as raw numbers
+        :raises ValueError: If the file holds an array of a different size or type
+        """
+
+        typecode: str | None = _typecode(type)
+        if typecode is None:
+            raise TypeError("Memory mapped arrays must store a numeric type")
+
+        arr: Array = cls.__new__(cls)
+        arr.mmap, arr.length = _openMmap(path, typecode, size, 1)
+        arr.arr = memoryview(arr.mmap)[_MMAP_HEADER.size:].cast(typecode)
+        arr.type, arr.size = type, size
+        return arr
+
+    def flush(self) -> None:
+        """
+        Records the length of a memory mapped array in its file & writes its changes to disk
+        """
+
+        if self.mmap is not None:
+            header: list = list(_MMAP_HEADER.unpack_from(self.mmap))
+            _MMAP_HEADER.pack_into(self.mmap, 0, *header[:-1], self.length)
+            self.mmap.flush()
+
+    def close(self) -> None:
+        """
+        Flushes & unmaps a memory mapped array, any views of it must be released first
+        """
+
+        if self.mmap is not None:
+            self.flush()
+            self.arr.release()
+            self.mmap.close()
+
     def append(self, val: any) -> None:
         """
         Appends an element to the end of the array
@@ -86,7 +425,7 @@ class Array:
                 target_index = i
         
         if found:
-            self.arr[target_index] = None
+            self.arr[target_index] = self.__blank()
             self.__shiftLeft(target_index)
             self.length -= 1
         
@@ -123,7 +462,7 @@ class Array:
         if index < 0 or index > self.length:
             raise IndexError("Index out of range.")
     
-        self.arr[index] = None
+        self.arr[index] = self.__blank()
         self.__shiftLeft(index)
         self.length -=1
                 
@@ -139,7 +478,7 @@ class Array:
             raise Exception("Cannot pop from empty array.")
         
         val = self.arr[self.length-1]
-        self.arr[self.length-1] = None
+        self.arr[self.length-1] = self.__blank()
         self.length -= 1
         return val
     
@@ -160,7 +499,9 @@ class Array:
 
         :param bool desc: Sorts array in descending order
         """
-        self.arr = self.__sort(self.arr, desc) 
+
+        values: list = self.__sort(list(self.arr[:self.length]), desc)
+        self.arr[:self.length] = values if isinstance(self.arr, list) else array.array(self.arr.format, values)
 
     def __sort(self, arr: list, desc: bool) -> list:
        if len(arr) <= 1:
@@ -195,11 +536,32 @@ class Array:
         :param val: Value to be searched for
         """
 
-        for i in range(self.arr):
+        for i in range(self.length):
             if self.arr[i] == val:
                 return i
         return -1 
 
+    def dump(self, fileobj: any) -> None:
+        """
+        Writes the array to a binary file object, numeric elements as a raw buffer
+        """
+
+        _dump(fileobj, self, [self.size], [self.type], self.arr[:self.length])
+
+    @classmethod
+    def load(cls, fileobj: any) -> 'Array':
+        """
+        Reads an array written by dump from a binary file object
+
+        :raises ValueError: If the file does not hold a dump of this class
+        """
+
+        (size,), (type,), values = _load(fileobj, cls)
+        arr: Array = cls(size, type)
+        arr.arr[:len(values)] = values
+        arr.length = len(values)
+        return arr
+
     def print(self) -> None:
         """
         Prints contents of the array
@@ -214,12 +576,17 @@ class Array:
         return self.length == self.size
 
     def __shiftLeft(self, index: int):
-        for i in range(index, self.size):
+        for i in range(index + 1, self.size):
             self.arr[i-1] = self.arr[i]
-            self.arr[i] = None
+            self.arr[i] = self.__blank()
     
+    def __blank(self) -> any:
+        """ Returns the value left in unused slots, typed storage cannot hold None """
+
+        return None if isinstance(self.arr, list) else 0
+
     def __checkType(self, val: any) -> None:
-        if type(val) == self.type:
+        if type(val) != self.type:
             raise TypeError("Value must be of same type declared when initialising array")
     
     def __merge(self, left: list, right: list, desc: bool) -> list:
@@ -253,7 +620,7 @@ class Array:
         return res
 
 
-class DynamicArray:
+class DynamicArray(_Sequence):
     """
     Dynamic array - A structure consisting of elements of the same type, 
                     identifiable by an index, stored contiguosly in memory. 
@@ -290,14 +657,24 @@ class DynamicArray:
         Returns an element at a given index 
     print()
         Prints contents of the array
+    dump(fileobj) / load(fileobj)
+        Writes to or reads from a binary file object
     """
 
+    _storage: str = "arr"
+
     def __init__(self, type) -> None:
         self.type = type
         self.size: int = 2
         self.length: int = 0
         self.arr: list = [None] * self.size
 
+    def __len__(self) -> int:
+        return self.length
+
+    def __iter__(self) -> Iterator:
+        return islice(self.arr, self.length)
+
     def append(self, val: any) -> None:
         """
         Appends an element to the end of the array
@@ -417,6 +794,28 @@ class DynamicArray:
         
         return self.arr[index]
     
+    def dump(self, fileobj: any) -> None:
+        """
+        Writes the array to a binary file object, numeric elements as a raw buffer
+        """
+
+        _dump(fileobj, self, [self.type], self.arr[:self.length])
+
+    @classmethod
+    def load(cls, fileobj: any) -> 'DynamicArray':
+        """
+        Reads an array written by dump from a binary file object
+
+        :raises ValueError: If the file does not hold a dump of this class
+        """
+
+        (type,), values = _load(fileobj, cls)
+        arr: DynamicArray = cls(type)
+        arr.size = max(arr.size, len(values))
+        arr.arr = list(values) + [None] * (arr.size - len(values))
+        arr.length = len(values)
+        return arr
+
     def print(self) -> None:
         """ 
         Prints contents of the array 
@@ -475,68 +874,259 @@ class DynamicArray:
         return res
 
            
-class Stack:
+class Stack(_Sequence):
     """
     Stack - A structure consiting of elements that can be of different types. 
             Operates in the last-in-first-out (LIFO) principle. 
 
     Attributes:
     ----------- 
-    stack: list
-        The underlying array which stores elemetns on the stack
+    stack: list | array.array
+        The underlying array which stores elemetns on the stack, a typed array.array for numeric types
+    capacity: int | None
+        The maximum number of elements on the stack, None if unbounded
+    type:
+        The specified data type of the elements, None if elements can be of different types
 
     Methods:
     --------
     push(val)
         Adds a value to the top of the stack 
+    pushMany(iterable)
+        Adds many values to the top of the stack
     pop()
         Removes and returns the top value of the stack 
+    popMany(n)
+        Removes and returns the top n values of the stack 
     peek()
-        Prints the top value of the stack 
+        Returns the top value of the stack 
     clear()
         Clears contents of stack
     print()
         Prints contents of stack
+    dump(fileobj) / load(fileobj)
+        Writes to or reads from a binary file object
     """
 
-    def __init__(self):
-        self.stack: list = [] 
+    _storage: str = "stack"
+
+    def __init__(self, capacity: int | None = None, type: any = None) -> None:
+        if capacity is not None and capacity <= 0:
+            raise ValueError("Capacity of stack must be positive")
+        self.capacity: int | None = capacity
+        self.type: any = type
+        self.stack: list | array.array = self._allocate()
+
+    def __len__(self) -> int:
+        return len(self.stack)
+
+    def __iter__(self) -> Iterator:
+        """ Iterates from the bottom to the top of the stack """
+
+        return iter(self.stack)
+
+    def __contains__(self, val: any) -> bool:
+        return val in self.stack
 
     def push(self, val: any) -> None:
         """
         Adds a value to the top of the stack 
+
+        :raises OverflowError: If the stack is at capacity
+        :raises TypeError: If type of value does not match specified type of stack
         """
 
+        if self.capacity is not None and len(self.stack) >= self.capacity:
+            raise OverflowError("Cannot push to full stack.")
+        if self.type is not None and type(val) != _elementType(self.type):
+            raise TypeError("Value must be of same type declared when initialising stack.")
         self.stack.append(val)
 
+    def pushMany(self, iterable: Iterable) -> None:
+        """
+        Adds many values to the top of the stack, the last value ending on top. 
+        Either all values are pushed or none are
+
+        :raises OverflowError: If the values do not fit within the capacity of the stack
+        :raises TypeError: If type of a value does not match specified type of stack
+        """
+
+        items: list | array.array = self._convert(iterable)
+        if self.capacity is not None and len(self.stack) + len(items) > self.capacity:
+            raise OverflowError("Cannot push beyond capacity of stack.")
+        self.stack.extend(items)
+
     def pop(self) -> any:
         """
         Removes and returns the top value of the stack 
+
+        :raises Exception: If the stack is empty
         """
 
+        if not self.stack:
+            raise Exception("Cannot pop from empty stack.")
         return self.stack.pop()
 
-    def peek(self) -> None:
+    def popMany(self, n: int) -> list | array.array:
+        """
+        Removes and returns up to n values from the top of the stack with a single slice, top value first
+        """
+
+        start: int = max(0, len(self.stack) - n)
+        out: list | array.array = self.stack[start:]
+        del self.stack[start:]
+        out.reverse()
+        return out
+
+    def peek(self) -> any:
         """
-        Prints the top value of the stack 
+        Returns the top value of the stack 
+
+        :raises Exception: If the stack is empty
         """
 
-        print(self.stack[-1])
+        if not self.stack:
+            raise Exception("Cannot peek empty stack.")
+        return self.stack[-1]
     
     def clear(self) -> None:
         """
-        Clears contents of stack 
+        Clears contents of stack in O(1)
+        """
+
+        self.stack = self._allocate()
+
+    def dump(self, fileobj: any) -> None:
+        """
+        Writes the stack to a binary file object from bottom to top, a typed stack as a raw buffer
+        """
+
+        _dump(fileobj, self, [self.capacity], [self.type], self.stack)
+
+    @classmethod
+    def load(cls, fileobj: any) -> 'Stack':
+        """
+        Reads a stack written by dump from a binary file object
+
+        :raises ValueError: If the file does not hold a dump of this class
         """
 
-        while self.stack:
-            self.stack.pop()
+        (capacity,), (type,), values = _load(fileobj, cls)
+        stack: Stack = cls(capacity, type)
+        stack.pushMany(values)
+        return stack
 
     def print(self) -> None:
         """
         Prints contents of stack
         """
 
-        print(self.stack)
+        print(list(self.stack))
+
+    def _allocate(self) -> list | array.array:
+        typecode: str | None = _typecode(self.type)
+        return array.array(typecode) if typecode is not None else []
+
+    def _convert(self, iterable: Iterable) -> list | array.array:
+        """ 
+        Converts values to the stack's storage type, checking their type. 
+        Arrays of the stack's typecode are taken as already checked
+        """
+
+        typed: bool = type(self.stack) == array.array
+        if typed and type(iterable) == array.array and iterable.typecode == self.stack.typecode:
+            return iterable
+
+        items: list = list(iterable)
+        if self.type is not None:
+            element: any = _elementType(self.type)
+            for val in items:
+                if type(val) != element:
+                    raise TypeError("Value must be of same type declared when initialising stack.")
+        return array.array(self.stack.typecode, items) if typed else items
+
+
+class MinMaxStack(Stack):
+    """
+    Min max stack - A stack that also answers the minimum & maximum of its values in O(1). 
+                 Two auxiliary stacks hold the running minimum & maximum at each height of the stack 
+                 so they can be pushed & popped alongside it, including in bulk.
+                 Shares the interface of Stack.
+
+    Methods:
+    --------
+    min()
+        Returns the smallest value on the stack
+    max()
+        Returns the largest value on the stack
+    """
+
+    def __init__(self, capacity: int | None = None, type: any = None) -> None:
+        super().__init__(capacity, type)
+        self.__mins: list | array.array = self._allocate()
+        self.__maxs: list | array.array = self._allocate()
+
+    def push(self, val: any) -> None:
+        super().push(val)
+        if len(self.__mins) > 0:
+            self.__mins.append(min(self.__mins[-1], val))
+            self.__maxs.append(max(self.__maxs[-1], val))
+        else:
+            self.__mins.append(val)
+            self.__maxs.append(val)
+
+    def pushMany(self, iterable: Iterable) -> None:
+        items: list | array.array = self._convert(iterable)
+        super().pushMany(items)
+        if len(items) == 0:
+            return
+
+        lowest: any = items[0]
+        highest: any = items[0]
+        if len(self.__mins) > 0:
+            lowest = min(self.__mins[-1], lowest)
+            highest = max(self.__maxs[-1], highest)
+        self.__mins.extend(accumulate(items[1:], min, initial=lowest))
+        self.__maxs.extend(accumulate(items[1:], max, initial=highest))
+
+    def pop(self) -> any:
+        val: any = super().pop()
+        self.__mins.pop()
+        self.__maxs.pop()
+        return val
+
+    def popMany(self, n: int) -> list | array.array:
+        out: list | array.array = super().popMany(n)
+        del self.__mins[len(self.stack):]
+        del self.__maxs[len(self.stack):]
+        return out
+
+    def clear(self) -> None:
+        super().clear()
+        self.__mins = self._allocate()
+        self.__maxs = self._allocate()
+
+    def min(self) -> any:
+        """
+        Returns the smallest value on the stack
+
+        :raises Exception: If the stack is empty
+        """
+
+        if not self.stack:
+            raise Exception("Cannot get minimum of empty stack.")
+        return self.__mins[-1]
+
+    def max(self) -> any:
+        """
+        Returns the largest value on the stack
+
+        :raises Exception: If the stack is empty
+        """
+
+        if not self.stack:
+            raise Exception("Cannot get maximum of empty stack.")
+        return self.__maxs[-1]
 
 
 class ListNode:
@@ -546,7 +1136,7 @@ class ListNode:
             self.prev: ListNode | None = None
 
   
-class SinglyLL:
+class SinglyLL(_Sequence):
     """
     Singly Linked list - a structure similar to an array 
                 but the elements are not stored contiguosly in memory, 
@@ -579,6 +1169,8 @@ class SinglyLL:
         Checks to see if some element is in the linked list & returns position
     print()
         Prints contents of the linked list 
+    dump(fileobj) / load(fileobj)
+        Writes to or reads from a binary file object
     """
 
     def __init__(self) -> None:
@@ -586,6 +1178,15 @@ class SinglyLL:
         self.tail: ListNode = None
         self.length: int = 0
 
+    def __len__(self) -> int:
+        return self.length
+
+    def __iter__(self) -> Iterator:
+        curr: ListNode = self.head
+        while curr:
+            yield curr.val
+            curr = curr.next
+
     def insertHead(self, val: any) -> None:
         """
         Inserts an element at the front (head) of the linked list 
@@ -665,11 +1266,19 @@ class SinglyLL:
         if index < 0 or index > self.length -1:
             raise IndexError("Index is out of bounds")
 
+        if index == 0:
+            self.removeHead()
+            return
+
         i: int = 0 
-        curr: ListNode = self.head
-        while i < index and curr:
+        prev: ListNode = self.head
+        while i < index - 1:
             i += 1
-            curr = curr.next
+            prev = prev.next
+
+        prev.next = prev.next.next
+        if prev.next is None:
+            self.tail = prev
         self.length -= 1
 
     def reverse(self) -> None:
@@ -707,6 +1316,27 @@ class SinglyLL:
                 position += 1
         return -1
 
+    def dump(self, fileobj: any) -> None:
+        """
+        Writes the list to a binary file object as a flat array of its values
+        """
+
+        _dump(fileobj, self, list(self))
+
+    @classmethod
+    def load(cls, fileobj: any) -> 'SinglyLL':
+        """
+        Reads a list written by dump from a binary file object
+
+        :raises ValueError: If the file does not hold a dump of this class
+        """
+
+        values, = _load(fileobj, cls)
+        linked: SinglyLL = cls()
+        for val in values:
+            linked.insertTail(val)
+        return linked
+
     def print(self) -> None:
         """
         Prints contents of the linked list 
@@ -722,7 +1352,7 @@ class SinglyLL:
         return not self.head
 
 
-class DoublyLL:
+class DoublyLL(_Sequence):
     """
     Doubly linked list - A structure similar to a singly linked list 
                         but each element within the list is connected to the 
@@ -739,6 +1369,8 @@ class DoublyLL:
     
     Methods:
     --------
+    dump(fileobj) / load(fileobj)
+        Writes to or reads from a binary file object
     """
 
     def __init__(self) -> None:
@@ -747,6 +1379,15 @@ class DoublyLL:
         self.length: int = 0
     
 
+    def __len__(self) -> int:
+        return self.length
+
+    def __iter__(self) -> Iterator:
+        curr: ListNode = self.head
+        while curr:
+            yield curr.val
+            curr = curr.next
+
     def insertHead(self, val: any) -> None:
         """
         Inserts an element at the head (front) of the linked list 
@@ -819,8 +1460,14 @@ class DoublyLL:
         if self.__isEmpty():
             raise Exception("Cannot remove from empty list")
         
-        self.head.next.prev.val = None
-        self.head = self.head.next
+        node: ListNode = self.head
+        self.head = node.next
+        node.next = None
+        if self.head:
+            self.head.prev = None
+        else:
+            self.tail = None
+        self.length -= 1
 
 
     def removeTail(self) -> None:
@@ -831,8 +1478,14 @@ class DoublyLL:
         if self.__isEmpty():
             raise Exception("Cannot remove from empty list")
         
-        self.tail.prev.next = None
-        self.tail = self.tail.prev
+        node: ListNode = self.tail
+        self.tail = node.prev
+        node.prev = None
+        if self.tail:
+            self.tail.next = None
+        else:
+            self.head = None
+        self.length -= 1
 
 
     def removeAt(self) -> None:
@@ -874,6 +1527,27 @@ class DoublyLL:
                 index += 1
         return -1
 
+    def dump(self, fileobj: any) -> None:
+        """
+        Writes the list to a binary file object as a flat array of its values
+        """
+
+        _dump(fileobj, self, list(self))
+
+    @classmethod
+    def load(cls, fileobj: any) -> 'DoublyLL':
+        """
+        Reads a list written by dump from a binary file object
+
+        :raises ValueError: If the file does not hold a dump of this class
+        """
+
+        values, = _load(fileobj, cls)
+        linked: DoublyLL = cls()
+        for val in values:
+            linked.insertTail(val)
+        return linked
+
     def print(self) -> None:
         """ Prints contents of linked list """
 
@@ -887,1002 +1561,7475 @@ class DoublyLL:
         return not self.head
 
 
-class Queue:
+class UnrolledNode:
     """
-    Queue - A structure consiting of elements that can be of different types. 
-            Operates in the first-in-first-out (FIFO) principle 
-            meaning the first element added will be the first element removed
+    Helper class for UnrolledLL, each node holds a small block of elements
     """
-    def __init__(self) -> None:
-        self.first: ListNode = None 
-        self.last: ListNode = None
-        self.length: int = 0
+    def __init__(self, items: list | None = None) -> None:
+        self.items: list = items if items is not None else []
+        self.next: UnrolledNode | None = None
 
-    def enqueue(self, val: any) -> None:
-        """
-         Adds an item to the front of the queue 
-        """
-        new_node: ListNode = ListNode(val)
-        
-        if self.__isEmpty():
-            self.first = self.last = new_node
-        else:
-            self.last.next = new_node
-            self.last = self.last.next
-        self.length += 1
 
-    def dequeue(self) -> any:
-        """
-        Removes the first item from the queue 
-        """
-        if self.__isEmpty():
-            raise Exception("Cannot dequeue from empty queue")
-        
-        if self.length == 1:
-            val = self.first.val
-            self.first = self.last = None
-            self.length -= 1
-            return val
-        
-        val = self.first.val
-        self.first = self.first.next
-        self.length -= 1
-        return val
-    
-    def getfront(self) -> any:
-        """
-        Returns the first item in the queue
-        """
-        return self.first.val
-
-    def getRear(self) -> any:
-        """
-        Returns the last item in the queue  
-        """
-        return self.last.val
-
-    def print(self) -> None:
-        """
-        Prints the entire queue 
-        """
-        curr = self.first
-        while curr != None:
-            print(f"{curr.val}->",end="")
-            curr = curr.next
-        print()
-
-    def __isEmpty(self) -> int:
-        return self.length == 0
+class UnrolledLL:
+    """
+    Unrolled linked list - A linked list where each node stores a small array (block) of elements 
+                        instead of a single element. Elements in a block are stored contiguosly 
+                        so there are far fewer nodes to follow & less memory used per element.
+                        Blocks are split when they overflow & merged when they become half empty.
+                        Shares the interface of SinglyLL.
 
+    Attributes:
+    -----------
+    head: UnrolledNode
+        The first block in the linked list 
+    tail: UnrolledNode
+        The last block in the linked list
+    length: int
+        The current length of the linked list
+    blockSize: int
+        The maximum number of elements in a block 
 
-class Deque:
-    """
-    Deque - Short for double ended queue it is a structure consiting of elements that cane be of different types.
-         It is similar to a queue in the fact it operates in the first-in-first-out (FIFO) principle but differs to a queue
-         as both ends can act as the first element in the queue i.e elements can be added and removed from the front and back    
+    Methods:
+    --------
+    insertHead(val)
+        Inserts an element at the front (head) of the linked list 
+    insertTail(val)
+        Inserts an element at the end (tail) of the linked list 
+    insertAt(val, index)
+        Inserts an element at a given index
+    removeHead()
+        Removes & returns the first (head) element of the linked list
+    removeTail()
+        Removes & returns the last (tail) element of the linked list
+    removeAt(index)
+        Removes & returns the element at a specified index 
+    get(index)
+        Returns the element at a given index
+    reverse()
+        Reverses contents linked list 
+    find(target)
+        Checks to see if some element is in the linked list & returns position
+    print()
+        Prints contents of the linked list 
+    dump(fileobj) / load(fileobj)
+        Writes to or reads from a binary file object
     """
-    def __init__(self) -> None:
-        self.front = None
-        self.back = None
-        self.length = 0
-    
-    def append(self, val: any) -> None:
-        new_node = ListNode(val)
-        if self.__isEmpty():
-            self.front = new_node
-            self.back = new_node
-        else:
-            self.back.next = new_node
-            new_node.prev = self.back
-            self.back = new_node
-        self.length += 1
-
-    def appendLeft(self, val: any) -> None:
-        new_node = ListNode(val)
-        if self.__isEmpty():
-            self.front = new_node
-            self.back = new_node
-        else:            
-            new_node.next = self.front
-            self.front.prev = new_node
-            self.front = new_node
-        self.length +=1
 
-    def pop(self) -> any:
-        pass
+    def __init__(self, blockSize: int = 64) -> None:
+        if blockSize < 2:
+            raise ValueError("Block size must be at least 2")
+        self.head: UnrolledNode | None = None
+        self.tail: UnrolledNode | None = None
+        self.length: int = 0
+        self.blockSize: int = blockSize
 
-    def popLeft(self) -> any:
-        if self.__isEmpty():
-            raise Exception("Cannot remove from empty list")
-        
-        val = self.front.val
-        self.front = self.front.next
-        return val
+    def __len__(self) -> int:
+        return self.length
 
-    def print(self) -> None:
-        curr = self.front
-        while curr != None:
-            print(f"{curr.val}<->",end="")
+    def __iter__(self) -> Iterator:
+        curr: UnrolledNode = self.head
+        while curr:
+            yield from curr.items
             curr = curr.next
-        print()
 
-    def __isEmpty(self) -> bool:
-        return not self.front
+    def __contains__(self, val: any) -> bool:
+        return self.find(val) != -1
 
+    def __getitem__(self, index: int) -> any:
+        return self.get(_checkIndex(index, self.length))
 
-class CircularQueue:
-    """
-    Circular queue - similar to a regular queue except the last element in the queue is connected to
-                  the first element, forming a circle. A circualr queue still operates in the first-in-first-out (FIFO)
-                  principle
-    """
-    def __init__(self, size: int, type: any):
-        self.size: int = size
-        self.type: any = type
-        self.queue: list = [None] * self.size
-        
-    def enqueue(self, val: any) -> None:
+    def insertHead(self, val: any) -> None:
         """
-        Adds an item to the front of the queue 
+        Inserts an element at the front (head) of the linked list 
         """
-        pass
 
-    def dequeue(self) -> any:
-        """
-        Removes the first item from the queue        
-        """
-        pass
-    
-    def getfront(self) -> any:
-        """
-        Returns the first item in the queue       
-        """
-        pass
+        self.insertAt(val, 0)
 
-    def getRear(self) -> any:
+    def insertTail(self, val: any) -> None:
         """
-        Returns the last item in the queue        
+        Inserts an element at the end (tail) of the linked list in O(1)
         """
-        pass
 
+        if self.__isEmpty():
+            self.head = self.tail = UnrolledNode()
+        elif len(self.tail.items) == self.blockSize:
+            # Start a new block rather than splitting so appending fills blocks completely
+            self.tail.next = UnrolledNode()
+            self.tail = self.tail.next
 
-class PriorityQueue:
-    """
-    Priority queue - A subset of the queue data structure that arranges elements based on their priority value.
-                  Elements with a higher priority are retrieved and removed first                   
-    """
-    pass
+        self.tail.items.append(val)
+        self.length += 1
 
+    def insertAt(self, val: any, index: int) -> None:
+        """
+        Inserts an element at a given index 
 
-class CircularBuffer:
-    """
-    Circular buffer - A structure consisting of elements of the same type, identifiable by an index,
-                   stored contigously in memory. It's size is not changeable & once the buffer is full
-                   the oldest data is overwrited starting from the beginning.
-    """
-    def __init__(self, size: int, type: any) -> None:
-        self.buffer = Array(size, type)
-        self.type = type
-        self.size = size
-        self.first = 0
+        :raises IndexError: If the specified index is outside the bounds of the linked list 
+        """
 
-    def insert(self, val) -> None:
-        if type(val) != self.type:
-            raise TypeError("Value data type does not match specified data type.")
+        if index < 0 or index > self.length:
+            raise IndexError("Index out of bounds")
+        if index == self.length:
+            self.insertTail(val)
+            return
 
-        if self.__isFull():
-            raise MemoryError("Buffer is full.")
+        node, offset = self.__locate(index)
+        node.items.insert(offset, val)
+        self.length += 1
+        if len(node.items) > self.blockSize:
+            self.__split(node)
 
-        last = (self.first + self.buffer.length) % self.buffer.size
-        self.buffer.insertAt(last, val)
-        self.buffer.length += 1
+    def removeHead(self) -> any:
+        """
+        Removes & returns the first (head) element of the linked list
 
-    def remove(self):
-        if self.__isEmpty():
-            return None
-        
-        val = self.buffer.get(self.first)
-        self.first = (self.first + 1) % self.buffer.size
-        self.buffer.length -= 1
-        return val
+        :raises Exception: If the linked list is empty 
+        """
 
-    def getFirst(self) -> any:
         if self.__isEmpty():
-            return None
-        return self.buffer.get(self.first)
+            raise Exception("Cannot remove from empty linked list")
+        return self.removeAt(0)
 
-    def getLast(self) -> any:
-        if self.__isEmpty():
-            return None
-        last = (self.first + self.buffer.length-1) % self.buffer.size
-        return self.buffer.get(last)
+    def removeTail(self) -> any:
+        """
+        Removes & returns the last (tail) element of the linked list
 
-    def print(self):
-        print(self.buffer.print())
+        :raises Exception: If the linked list is empty 
+        """
 
-    def __isFull(self) -> bool:
-        return self.buffer.length == self.buffer.size
+        if self.__isEmpty():
+            raise Exception("Cannot remove from empty linked list")
+        return self.removeAt(self.length - 1)
 
-    def __isEmpty(self) -> bool:
-        return self.buffer.length == 0
+    def removeAt(self, index: int) -> any:
+        """
+        Removes & returns the element at a specified index 
 
+        :raises IndexError: If specified index is out of the linked list bounds
+        """
 
-class TreeNode:
-    """
-    Helper class for BinaryTree & Binary Search Tree classes  
-    """
-    def __init__(self, val: any) -> None:
-        self.val: any = val
-        self.left: TreeNode = None
-        self.right: TreeNode = None
+        if index < 0 or index > self.length - 1:
+            raise IndexError("Index is out of bounds")
 
+        prev: UnrolledNode | None = None
+        node: UnrolledNode = self.head
+        while index >= len(node.items):
+            index -= len(node.items)
+            prev = node
+            node = node.next
 
-class PointerBinaryTree:
-    """
-    Binary tree (pointer) - A structure in which data is arranged in a tree-like structure
-               consiting of a root node, branch nodes and leaf nodes. Each node can have
-               a maximum of two child nodes. Nodes are implemented using pointers.  
-    """
+        val: any = node.items.pop(index)
+        self.length -= 1
 
-    def __init__(self) -> None:
-        self.root: TreeNode = None
+        if not node.items:
+            self.__unlink(prev, node)
+        elif node.next and len(node.items) + len(node.next.items) <= self.blockSize // 2:
+            # Merge with the next block to keep blocks at least half full
+            node.items.extend(node.next.items)
+            self.__unlink(node, node.next)
+        return val
 
-    def insert(self, val: any) -> None:
+    def get(self, index: int) -> any:
         """
-        Adds a new node to the tree in the next non-complete layer from left to right     
+        Returns the element at a given index, skipping a whole block per step
+
+        :raises IndexError: If specified index is out of the linked list bounds
         """
-        if self.__isEmpty():
-            self.root = TreeNode(val)   
-            return 
 
-        q = Deque()
-        q.append(self.root)
+        if index < 0 or index > self.length - 1:
+            raise IndexError("Index is out of bounds")
 
-        while q:
-            curr = q.popLeft()
-            if curr.left:
-                q.append(curr.left)
-            else:
-                curr.left = TreeNode(val)
-                return
-            
-            if curr.right:
-                q.append(curr.right)
-            else:
-                curr.right = TreeNode(val)
-                return 
+        node, offset = self.__locate(index)
+        return node.items[offset]
 
-    def remove(self, val: any) -> None:
+    def reverse(self) -> None:
         """
-        Removes a specified element from the tree and replaces it with bottom right-most node   
+        Reverses contents linked list 
+
+        :raises Exception: If the linked list is empty
         """
 
-        self.root = self.__remove(self.root, val)
-    
-    def __remove(self, root: TreeNode, val: any) -> TreeNode:
         if self.__isEmpty():
-            raise Exception("Cannot remove from empty tree")
+            raise Exception("Cannot reverse empty linked list.")
 
-        if not root.left and not root.right:
-            if root.val == val:
-                return None
-            else:
-                return root
-
-        q = [root]
-        curr = None
-        targetNode = None
-        # BFS to find deepest node & target node
-        while q:
-            curr = q.pop(0)
-            if curr.val == val:
-                targetNode = curr
-            if curr.left:
-                q.append(curr.left)
-            if curr.right:
-                q.append(curr.right)
-
-        if targetNode:
-            temp = curr.val
-            targetNode.val = temp
-            self.__remDeepest(root, curr)
-
-        return root 
-    
-    def pop(self) -> any:
-        """
-        Removes and returns the deepest node in binary tree 
-        """ 
+        curr: UnrolledNode = self.head
+        prev = None
+        self.tail = self.head
+        while curr:
+            curr.items.reverse()
+            next = curr.next
+            curr.next = prev
+            prev = curr
+            curr = next
+        self.head = prev
 
-        q: Queue = Queue()
-        out: list = []
+    def find(self, target: any) -> int:
+        """
+        Checks to see if some element is in the linked list & returns position
+        """
 
-        if self.root:
-            q.enqueue(self.root)
+        position: int = 0
+        curr: UnrolledNode = self.head
+        while curr:
+            if target in curr.items:
+                return position + curr.items.index(target)
+            position += len(curr.items)
+            curr = curr.next
+        return -1
 
-        while q.length > 0:
-            for i in range(q.length):
-                curr = q.dequeue()
-                out.append(curr)
-                if curr.left:
-                    q.enqueue(curr.left)
-                if curr.right:
-                    q.enqueue(curr.right)
-        
-        val: any = out[-1].val
-        self.remove(out[-1].val)
-        return val
-        
-    def preOrder(self) -> None:
+    def dump(self, fileobj: any) -> None:
         """
-        Prints nodes in pre-order (root, left, right)  
+        Writes the list to a binary file object as a flat array of its values
         """
 
-        self._preOrder(self.root) 
-        
-    def _preOrder(self, root) -> None:
-        if not root:
-            return
+        _dump(fileobj, self, [self.blockSize], list(self))
 
-        print(root.val, end="")
-        self._preOrder(root.left)
-        self._preOrder(root.right)
+    @classmethod
+    def load(cls, fileobj: any) -> 'UnrolledLL':
+        """
+        Reads a list written by dump from a binary file object
 
+        :raises ValueError: If the file does not hold a dump of this class
+        """
 
-    def inOrder(self) -> None:
+        (blockSize,), values = _load(fileobj, cls)
+        linked: UnrolledLL = cls(blockSize)
+        for val in values:
+            linked.insertTail(val)
+        return linked
+
+    def print(self) -> None:
         """
-        Prints nodes in-order (left, root, right) 
+        Prints contents of the linked list 
         """
 
-        self._inOrder(self.root)
-    
-    def _inOrder(self, root) -> None:
-        if not root:
-            return
+        curr: UnrolledNode = self.head
+        while curr != None:
+            for val in curr.items:
+                print(f"{val}->",end="")
+            curr = curr.next
+        print()
 
-        self._inOrder(root.left)
-        print(root.val, end="")
-        self._inOrder(root.right)
+    def __locate(self, index: int) -> tuple:
+        """ Returns the block containing a given index & the offset of the index within that block """
+
+        node: UnrolledNode = self.head
+        while index >= len(node.items):
+            index -= len(node.items)
+            node = node.next
+        return node, index
+
+    def __split(self, node: UnrolledNode) -> None:
+        mid: int = len(node.items) // 2
+        new_node: UnrolledNode = UnrolledNode(node.items[mid:])
+        del node.items[mid:]
+        new_node.next = node.next
+        node.next = new_node
+        if node is self.tail:
+            self.tail = new_node
 
+    def __unlink(self, prev: UnrolledNode | None, node: UnrolledNode) -> None:
+        if prev is None:
+            self.head = node.next
+        else:
+            prev.next = node.next
+        if node is self.tail:
+            self.tail = prev
 
-    def postOrder(self) -> list:
+    def __isEmpty(self) -> bool:
+        return self.length == 0
+
+
+class SkipNode:
+    """
+    Helper class for IndexableSkipList
+    """
+    def __init__(self, val: any, height: int) -> None:
+        self.val: any = val
+        self.next: list = [None] * height
+        # Number of positions moved forward by following next at each level
+        self.width: list = [1] * height
+
+
+class IndexableSkipList:
+    """
+    Indexable skip list - A linked list with extra levels of express pointers that skip over 
+                       many nodes at once. Each pointer records how many positions it skips 
+                       so the list can be navigated by index in O(log n) expected time.
+                       Shares the interface of SinglyLL.
+
+    Attributes:
+    -----------
+    head: SkipNode
+        Sentinel node before the first element
+    length: int
+        The current length of the linked list
+    level: int
+        The number of levels currently in use
+
+    Methods:
+    --------
+    insertHead(val)
+        Inserts an element at the front (head) of the linked list 
+    insertTail(val)
+        Inserts an element at the end (tail) of the linked list 
+    insertAt(val, index)
+        Inserts an element at a given index
+    removeHead()
+        Removes & returns the first (head) element of the linked list
+    removeTail()
+        Removes & returns the last (tail) element of the linked list
+    removeAt(index)
+        Removes & returns the element at a specified index 
+    get(index)
+        Returns the element at a given index
+    reverse()
+        Reverses contents linked list 
+    find(target)
+        Checks to see if some element is in the linked list & returns position
+    print()
+        Prints contents of the linked list 
+    dump(fileobj) / load(fileobj)
+        Writes to or reads from a binary file object
+    """
+
+    MAX_LEVEL: int = 32
+
+    def __init__(self) -> None:
+        self.head: SkipNode = SkipNode(None, self.MAX_LEVEL)
+        self.length: int = 0
+        self.level: int = 1
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __iter__(self) -> Iterator:
+        curr: SkipNode = self.head.next[0]
+        while curr:
+            yield curr.val
+            curr = curr.next[0]
+
+    def __contains__(self, val: any) -> bool:
+        return self.find(val) != -1
+
+    def __getitem__(self, index: int) -> any:
+        return self.get(_checkIndex(index, self.length))
+
+    def insertHead(self, val: any) -> None:
         """
-        Prints nodes in post-order (left, right, root) 
+        Inserts an element at the front (head) of the linked list 
         """
 
-        self._postOrder(self.root)
-    
-    def _postOrder(self, root) -> None:
-        if not root:
-            return 
+        self.insertAt(val, 0)
 
-        self._postOrder(root.left)
-        self._postOrder(root.right)
-        print(root.val, end="")
-    
-    def levelOrder(self) -> list:
-        """ 
-        Returns a list of nodes in a level order fashion computing left to right 
+    def insertTail(self, val: any) -> None:
+        """
+        Inserts an element at the end (tail) of the linked list 
         """
 
-        return self.__levelOrder(self.root)
-    
-    def __levelOrder(self, root) -> list:        
-        q = Queue()
-        out = []
+        self.insertAt(val, self.length)
 
-        if root:
-            q.enqueue(root)
+    def insertAt(self, val: any, index: int) -> None:
+        """
+        Inserts an element at a given index 
 
-        while q.length > 0:
-            for i in range(q.length):
-                curr = q.dequeue()
-                out.append(curr.val)
-                if curr.left:
-                    q.enqueue(curr.left)
-                if curr.right:
-                    q.enqueue(curr.right)
-        
-        return out
+        :raises IndexError: If the specified index is outside the bounds of the linked list 
+        """
 
-    def maxHeight(self) -> int:
-        return self.__getHeight(self.root)
+        if index < 0 or index > self.length:
+            raise IndexError("Index out of bounds")
 
-    def maxDepth(self) -> int:
-        pass
+        height: int = self.__randomHeight()
+        if height > self.level:
+            self.level = height
+
+        # The head is at position 0 so the new node will be at position index+1
+        update, positions = self.__predecessors(index)
+        new_node: SkipNode = SkipNode(val, height)
+        for l in range(self.level):
+            prev: SkipNode = update[l]
+            if l < height:
+                new_node.next[l] = prev.next[l]
+                if prev.next[l]:
+                    new_node.width[l] = positions[l] + prev.width[l] - index
+                prev.next[l] = new_node
+                prev.width[l] = index + 1 - positions[l]
+            elif prev.next[l]:
+                prev.width[l] += 1
+        self.length += 1
 
-    def enumerate(self) -> None:
-        pass
+    def removeHead(self) -> any:
+        """
+        Removes & returns the first (head) element of the linked list
+
+        :raises Exception: If the linked list is empty 
+        """
+
+        if self.__isEmpty():
+            raise Exception("Cannot remove from empty linked list")
+        return self.removeAt(0)
+
+    def removeTail(self) -> any:
+        """
+        Removes & returns the last (tail) element of the linked list
+
+        :raises Exception: If the linked list is empty 
+        """
+
+        if self.__isEmpty():
+            raise Exception("Cannot remove from empty linked list")
+        return self.removeAt(self.length - 1)
+
+    def removeAt(self, index: int) -> any:
+        """
+        Removes & returns the element at a specified index 
+
+        :raises IndexError: If specified index is out of the linked list bounds
+        """
+
+        if index < 0 or index > self.length - 1:
+            raise IndexError("Index is out of bounds")
+
+        update, _ = self.__predecessors(index)
+        node: SkipNode = update[0].next[0]
+        for l in range(self.level):
+            prev: SkipNode = update[l]
+            if prev.next[l] is node:
+                prev.next[l] = node.next[l]
+                prev.width[l] += node.width[l] - 1
+            elif prev.next[l]:
+                prev.width[l] -= 1
+
+        while self.level > 1 and self.head.next[self.level - 1] is None:
+            self.level -= 1
+        self.length -= 1
+        return node.val
+
+    def get(self, index: int) -> any:
+        """
+        Returns the element at a given index in O(log n)
+
+        :raises IndexError: If specified index is out of the linked list bounds
+        """
+
+        if index < 0 or index > self.length - 1:
+            raise IndexError("Index is out of bounds")
+
+        node: SkipNode = self.head
+        pos: int = 0
+        for l in range(self.level - 1, -1, -1):
+            while node.next[l] and pos + node.width[l] <= index + 1:
+                pos += node.width[l]
+                node = node.next[l]
+        return node.val
+
+    def reverse(self) -> None:
+        """
+        Reverses contents linked list 
+
+        :raises Exception: If the linked list is empty
+        """
+
+        if self.__isEmpty():
+            raise Exception("Cannot reverse empty linked list.")
+
+        self.__build(reversed(self.__values()))
+
+    def find(self, target: any) -> int:
+        """
+        Checks to see if some element is in the linked list & returns position
+        """
+
+        position: int = 0
+        curr: SkipNode = self.head.next[0]
+        while curr:
+            if curr.val == target:
+                return position
+            curr = curr.next[0]
+            position += 1
+        return -1
+
+    def dump(self, fileobj: any) -> None:
+        """
+        Writes the list to a binary file object as a flat array of its values
+        """
+
+        _dump(fileobj, self, list(self))
+
+    @classmethod
+    def load(cls, fileobj: any) -> 'IndexableSkipList':
+        """
+        Reads a list written by dump from a binary file object
+
+        :raises ValueError: If the file does not hold a dump of this class
+        """
+
+        values, = _load(fileobj, cls)
+        linked: IndexableSkipList = cls()
+        linked.__build(values)
+        return linked
 
-    
     def print(self) -> None:
+        """
+        Prints contents of the linked list 
+        """
+
+        for val in self.__values():
+            print(f"{val}->",end="")
+        print()
+
+    def __predecessors(self, index: int) -> tuple:
+        """ Returns the last node before position index+1 at each level & the positions of those nodes """
+
+        update: list = [self.head] * self.MAX_LEVEL
+        positions: list = [0] * self.MAX_LEVEL
+        node: SkipNode = self.head
+        pos: int = 0
+        for l in range(self.level - 1, -1, -1):
+            while node.next[l] and pos + node.width[l] <= index:
+                pos += node.width[l]
+                node = node.next[l]
+            update[l] = node
+            positions[l] = pos
+        return update, positions
+
+    def __build(self, values: Iterable) -> None:
+        """ Replaces the contents with values in O(n), linking each node after the last node of every level it reaches """
+
+        self.head = SkipNode(None, self.MAX_LEVEL)
+        self.level = 1
+        tails: list = [self.head] * self.MAX_LEVEL
+        positions: list = [0] * self.MAX_LEVEL
+        pos: int = 0
+        for pos, val in enumerate(values, 1):
+            height: int = self.__randomHeight()
+            node: SkipNode = SkipNode(val, height)
+            for l in range(height):
+                tails[l].next[l] = node
+                tails[l].width[l] = pos - positions[l]
+                tails[l] = node
+                positions[l] = pos
+            if height > self.level:
+                self.level = height
+        self.length = pos
+
+    def __values(self) -> list:
+        vals: list = []
+        curr: SkipNode = self.head.next[0]
+        while curr:
+            vals.append(curr.val)
+            curr = curr.next[0]
+        return vals
+
+    def __randomHeight(self) -> int:
+        height: int = 1
+        while height < self.MAX_LEVEL and random.random() < 0.5:
+            height += 1
+        return height
+
+    def __isEmpty(self) -> bool:
+        return self.length == 0
+
+
+class Queue(_Sequence):
+    """
+    Queue - A structure consiting of elements that can be of different types. 
+            Operates in the first-in-first-out (FIFO) principle 
+            meaning the first element added will be the first element removed
+    """
+    def __init__(self) -> None:
+        self.first: ListNode = None 
+        self.last: ListNode = None
+        self.length: int = 0
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __iter__(self) -> Iterator:
+        curr: ListNode = self.first
+        while curr:
+            yield curr.val
+            curr = curr.next
+
+    def enqueue(self, val: any) -> None:
+        """
+         Adds an item to the front of the queue 
+        """
+        new_node: ListNode = ListNode(val)
+        
         if self.__isEmpty():
-            print("Tree is empty")
-            return 
+            self.first = self.last = new_node
+        else:
+            self.last.next = new_node
+            self.last = self.last.next
+        self.length += 1
+
+    def dequeue(self) -> any:
+        """
+        Removes the first item from the queue 
+        """
+        if self.__isEmpty():
+            raise Exception("Cannot dequeue from empty queue")
         
-        height = self.__getHeight(self.root)
-        max_width = 2**height
-        level_nodes = [(self.root, max_width // 2)]
+        if self.length == 1:
+            val = self.first.val
+            self.first = self.last = None
+            self.length -= 1
+            return val
+        
+        val = self.first.val
+        self.first = self.first.next
+        self.length -= 1
+        return val
+    
+    def getfront(self) -> any:
+        """
+        Returns the first item in the queue
+        """
+        return self.first.val
 
-        for level in range(height):
-            new_level_nodes = []
-            line = [" "] * max_width
+    def getRear(self) -> any:
+        """
+        Returns the last item in the queue  
+        """
+        return self.last.val
 
-            for node, pos in level_nodes:
-                if node:
-                    line[pos] = str(node.val)
-                    new_level_nodes.append((node.left, pos-2**(height-level-2)))
-                    new_level_nodes.append((node.right, pos+2**(height-level-2)))
-            print("".join(line).rstrip())
+    def dump(self, fileobj: any) -> None:
+        """
+        Writes the queue to a binary file object as a flat array of its values from front to back
+        """
+
+        _dump(fileobj, self, list(self))
+
+    @classmethod
+    def load(cls, fileobj: any) -> 'Queue':
+        """
+        Reads a queue written by dump from a binary file object
+
+        :raises ValueError: If the file does not hold a dump of this class
+        """
+
+        values, = _load(fileobj, cls)
+        queue: Queue = cls()
+        for val in values:
+            queue.enqueue(val)
+        return queue
+
+    def print(self) -> None:
+        """
+        Prints the entire queue 
+        """
+        curr = self.first
+        while curr != None:
+            print(f"{curr.val}->",end="")
+            curr = curr.next
+        print()
+
+    def __isEmpty(self) -> int:
+        return self.length == 0
+
+
+class Deque(_Sequence):
+    """
+    Deque - Short for double ended queue it is a structure consiting of elements that cane be of different types.
+         It is similar to a queue in the fact it operates in the first-in-first-out (FIFO) principle but differs to a queue
+         as both ends can act as the first element in the queue i.e elements can be added and removed from the front and back    
+
+         Elements are stored contiguosly in a ring buffer whose capacity is a power of two, so the position of the 
+         i-th element is (head + i) & mask. When the buffer is full its capacity is doubled.
+
+    Attributes:
+    -----------
+    buffer: list
+        The underlying ring buffer that stores the elements
+    head: int
+        The index of the first element within the buffer
+    length: int
+        The number of elements currently in the deque
+
+    Methods:
+    --------
+    append(val)
+        Adds an element to the back of the deque
+    appendLeft(val)
+        Adds an element to the front of the deque
+    pop()
+        Removes & returns the element at the back of the deque
+    popLeft()
+        Removes & returns the element at the front of the deque
+    extend(iterable)
+        Adds the elements of an iterable to the back of the deque
+    extendLeft(iterable)
+        Adds the elements of an iterable to the front of the deque, reversing their order
+    rotate(n)
+        Rotates the deque n steps to the right, or to the left if n is negative
+    clear()
+        Removes all elements from the deque
+    print()
+        Prints contents of the deque
+    dump(fileobj) / load(fileobj)
+        Writes to or reads from a binary file object
+    """
+
+    def __init__(self, capacity: int = 8) -> None:
+        size: int = 8
+        while size < capacity:
+            size *= 2
+        self.buffer: list = [None] * size
+        self.head: int = 0
+        self.length: int = 0
+        self.__mask: int = size - 1
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __iter__(self) -> Iterator:
+        end: int = self.head + self.length
+        if end <= len(self.buffer):
+            return islice(self.buffer, self.head, end)
+        return chain(islice(self.buffer, self.head, None), islice(self.buffer, end & self.__mask))
+
+    def __getitem__(self, index: int | slice) -> any:
+        """
+        Returns the element at a given index, or a view of a slice of the deque holding only its indexes
+
+        :raises IndexError: If specified index is out of the deque bounds
+        """
+
+        if isinstance(index, slice):
+            return SliceView(self, range(self.length)[index])
+        return self.buffer[self.__position(index)]
+
+    def __setitem__(self, index: int, val: any) -> None:
+        self.buffer[self.__position(index)] = val
+
+    def append(self, val: any) -> None:
+        """
+        Adds an element to the back of the deque 
+        """
+
+        if self.length == len(self.buffer):
+            self.__resize(self.length + 1)
+        self.buffer[(self.head + self.length) & self.__mask] = val
+        self.length += 1
+
+    def appendLeft(self, val: any) -> None:
+        """
+        Adds an element to the front of the deque 
+        """
+
+        if self.length == len(self.buffer):
+            self.__resize(self.length + 1)
+        self.head = (self.head - 1) & self.__mask
+        self.buffer[self.head] = val
+        self.length += 1
+
+    def pop(self) -> any:
+        """
+        Removes & returns the element at the back of the deque
+
+        :raises Exception: If the deque is empty
+        """
+
+        if self.__isEmpty():
+            raise Exception("Cannot pop from empty deque")
+
+        index: int = (self.head + self.length - 1) & self.__mask
+        val: any = self.buffer[index]
+        self.buffer[index] = None
+        self.length -= 1
+        return val
+
+    def popLeft(self) -> any:
+        """
+        Removes & returns the element at the front of the deque
+
+        :raises Exception: If the deque is empty
+        """
+
+        if self.__isEmpty():
+            raise Exception("Cannot pop from empty deque")
+        
+        val: any = self.buffer[self.head]
+        self.buffer[self.head] = None
+        self.head = (self.head + 1) & self.__mask
+        self.length -= 1
+        return val
+
+    def extend(self, iterable: Iterable) -> None:
+        """
+        Adds the elements of an iterable to the back of the deque using at most two slice copies
+        """
+
+        items: list = list(iterable)
+        if self.length + len(items) > len(self.buffer):
+            self.__resize(self.length + len(items))
+
+        start: int = (self.head + self.length) & self.__mask
+        split: int = min(len(items), len(self.buffer) - start)
+        self.buffer[start:start + split] = items[:split]
+        self.buffer[:len(items) - split] = items[split:]
+        self.length += len(items)
+
+    def extendLeft(self, iterable: Iterable) -> None:
+        """
+        Adds the elements of an iterable to the front of the deque, reversing their order 
+        using at most two slice copies
+        """
+
+        items: list = list(iterable)
+        items.reverse()
+        if self.length + len(items) > len(self.buffer):
+            self.__resize(self.length + len(items))
+
+        start: int = (self.head - len(items)) & self.__mask
+        split: int = min(len(items), len(self.buffer) - start)
+        self.buffer[start:start + split] = items[:split]
+        self.buffer[:len(items) - split] = items[split:]
+        self.head = start
+        self.length += len(items)
+
+    def rotate(self, n: int = 1) -> None:
+        """
+        Rotates the deque n steps to the right, or to the left if n is negative.
+        Takes O(1) when the buffer is full, else O(min(n, length - n))
+        """
+
+        if self.length <= 1:
+            return
+        n %= self.length
+        if n > self.length // 2:
+            n -= self.length
+        
+        if self.length == len(self.buffer):
+            self.head = (self.head - n) & self.__mask
+            return
+
+        for _ in range(n):
+            self.appendLeft(self.pop())
+        for _ in range(-n):
+            self.append(self.popLeft())
+
+    def clear(self) -> None:
+        """
+        Removes all elements from the deque
+        """
+
+        self.buffer = [None] * len(self.buffer)
+        self.head = 0
+        self.length = 0
+
+    def dump(self, fileobj: any) -> None:
+        """
+        Writes the deque to a binary file object as a flat array of its values from front to back
+        """
+
+        _dump(fileobj, self, list(self))
+
+    @classmethod
+    def load(cls, fileobj: any) -> 'Deque':
+        """
+        Reads a deque written by dump from a binary file object
+
+        :raises ValueError: If the file does not hold a dump of this class
+        """
+
+        values, = _load(fileobj, cls)
+        deque: Deque = cls(len(values))
+        deque.extend(values)
+        return deque
+
+    def print(self) -> None:
+        """
+        Prints contents of the deque
+        """
+
+        for val in self.__ordered():
+            print(f"{val}<->",end="")
+        print()
+
+    def __position(self, index: int) -> int:
+        if index < 0:
+            index += self.length
+        if index < 0 or index >= self.length:
+            raise IndexError("Index out of bounds")
+        return (self.head + index) & self.__mask
+
+    def __ordered(self) -> list:
+        """ Returns the elements in order as a list """
+
+        end: int = self.head + self.length
+        if end <= len(self.buffer):
+            return self.buffer[self.head:end]
+        return self.buffer[self.head:] + self.buffer[:end & self.__mask]
+
+    def __resize(self, capacity: int) -> None:
+        size: int = len(self.buffer)
+        while size < capacity:
+            size *= 2
+
+        items: list = self.__ordered()
+        self.buffer = items + [None] * (size - len(items))
+        self.head = 0
+        self.__mask = size - 1
+
+    def __isEmpty(self) -> bool:
+        return self.length == 0
+
+
+class CircularQueue(Deque):
+    """
+    Circular queue - similar to a regular queue except the last element in the queue is connected to
+                  the first element, forming a circle. A circualr queue still operates in the first-in-first-out (FIFO)
+                  principle
+
+                  Stores elements of the same type in the ring buffer of a Deque, doubling its capacity when full.
+
+    Attributes:
+    -----------
+    type:
+        The specified data type of the elements that the queue will store
+
+    Methods:
+    --------
+    enqueue(val)
+        Adds an item to the back of the queue
+    dequeue()
+        Removes & returns the first item in the queue
+    getfront()
+        Returns the first item in the queue
+    getRear()
+        Returns the last item in the queue
+    dump(fileobj) / load(fileobj)
+        Writes to or reads from a binary file object
+    """
+    def __init__(self, size: int, type: any):
+        super().__init__(size)
+        self.type: any = type
+        
+    def enqueue(self, val: any) -> None:
+        """
+        Adds an item to the back of the queue 
+
+        :raises TypeError: If type of value does not match specified type of queue
+        """
+
+        if type(val) != self.type:
+            raise TypeError("Value data type does not match specified data type.")
+        self.append(val)
+
+    def dequeue(self) -> any:
+        """
+        Removes & returns the first item in the queue        
+
+        :raises Exception: If the queue is empty
+        """
+
+        if self.length == 0:
+            raise Exception("Cannot dequeue from empty queue")
+        return self.popLeft()
+    
+    def getfront(self) -> any:
+        """
+        Returns the first item in the queue       
+
+        :raises Exception: If the queue is empty
+        """
+
+        if self.length == 0:
+            raise Exception("Cannot get front of empty queue")
+        return self[0]
+
+    def getRear(self) -> any:
+        """
+        Returns the last item in the queue        
+
+        :raises Exception: If the queue is empty
+        """
+
+        if self.length == 0:
+            raise Exception("Cannot get rear of empty queue")
+        return self[-1]
+
+    def dump(self, fileobj: any) -> None:
+        """
+        Writes the queue to a binary file object as a flat array of its values from front to back
+        """
+
+        _dump(fileobj, self, [self.type], list(self))
+
+    @classmethod
+    def load(cls, fileobj: any) -> 'CircularQueue':
+        """
+        Reads a queue written by dump from a binary file object
+
+        :raises ValueError: If the file does not hold a dump of this class
+        """
+
+        (type,), values = _load(fileobj, cls)
+        queue: CircularQueue = cls(len(values), type)
+        queue.extend(values)
+        return queue
+
+
+class MonotonicQueue:
+    """
+    Monotonic queue - A queue over a sliding window of the most recent elements that answers the 
+                   minimum (or maximum) of the window in O(1). Elements that can never be the answer 
+                   again, because a newer element is at least as good, are discarded as soon as they 
+                   are outdone, so the underlying Deque stays sorted & each push is amortized O(1).
+
+    Attributes:
+    -----------
+    queue: Deque
+        The underlying deque of (position, value) pairs in increasing (or decreasing) order of value
+    size: int
+        The number of most recent elements in the window
+    maximum: bool
+        Whether the queue answers the maximum instead of the minimum
+    count: int
+        The total number of elements pushed
+
+    Methods:
+    --------
+    push(val)
+        Adds an element to the window, sliding out the oldest element once the window is full
+    pushMany(iterable)
+        Adds many elements & returns the result of the window after each one
+    get()
+        Returns the minimum (or maximum) of the window
+    """
+
+    def __init__(self, size: int, maximum: bool = False) -> None:
+        if size <= 0:
+            raise ValueError("Size of window must be positive")
+        self.queue: Deque = Deque()
+        self.size: int = size
+        self.maximum: bool = maximum
+        self.count: int = 0
+
+    def __len__(self) -> int:
+        return min(self.count, self.size)
+
+    def push(self, val: any) -> None:
+        """
+        Adds an element to the window, sliding out the oldest element once the window is full
+        """
+
+        queue: Deque = self.queue
+        if self.maximum:
+            while len(queue) > 0 and queue[-1][1] <= val:
+                queue.pop()
+        else:
+            while len(queue) > 0 and queue[-1][1] >= val:
+                queue.pop()
+        queue.append((self.count, val))
+        self.count += 1
+
+        if queue[0][0] <= self.count - 1 - self.size:
+            queue.popLeft()
+
+    def pushMany(self, iterable: Iterable) -> list:
+        """
+        Adds many elements & returns the minimum (or maximum) of the window after each one
+        """
+
+        out: list = []
+        for val in iterable:
+            self.push(val)
+            out.append(self.queue[0][1])
+        return out
+
+    def get(self) -> any:
+        """
+        Returns the minimum (or maximum) of the window
+
+        :raises Exception: If no elements have been pushed
+        """
+
+        if len(self.queue) == 0:
+            raise Exception("Cannot get from empty window")
+        return self.queue[0][1]
+
+
+class SlidingWindowAggregator:
+    """
+    Sliding window aggregator - Combines the most recent elements of a stream with any associative 
+                             operation (sum, min, gcd, matrix product...) in amortized O(1) per element. 
+                             Uses two stacks which each store elements alongside the running aggregate, 
+                             elements are pushed onto the back stack & evicted from the front stack, 
+                             which is refilled by reversing the back stack when it runs out.
+
+    Attributes:
+    -----------
+    size: int
+        The number of most recent elements in the window
+    op: Callable
+        An associative function of two arguments used to combine elements
+    length: int
+        The number of elements currently in the window
+
+    Methods:
+    --------
+    push(val)
+        Adds an element to the window, sliding out the oldest element once the window is full
+    pushMany(iterable)
+        Adds many elements & returns the aggregate of the window after each one
+    popLeft()
+        Removes & returns the oldest element of the window
+    get()
+        Returns the aggregate of the window, oldest to newest
+    """
+
+    def __init__(self, size: int, op: Callable) -> None:
+        if size <= 0:
+            raise ValueError("Size of window must be positive")
+        self.size: int = size
+        self.op: Callable = op
+        self.length: int = 0
+        # Both stacks hold (value, aggregate) pairs. On the front stack the aggregate covers the element 
+        # & everything newer on that stack, on the back stack the element & everything older on that stack
+        self.__front: Stack = Stack()
+        self.__back: Stack = Stack()
+
+    def __len__(self) -> int:
+        return self.length
+
+    def push(self, val: any) -> None:
+        """
+        Adds an element to the window, sliding out the oldest element once the window is full
+        """
+
+        back: Stack = self.__back
+        back.push((val, self.op(back[-1][1], val) if len(back) > 0 else val))
+        self.length += 1
+        if self.length > self.size:
+            self.popLeft()
+
+    def pushMany(self, iterable: Iterable) -> list:
+        """
+        Adds many elements & returns the aggregate of the window after each one
+        """
+
+        out: list = []
+        for val in iterable:
+            self.push(val)
+            out.append(self.get())
+        return out
+
+    def popLeft(self) -> any:
+        """
+        Removes & returns the oldest element of the window
+
+        :raises Exception: If the window is empty
+        """
+
+        if self.length == 0:
+            raise Exception("Cannot remove from empty window")
+
+        front: Stack = self.__front
+        if len(front) == 0:
+            back: Stack = self.__back
+            while len(back) > 0:
+                val: any = back.pop()[0]
+                front.push((val, self.op(val, front[-1][1]) if len(front) > 0 else val))
+        self.length -= 1
+        return front.pop()[0]
+
+    def get(self) -> any:
+        """
+        Returns the aggregate of the window, combining elements from oldest to newest
+
+        :raises Exception: If the window is empty
+        """
+
+        if self.length == 0:
+            raise Exception("Cannot get from empty window")
+
+        front: Stack = self.__front
+        back: Stack = self.__back
+        if len(front) == 0:
+            return back[-1][1]
+        if len(back) == 0:
+            return front[-1][1]
+        return self.op(front[-1][1], back[-1][1])
+
+
+class PriorityQueue:
+    """
+    Priority queue - A subset of the queue data structure that arranges elements based on their priority value.
+                  Elements with a higher priority are retrieved and removed first, where the smallest 
+                  priority value is the highest priority. Elements with equal priority are removed in the 
+                  order they were added (FIFO).
+
+                  By default elements are kept in a binary heap. If the number of priority levels is given 
+                  then priorities must be integers in range(levels) and elements are kept in one queue per level 
+                  instead, so pushes are O(1) and pops are O(1) amortized.
+
+    Attributes:
+    -----------
+    levels: int | None
+        The number of priority levels when bucketed, None when heap backed
+    length: int
+        The number of elements currently in the queue
+
+    Methods:
+    --------
+    push(val, priority)
+        Adds a value to the queue & returns its entry
+    pushMany(items)
+        Adds many (value, priority) pairs to the queue
+    pop()
+        Removes & returns the value with the highest priority
+    popMany(n)
+        Removes & returns up to n values in priority order
+    peek()
+        Returns the value with the highest priority without removing it
+    updatePriority(entry, priority)
+        Changes the priority of a queued value & returns its new entry
+    remove(entry)
+        Removes a queued value
+    print()
+        Prints the queued (value, priority) pairs in no particular order
+    dump(fileobj) / load(fileobj)
+        Writes to or reads from a binary file object
+    """
+
+    def __init__(self, levels: int | None = None) -> None:
+        self.levels: int | None = levels
+        self.length: int = 0
+        self.__count: int = 0
+
+        if levels is None:
+            self.__heap: MinHeap = MinHeap()
+        else:
+            if levels <= 0:
+                raise ValueError("Number of priority levels must be positive")
+            self.__buckets: list[Queue] = [Queue() for _ in range(levels)]
+            self.__minLevel: int = levels
+
+    def __len__(self) -> int:
+        return self.length
+
+    def push(self, val: any, priority: any) -> list:
+        """
+        Adds a value to the queue & returns its entry, which can be passed to updatePriority or remove
+
+        :raises ValueError: If the queue is bucketed and the priority is not a valid level
+        """
+
+        entry: list = self.__entry(val, priority)
+        if self.levels is None:
+            self.__heap.insert(entry)
+        else:
+            self.__buckets[priority].enqueue(entry)
+            if priority < self.__minLevel:
+                self.__minLevel = priority
+        self.length += 1
+        return entry
+
+    def pushMany(self, items: Iterable) -> list:
+        """
+        Adds many (value, priority) pairs to the queue & returns their entries. 
+        When heap backed the heap is rebuilt in a single O(n) pass instead of n insertions
+
+        :raises ValueError: If the queue is bucketed and a priority is not a valid level
+        """
+
+        if self.levels is not None:
+            return [self.push(val, priority) for val, priority in items]
+
+        entries: list = [self.__entry(val, priority) for val, priority in items]
+        self.__heap.merge(entries)
+        self.length += len(entries)
+        return entries
+
+    def pop(self) -> any:
+        """
+        Removes & returns the value with the highest priority 
+
+        :raises Exception: If the queue is empty
+        """
+
+        if self.__isEmpty():
+            raise Exception("Cannot pop from empty priority queue")
+
+        entry: list = self.__front()
+        if self.levels is None:
+            self.__heap.delete()
+        else:
+            self.__buckets[entry[0]].dequeue()
+        self.length -= 1
+        return entry[2]
+
+    def popMany(self, n: int) -> list:
+        """
+        Removes & returns up to n values in priority order
+        """
+
+        out: list = []
+        while len(out) < n and not self.__isEmpty():
+            out.append(self.pop())
+        return out
+
+    def peek(self) -> any:
+        """
+        Returns the value with the highest priority without removing it
+
+        :raises Exception: If the queue is empty
+        """
+
+        if self.__isEmpty():
+            raise Exception("Cannot peek empty priority queue")
+        return self.__front()[2]
+
+    def updatePriority(self, entry: list, priority: any) -> list:
+        """
+        Changes the priority of a queued value & returns its new entry. 
+        The old entry is lazily deleted and the value is queued behind others of the same priority
+
+        :raises Exception: If the entry has already been removed from the queue
+        """
+
+        val: any = entry[2]
+        self.remove(entry)
+        return self.push(val, priority)
+
+    def remove(self, entry: list) -> None:
+        """
+        Removes a queued value in O(1). The entry is only marked as removed & is discarded 
+        once it reaches the front of the queue
+
+        :raises Exception: If the entry has already been removed from the queue
+        """
+
+        if entry[2] is _REMOVED:
+            raise Exception("Entry has already been removed from the priority queue")
+        entry[2] = _REMOVED
+        self.length -= 1
+
+    def print(self) -> None:
+        """
+        Prints the queued (value, priority) pairs in no particular order
+        """
+
+        print([(entry[2], entry[0]) for entry in self.__entries()])
+
+    def dump(self, fileobj: any) -> None:
+        """
+        Writes the queue to a binary file object as the number of levels followed by flat arrays of 
+        the priorities & values in the order they were added, so equal priorities keep their order
+        """
+
+        entries: list = sorted(self.__entries(), key=operator.itemgetter(1))
+        _dump(fileobj, self, [self.levels], [entry[0] for entry in entries], [entry[2] for entry in entries])
+
+    @classmethod
+    def load(cls, fileobj: any) -> 'PriorityQueue':
+        """
+        Reads a queue written by dump from a binary file object
+
+        :raises ValueError: If the file does not hold a dump of this class
+        """
+
+        (levels,), priorities, values = _load(fileobj, cls)
+        queue: PriorityQueue = cls(levels)
+        queue.pushMany(zip(values, priorities))
+        return queue
+
+    def __entry(self, val: any, priority: any) -> list:
+        if self.levels is not None and (type(priority) != int or priority < 0 or priority >= self.levels):
+            raise ValueError("Priority must be an integer between 0 and levels-1")
+
+        # The insertion count breaks ties between equal priorities so values are never compared 
+        entry: list = [priority, self.__count, val]
+        self.__count += 1
+        return entry
+
+    def __entries(self) -> list:
+        """ Returns the live entries in no particular order """
+
+        if self.levels is None:
+            entries: list = self.__heap.heap
+        else:
+            entries = []
+            for bucket in self.__buckets:
+                curr: ListNode = bucket.first
+                while curr:
+                    entries.append(curr.val)
+                    curr = curr.next
+        return [entry for entry in entries if entry[2] is not _REMOVED]
+
+    def __front(self) -> list:
+        """ Discards removed entries at the front of the queue & returns the first live entry """
+
+        if self.levels is None:
+            heap: MinHeap = self.__heap
+            while heap.heap[0][2] is _REMOVED:
+                heap.delete()
+            return heap.heap[0]
+
+        while True:
+            bucket: Queue = self.__buckets[self.__minLevel]
+            while bucket.length > 0 and bucket.getfront()[2] is _REMOVED:
+                bucket.dequeue()
+            if bucket.length > 0:
+                return bucket.getfront()
+            self.__minLevel += 1
+
+    def __isEmpty(self) -> bool:
+        return self.length == 0
+
+
+class CircularBuffer(_Sequence):
+    """
+    Circular buffer - A structure consisting of elements of the same type, identifiable by an index,
+                   stored contigously in memory. It's size is not changeable & once the buffer is full
+                   the oldest data is overwrited starting from the beginning.
+
+                   Numeric types are stored in a typed array.array & bytes in a bytearray, 
+                   other types in a list. Bulk writes & reads move contiguous spans of the buffer 
+                   with at most two slice copies.
+
+    Attributes:
+    -----------
+    buffer: array.array | bytearray | list
+        The underlying storage of the buffer
+    type:
+        The specified data type of the elements, either a python type or an array.array typecode
+    size: int
+        The maximum capacity of the buffer
+    first: int
+        The index of the oldest element within the buffer
+    length: int
+        The number of elements currently in the buffer
+    overwrite: bool
+        Whether writing to a full buffer overwrites the oldest data, else raises MemoryError
+
+    Methods:
+    --------
+    insert(val)
+        Adds an element to the buffer
+    remove()
+        Removes & returns the oldest element
+    write(iterable)
+        Adds many elements to the buffer
+    read(n)
+        Removes & returns up to n of the oldest elements
+    peek(n)
+        Returns up to n of the oldest elements without removing them
+    getFirst()
+        Returns the oldest element
+    getLast()
+        Returns the newest element
+    clear()
+        Removes all elements from the buffer
+    print()
+        Prints contents of the buffer from oldest to newest
+    dump(fileobj) / load(fileobj)
+        Writes to or reads from a binary file object
+    """
+    def __init__(self, size: int, type: any, overwrite: bool = True) -> None:
+        if size <= 0:
+            raise ValueError("Size of buffer must be positive")
+        self.type = type
+        self.size: int = size
+        self.first: int = 0
+        self.length: int = 0
+        self.overwrite: bool = overwrite
+        self.buffer: array.array | bytearray | list = self.__allocate(size)
+        self.__element: any = _elementType(type)
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __iter__(self) -> Iterator:
+        end: int = self.first + self.length
+        if end <= self.size:
+            return islice(self.buffer, self.first, end)
+        return chain(islice(self.buffer, self.first, None), islice(self.buffer, end - self.size))
+
+    def __getitem__(self, index: int | slice) -> any:
+        """
+        Returns the element at a given position from the oldest element, 
+        or a view of a slice of the buffer holding only its indexes
+
+        :raises IndexError: If specified index is out of the buffer bounds
+        """
+
+        if isinstance(index, slice):
+            return SliceView(self, range(self.length)[index])
+        index = _checkIndex(index, self.length)
+        return self.buffer[(self.first + index) % self.size]
+
+    def insert(self, val) -> None:
+        """
+        Adds an element to the buffer, overwriting the oldest element if the buffer is full
+
+        :raises TypeError: If type of value does not match specified type of buffer
+        :raises MemoryError: If the buffer is full & overwrite is disabled
+        """
+
+        val = self._check(val)
+        if self.__isFull():
+            if not self.overwrite:
+                raise MemoryError("Buffer is full.")
+            self.buffer[self.first] = val
+            self.first = (self.first + 1) % self.size
+            return
+
+        self.buffer[(self.first + self.length) % self.size] = val
+        self.length += 1
+
+    def remove(self):
+        """
+        Removes & returns the oldest element, None if the buffer is empty
+        """
+
+        if self.__isEmpty():
+            return None
+        
+        val = self.buffer[self.first]
+        if type(self.buffer) == list:
+            self.buffer[self.first] = None
+        self.first = (self.first + 1) % self.size
+        self.length -= 1
+        return val
+
+    def write(self, iterable: Iterable) -> None:
+        """
+        Adds many elements to the buffer using at most two slice copies. 
+        If the buffer overflows the oldest elements are overwritten
+
+        :raises TypeError: If type of a value does not match specified type of buffer
+        :raises MemoryError: If the elements do not fit & overwrite is disabled, nothing is written
+        """
+
+        items: array.array | bytearray | list = self._convert(iterable)
+        n: int = len(items)
+        if self.length + n > self.size and not self.overwrite:
+            raise MemoryError("Buffer is full.")
+
+        if n >= self.size:
+            # Only the newest elements survive so the buffer is replaced outright
+            self.buffer[:] = items[n - self.size:]
+            self.first = 0
+            self.length = self.size
+            return
+
+        start: int = (self.first + self.length) % self.size
+        split: int = min(n, self.size - start)
+        self.buffer[start:start + split] = items[:split]
+        self.buffer[:n - split] = items[split:]
+
+        self.length += n
+        if self.length > self.size:
+            self.first = (self.first + self.length - self.size) % self.size
+            self.length = self.size
+
+    def read(self, n: int) -> array.array | bytearray | list:
+        """
+        Removes & returns up to n of the oldest elements, oldest first, in the buffer's storage type
+        """
+
+        out: array.array | bytearray | list = self.peek(n)
+        if type(self.buffer) == list:
+            self.__clearSpan(len(out))
+        self.first = (self.first + len(out)) % self.size
+        self.length -= len(out)
+        return out
+
+    def peek(self, n: int) -> array.array | bytearray | list:
+        """
+        Returns up to n of the oldest elements without removing them, oldest first, in the buffer's storage type
+        """
+
+        n = max(0, min(n, self.length))
+        end: int = self.first + n
+        if end <= self.size:
+            return self.buffer[self.first:end]
+        return self.buffer[self.first:] + self.buffer[:end - self.size]
+
+    def getFirst(self) -> any:
+        """
+        Returns the oldest element, None if the buffer is empty
+        """
+
+        if self.__isEmpty():
+            return None
+        return self.buffer[self.first]
+
+    def getLast(self) -> any:
+        """
+        Returns the newest element, None if the buffer is empty
+        """
+
+        if self.__isEmpty():
+            return None
+        last = (self.first + self.length-1) % self.size
+        return self.buffer[last]
+
+    def clear(self) -> None:
+        """
+        Removes all elements from the buffer
+        """
+
+        self.buffer = self.__allocate(self.size)
+        self.first = 0
+        self.length = 0
+
+    def dump(self, fileobj: any) -> None:
+        """
+        Writes the buffer to a binary file object from oldest to newest, a typed buffer as a raw buffer
+        """
+
+        end: int = self.first + self.length
+        values: any = self.buffer[self.first:end] + self.buffer[:max(0, end - self.size)]
+        _dump(fileobj, self, [self.size], [self.type], [self.overwrite], memoryview(values) if type(values) == bytearray else values)
+
+    @classmethod
+    def load(cls, fileobj: any) -> 'CircularBuffer':
+        """
+        Reads a buffer written by dump from a binary file object
+
+        :raises ValueError: If the file does not hold a dump of this class
+        """
+
+        (size,), (type,), (overwrite,), values = _load(fileobj, cls)
+        buffer: CircularBuffer = cls(size, type, overwrite)
+        buffer.write(values)
+        return buffer
+
+    def print(self):
+        """
+        Prints contents of the buffer from oldest to newest
+        """
+
+        print(list(self))
+
+    def __allocate(self, size: int) -> array.array | bytearray | list:
+        if self.type in (bytes, bytearray):
+            return bytearray(size)
+        typecode: str | None = _typecode(self.type)
+        if typecode is not None:
+            return array.array(typecode, bytes(size * array.array(typecode).itemsize))
+        return [None] * size
+
+    def _check(self, val: any) -> any:
+        """ 
+        Checks a value matches the buffer's type & returns it as stored, a one byte bytes value as its int
+
+        :raises TypeError: If type of value does not match specified type of buffer
+        """
+
+        if type(self.buffer) == bytearray:
+            if type(val) not in (bytes, bytearray) or len(val) != 1:
+                raise TypeError("Value must be a single byte.")
+            return val[0]
+        if type(val) != self.__element:
+            raise TypeError("Value data type does not match specified data type.")
+        return val
+
+    def _convert(self, iterable: Iterable) -> array.array | bytearray | list:
+        """ 
+        Converts values to the buffer's storage type so they can be slice assigned. 
+        Bytes like objects & arrays of the buffer's typecode are taken as already checked
+        """
+
+        if type(self.buffer) == bytearray:
+            if isinstance(iterable, (bytes, bytearray, memoryview)):
+                return bytearray(iterable)
+            return bytearray(map(self._check, iterable))
+        if type(self.buffer) == array.array:
+            if type(iterable) == array.array and iterable.typecode == self.buffer.typecode:
+                return iterable
+            return array.array(self.buffer.typecode, map(self._check, iterable))
+        return list(map(self._check, iterable))
+
+    def __clearSpan(self, n: int) -> None:
+        """ Releases references held by the n oldest slots of a list backed buffer """
+
+        end: int = self.first + n
+        if end <= self.size:
+            self.buffer[self.first:end] = [None] * n
+        else:
+            self.buffer[self.first:] = [None] * (self.size - self.first)
+            self.buffer[:end - self.size] = [None] * (end - self.size)
+
+    def __isFull(self) -> bool:
+        return self.length == self.size
+
+    def __isEmpty(self) -> bool:
+        return self.length == 0
+
+
+class BlockingQueue:
+    """
+    Blocking queue - A thread safe first-in-first-out (FIFO) queue with an optional bounded capacity.
+                  Producers block while the queue is full & consumers block while it is empty, 
+                  waiting on condition variables rather than polling. Batch operations move many 
+                  elements per lock acquisition.
+
+    Attributes:
+    -----------
+    queue: Deque
+        The underlying ring buffer that stores the elements
+    capacity: int | None
+        The maximum number of elements in the queue, None if unbounded
+
+    Methods:
+    --------
+    put(val, timeout)
+        Adds an element to the back of the queue, waiting for space if full
+    get(timeout)
+        Removes & returns the element at the front of the queue, waiting for one if empty
+    putMany(iterable, timeout)
+        Adds many elements to the queue, waiting for space as needed
+    getMany(maxN, timeout)
+        Waits for at least one element then removes & returns up to maxN elements
+    """
+
+    def __init__(self, capacity: int | None = None) -> None:
+        if capacity is not None and capacity <= 0:
+            raise ValueError("Capacity of queue must be positive")
+        self.queue: Deque = Deque(capacity or 8)
+        self.capacity: int | None = capacity
+        self.__lock: threading.Lock = threading.Lock()
+        self.__notEmpty: threading.Condition = threading.Condition(self.__lock)
+        self.__notFull: threading.Condition = threading.Condition(self.__lock)
+
+    def __len__(self) -> int:
+        return len(self.queue)
+
+    def put(self, val: any, timeout: float | None = None) -> None:
+        """
+        Adds an element to the back of the queue, waiting for space if the queue is full
+
+        :param float timeout: Maximum number of seconds to wait, waits forever if None
+
+        :raises TimeoutError: If no space became available within the timeout
+        """
+
+        with self.__notFull:
+            if not self.__notFull.wait_for(self.__hasSpace, timeout):
+                raise TimeoutError("Timed out waiting for space in queue")
+            self.queue.append(val)
+            self.__notEmpty.notify()
+
+    def get(self, timeout: float | None = None) -> any:
+        """
+        Removes & returns the element at the front of the queue, waiting for one if the queue is empty
+
+        :param float timeout: Maximum number of seconds to wait, waits forever if None
+
+        :raises TimeoutError: If no element became available within the timeout
+        """
+
+        with self.__notEmpty:
+            if not self.__notEmpty.wait_for(self.__hasItems, timeout):
+                raise TimeoutError("Timed out waiting for an element in queue")
+            val: any = self.queue.popLeft()
+            self.__notFull.notify()
+            return val
+
+    def putMany(self, iterable: Iterable, timeout: float | None = None) -> None:
+        """
+        Adds many elements to the queue, adding as many as fit each time space becomes available
+
+        :param float timeout: Maximum number of seconds to wait in total, waits forever if None
+
+        :raises TimeoutError: If not all elements were added within the timeout, the elements 
+                              added before the timeout remain in the queue
+        """
+
+        items: list = list(iterable)
+        deadline: float | None = None if timeout is None else time.monotonic() + timeout
+        i: int = 0
+        with self.__notFull:
+            while i < len(items):
+                remaining: float | None = None if deadline is None else deadline - time.monotonic()
+                if not self.__notFull.wait_for(self.__hasSpace, remaining):
+                    raise TimeoutError("Timed out waiting for space in queue")
+
+                n: int = len(items) - i
+                if self.capacity is not None:
+                    n = min(n, self.capacity - len(self.queue))
+                self.queue.extend(items[i:i + n])
+                i += n
+                self.__notEmpty.notify(n)
+
+    def getMany(self, maxN: int, timeout: float | None = None) -> list:
+        """
+        Waits for at least one element then removes & returns up to maxN elements without waiting further
+
+        :param float timeout: Maximum number of seconds to wait, waits forever if None
+
+        :raises TimeoutError: If no element became available within the timeout
+        """
+
+        with self.__notEmpty:
+            if not self.__notEmpty.wait_for(self.__hasItems, timeout):
+                raise TimeoutError("Timed out waiting for an element in queue")
+            n: int = min(maxN, len(self.queue))
+            out: list = [self.queue.popLeft() for _ in range(n)]
+            self.__notFull.notify(n)
+            return out
+
+    def __hasSpace(self) -> bool:
+        return self.capacity is None or len(self.queue) < self.capacity
+
+    def __hasItems(self) -> bool:
+        return len(self.queue) > 0
+
+
+class SPSCRing:
+    """
+    Single-producer single-consumer ring - A bounded queue for passing elements from exactly one 
+                  producer thread to exactly one consumer thread without locks. Elements are stored 
+                  in the typed storage of a CircularBuffer. The producer only ever advances the write 
+                  count & the consumer only ever advances the read count, so neither needs a lock.
+                  Relies on the global interpreter lock making each attribute update atomic.
+
+    Attributes:
+    -----------
+    ring: CircularBuffer
+        The buffer providing the underlying storage
+    size: int
+        The maximum capacity of the ring
+    writeCount: int
+        Total number of elements written by the producer 
+    readCount: int
+        Total number of elements read by the consumer
+
+    Methods:
+    --------
+    tryPut(val)
+        Adds an element if there is space, returns whether it was added 
+    put(val, timeout)
+        Adds an element, waiting for space if full
+    get(timeout)
+        Removes & returns the oldest element, waiting for one if empty
+    write(iterable)
+        Adds as many elements as fit, returns how many were added
+    read(n)
+        Removes & returns up to n of the oldest elements
+    """
+
+    def __init__(self, size: int, type: any) -> None:
+        self.ring: CircularBuffer = CircularBuffer(size, type, overwrite=False)
+        self.size: int = size
+        self.writeCount: int = 0
+        self.readCount: int = 0
+
+    def __len__(self) -> int:
+        return self.writeCount - self.readCount
+
+    def tryPut(self, val: any) -> bool:
+        """
+        Adds an element if there is space, returns whether it was added. Must only be called by the producer
+        """
+
+        w: int = self.writeCount
+        if w - self.readCount == self.size:
+            return False
+        self.ring.buffer[w % self.size] = self.ring._check(val)
+        # Publish the element only after it has been stored
+        self.writeCount = w + 1
+        return True
+
+    def put(self, val: any, timeout: float | None = None) -> None:
+        """
+        Adds an element, waiting for space if the ring is full. Must only be called by the producer
+
+        :raises TimeoutError: If no space became available within the timeout
+        """
+
+        deadline: float | None = None if timeout is None else time.monotonic() + timeout
+        delay: float = 0
+        while not self.tryPut(val):
+            delay = self.__backoff(delay, deadline)
+
+    def get(self, timeout: float | None = None) -> any:
+        """
+        Removes & returns the oldest element, waiting for one if the ring is empty. Must only be called by the consumer
+
+        :raises TimeoutError: If no element became available within the timeout
+        """
+
+        deadline: float | None = None if timeout is None else time.monotonic() + timeout
+        delay: float = 0
+        r: int = self.readCount
+        while self.writeCount == r:
+            delay = self.__backoff(delay, deadline)
+
+        val: any = self.ring.buffer[r % self.size]
+        self.readCount = r + 1
+        return val
+
+    def write(self, iterable: Iterable) -> int:
+        """
+        Adds as many elements as fit using at most two slice copies, returns how many were added. 
+        Elements of an iterator past those that fit are left unconsumed. Must only be called by the producer
+        """
+
+        w: int = self.writeCount
+        free: int = self.size - (w - self.readCount)
+        items: array.array | bytearray | list = self.ring._convert(iterable[:free] if isinstance(iterable, Sequence) else islice(iterable, free))
+        n: int = len(items)
+
+        start: int = w % self.size
+        split: int = min(n, self.size - start)
+        buffer = self.ring.buffer
+        buffer[start:start + split] = items[:split]
+        buffer[:n - split] = items[split:n]
+        self.writeCount = w + n
+        return n
+
+    def read(self, n: int) -> array.array | bytearray | list:
+        """
+        Removes & returns up to n of the oldest elements using at most two slice copies.
+        Must only be called by the consumer
+        """
+
+        r: int = self.readCount
+        n = max(0, min(n, self.writeCount - r))
+        start: int = r % self.size
+        end: int = start + n
+        buffer = self.ring.buffer
+        if end <= self.size:
+            out = buffer[start:end]
+        else:
+            out = buffer[start:] + buffer[:end - self.size]
+        self.readCount = r + n
+        return out
+
+    def __backoff(self, delay: float, deadline: float | None) -> float:
+        """ Sleeps for an exponentially increasing time up to 1ms, returns the next delay """
+
+        if deadline is not None and time.monotonic() >= deadline:
+            raise TimeoutError("Timed out waiting for ring")
+        time.sleep(delay)
+        return min(0.001, delay * 2 or 0.00001)
+
+
+class AsyncQueue:
+    """
+    Async queue - An asyncio adapter over a Deque for passing elements between coroutines. 
+               With a bounded capacity put waits while the queue is full, applying backpressure 
+               to producers, & get waits while it is empty. Cancelling a waiting put or get 
+               leaves the queue unchanged.
+
+    Attributes:
+    -----------
+    queue: Deque
+        The underlying structure that stores the elements
+    capacity: int | None
+        The maximum number of elements in the queue, None if unbounded
+
+    Methods:
+    --------
+    put(val)
+        Adds an element to the queue, waiting for space if full
+    get()
+        Removes & returns the next element, waiting for one if empty
+    getMany(maxN, timeout)
+        Waits for at least one element then removes & returns up to maxN elements
+    putNowait(val)
+        Adds an element without waiting
+    getNowait()
+        Removes & returns the next element without waiting
+    """
+
+    def __init__(self, capacity: int | None = None) -> None:
+        if capacity is not None and capacity <= 0:
+            raise ValueError("Capacity of queue must be positive")
+        self.queue: any = self._create()
+        self.capacity: int | None = capacity
+        # Futures of coroutines waiting for an element or for space, in the order they started waiting
+        self.__getters: Deque = Deque()
+        self.__putters: Deque = Deque()
+
+    def __len__(self) -> int:
+        return len(self.queue)
+
+    async def put(self, val: any) -> None:
+        """
+        Adds an element to the back of the queue, waiting for space if the queue is full
+        """
+
+        await self._put(val)
+
+    async def get(self) -> any:
+        """
+        Removes & returns the element at the front of the queue, waiting for one if the queue is empty
+        """
+
+        await self.__wait(self.__getters, self._hasItems)
+        # Nothing is awaited between removing the element & returning it so cancellation cannot lose it
+        val: any = self._pop()
+        self.__wakeNext(self.__putters)
+        return val
+
+    async def getMany(self, maxN: int, timeout: float | None = None) -> any:
+        """
+        Waits for at least one element then removes & returns up to maxN elements without waiting further
+
+        :param float timeout: Maximum number of seconds to wait, waits forever if None
+
+        :raises TimeoutError: If no element became available within the timeout
+        """
+
+        await asyncio.wait_for(self.__wait(self.__getters, self._hasItems), timeout)
+        out: any = self._popMany(maxN)
+        for _ in range(len(out)):
+            self.__wakeNext(self.__putters)
+        return out
+
+    def putNowait(self, val: any) -> None:
+        """
+        Adds an element to the back of the queue without waiting
+
+        :raises Exception: If the queue is full
+        """
+
+        self._putNowait(val)
+
+    def getNowait(self) -> any:
+        """
+        Removes & returns the element at the front of the queue without waiting
+
+        :raises Exception: If the queue is empty
+        """
+
+        if not self._hasItems():
+            raise Exception("Cannot get from empty queue")
+        val: any = self._pop()
+        self.__wakeNext(self.__putters)
+        return val
+
+    async def _put(self, *args: any) -> None:
+        await self.__wait(self.__putters, self._hasSpace)
+        self._push(*args)
+        self.__wakeNext(self.__getters)
+
+    def _putNowait(self, *args: any) -> None:
+        self._checkSpace()
+        self._push(*args)
+        self.__wakeNext(self.__getters)
+
+    def _checkSpace(self) -> None:
+        if not self._hasSpace():
+            raise Exception("Cannot put to full queue")
+
+    def _create(self) -> any:
+        return Deque()
+
+    def _push(self, val: any) -> None:
+        self.queue.append(val)
+
+    def _pop(self) -> any:
+        return self.queue.popLeft()
+
+    def _popMany(self, n: int) -> any:
+        return [self.queue.popLeft() for _ in range(min(n, len(self.queue)))]
+
+    def _hasSpace(self) -> bool:
+        return self.capacity is None or len(self.queue) < self.capacity
+
+    def _hasItems(self) -> bool:
+        return len(self.queue) > 0
+
+    async def __wait(self, waiters: Deque, ready: Callable) -> None:
+        """ Waits in turn until ready() is true """
+
+        while not ready():
+            waiter: asyncio.Future = asyncio.get_running_loop().create_future()
+            waiters.append(waiter)
+            try:
+                await waiter
+            except BaseException:
+                waiter.cancel()
+                # If this coroutine was woken but cancelled before it could act, pass the wake up on
+                if ready() and not waiter.cancelled():
+                    self.__wakeNext(waiters)
+                raise
+
+    def __wakeNext(self, waiters: Deque) -> None:
+        """ Wakes the longest waiting coroutine that has not been cancelled """
+
+        while len(waiters) > 0:
+            waiter: asyncio.Future = waiters.popLeft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+
+
+class AsyncPriorityQueue(AsyncQueue):
+    """
+    Async priority queue - An asyncio adapter over a PriorityQueue. get returns the element with 
+                        the highest priority, or the earliest added among equal priorities.
+                        Shares the interface of AsyncQueue.
+    """
+
+    def __init__(self, capacity: int | None = None, levels: int | None = None) -> None:
+        self.levels: int | None = levels
+        super().__init__(capacity)
+
+    async def put(self, val: any, priority: any) -> None:
+        """
+        Adds an element with a given priority, waiting for space if the queue is full
+        """
+
+        await self._put(val, priority)
+
+    def putNowait(self, val: any, priority: any) -> None:
+        """
+        Adds an element with a given priority without waiting
+
+        :raises Exception: If the queue is full
+        """
+
+        self._putNowait(val, priority)
+
+    def _create(self) -> PriorityQueue:
+        return PriorityQueue(self.levels)
+
+    def _push(self, val: any, priority: any) -> None:
+        self.queue.push(val, priority)
+
+    def _pop(self) -> any:
+        return self.queue.pop()
+
+    def _popMany(self, n: int) -> list:
+        return self.queue.popMany(n)
+
+
+class AsyncCircularBuffer(AsyncQueue):
+    """
+    Async circular buffer - An asyncio adapter over a CircularBuffer. If the buffer overwrites 
+                         its oldest data put never waits, otherwise put waits while the buffer is full.
+                         getMany returns elements in the buffer's storage type using a bulk read.
+                         Shares the interface of AsyncQueue.
+    """
+
+    def __init__(self, size: int, type: any, overwrite: bool = False) -> None:
+        self.size: int = size
+        self.type: any = type
+        self.overwrite: bool = overwrite
+        super().__init__(size)
+
+    def _create(self) -> CircularBuffer:
+        return CircularBuffer(self.size, self.type, self.overwrite)
+
+    def _push(self, val: any) -> None:
+        self.queue.insert(val)
+
+    def _pop(self) -> any:
+        return self.queue.remove()
+
+    def _popMany(self, n: int) -> array.array | bytearray | list:
+        return self.queue.read(n)
+
+    def _hasSpace(self) -> bool:
+        return self.overwrite or len(self.queue) < self.size
+
+
+class TreeNode:
+    """
+    Helper class for BinaryTree & Binary Search Tree classes  
+    """
+    def __init__(self, val: any) -> None:
+        self.val: any = val
+        self.left: TreeNode = None
+        self.right: TreeNode = None
+
+
+class PointerBinaryTree:
+    """
+    Binary tree (pointer) - A structure in which data is arranged in a tree-like structure
+               consiting of a root node, branch nodes and leaf nodes. Each node can have
+               a maximum of two child nodes. Nodes are implemented using pointers.  
+
+    Attributes:
+    -----------
+    root: TreeNode
+        The root node of the tree
+    nodes: list
+        Every node of the tree in level order. As the tree is always filled from left to right
+        the parent of the node at index i is at index (i-1) // 2, so the next free slot and the
+        deepest node are both found in O(1) without traversing the tree
+    """
+
+    def __init__(self) -> None:
+        self.root: TreeNode = None
+        self.nodes: list[TreeNode] = []
+
+    def insert(self, val: any) -> None:
+        """
+        Adds a new node to the tree in the next non-complete layer from left to right     
+        """
+
+        new_node: TreeNode = TreeNode(val)
+        index: int = len(self.nodes)
+        self.nodes.append(new_node)
+
+        if index == 0:
+            self.root = new_node
+            return
+
+        parent: TreeNode = self.nodes[(index - 1) // 2]
+        if index % 2 == 1:
+            parent.left = new_node
+        else:
+            parent.right = new_node
+
+    def remove(self, val: any) -> None:
+        """
+        Removes a specified element from the tree and replaces it with bottom right-most node   
+
+        :raises Exception: If the tree is empty
+        """
+
+        if self.__isEmpty():
+            raise Exception("Cannot remove from empty tree")
+
+        for node in self.nodes:
+            if node.val == val:
+                node.val = self.__remDeepest()
+                return
+    
+    def pop(self) -> any:
+        """
+        Removes and returns the deepest node in binary tree 
+
+        :raises Exception: If the tree is empty
+        """ 
+
+        if self.__isEmpty():
+            raise Exception("Cannot pop from empty tree")
+
+        return self.__remDeepest()
+        
+    def preOrder(self) -> None:
+        """
+        Prints nodes in pre-order (root, left, right)  
+        """
+
+        self._preOrder(self.root) 
+        
+    def _preOrder(self, root) -> None:
+        if not root:
+            return
+
+        print(root.val, end="")
+        self._preOrder(root.left)
+        self._preOrder(root.right)
+
+
+    def inOrder(self) -> None:
+        """
+        Prints nodes in-order (left, root, right) 
+        """
+
+        self._inOrder(self.root)
+    
+    def _inOrder(self, root) -> None:
+        if not root:
+            return
+
+        self._inOrder(root.left)
+        print(root.val, end="")
+        self._inOrder(root.right)
+
+
+    def postOrder(self) -> list:
+        """
+        Prints nodes in post-order (left, right, root) 
+        """
+
+        self._postOrder(self.root)
+    
+    def _postOrder(self, root) -> None:
+        if not root:
+            return 
+
+        self._postOrder(root.left)
+        self._postOrder(root.right)
+        print(root.val, end="")
+    
+    def levelOrder(self) -> list:
+        """ 
+        Returns a list of nodes in a level order fashion computing left to right 
+        """
+
+        return self.__levelOrder(self.root)
+    
+    def __levelOrder(self, root) -> list:        
+        q = Queue()
+        out = []
+
+        if root:
+            q.enqueue(root)
+
+        while q.length > 0:
+            for i in range(q.length):
+                curr = q.dequeue()
+                out.append(curr.val)
+                if curr.left:
+                    q.enqueue(curr.left)
+                if curr.right:
+                    q.enqueue(curr.right)
+        
+        return out
+
+    def maxHeight(self) -> int:
+        return self.__getHeight(self.root)
+
+    def maxDepth(self) -> int:
+        pass
+
+    def enumerate(self) -> None:
+        pass
+
+    
+    def dump(self, fileobj: any) -> None:
+        """
+        Writes the tree to a binary file object as a flat array of its values in level order
+        """
+
+        _dump(fileobj, self, [node.val for node in self.nodes])
+
+    @classmethod
+    def load(cls, fileobj: any) -> 'PointerBinaryTree':
+        """
+        Reads a tree written by dump from a binary file object
+
+        :raises ValueError: If the file does not hold a dump of this class
+        """
+
+        values, = _load(fileobj, cls)
+        tree: PointerBinaryTree = cls()
+        for val in values:
+            tree.insert(val)
+        return tree
+
+    def print(self) -> None:
+        if self.__isEmpty():
+            print("Tree is empty")
+            return 
+        
+        height = self.__getHeight(self.root)
+        max_width = 2**height
+        level_nodes = [(self.root, max_width // 2)]
+
+        for level in range(height):
+            new_level_nodes = []
+            line = [" "] * max_width
+
+            for node, pos in level_nodes:
+                if node:
+                    line[pos] = str(node.val)
+                    new_level_nodes.append((node.left, pos-2**(height-level-2)))
+                    new_level_nodes.append((node.right, pos+2**(height-level-2)))
+            print("".join(line).rstrip())
+
+            if level < height-1:
+                slash_line = [" "] * max_width
+                for node, pos in level_nodes:
+                    if node and node.left:
+                        slash_line[pos-1] = "/"
+                    if node and node.right:
+                        slash_line[pos+1] = "\\"
+                print("".join(slash_line).rstrip())
+            
+            level_nodes = new_level_nodes
+
+    def __getHeight(self, node) -> int:
+        """
+        Helper function to calculate height of binary tree
+        """
+        if not node:
+            return 0
+        return 1 + max(self.__getHeight(node.left), self.__getHeight(node.right))
+    
+    def __remDeepest(self) -> any:
+        """
+        Helper function to delete deepest node in binary tree, returns its value
+        """
+
+        index: int = len(self.nodes) - 1
+        deepest: TreeNode = self.nodes.pop()
+
+        if index == 0:
+            self.root = None
+        elif index % 2 == 1:
+            self.nodes[(index - 1) // 2].left = None
+        else:
+            self.nodes[(index - 1) // 2].right = None
+        return deepest.val
+
+
+    def __isEmpty(self) -> bool:
+        return not self.root
+
+
+class ArrayBinaryTree:
+    """
+     Binary tree (array) - A structure in which data is arranged in a tree-like structure
+               consiting of a root node, branch nodes and leaf nodes. Each node can have
+               a maximum of two child nodes. Nodes are implemented using array indexes.  
+    
+    """
+    def __init__(self) -> None:
+        self.tree = [0]
+        self.size = 0
+    
+    def insert(self, val: any) -> None: 
+        self.tree.append(val)
+        self.size += 1
+    
+    def remove(self) -> any:
+        val = self.tree.pop()
+        self.size -= 1
+        return val
+
+    def find(self, val: any) -> bool:
+        if self.__isEmpty():
+            return False
+        
+        curr = 1
+        while curr < self.size:
+            if self.tree[curr] == val:
+                return True
+            curr += 1
+
+    def getNode(self, index: int) -> any:
+        if self.__isEmpty():
+            return None        
+        if index < 0 or index > self.size:
+            raise IndexError("Index out of bounds")
+ 
+        return self.tree[index]
+
+    def getParent(self, index: int) -> any:
+        if self.__isEmpty():
+            return None        
+        if index < 0 or index > self.size:
+            raise IndexError("Index out of bounds")
+ 
+        return self.tree[index // 2]
+
+    def getLeft(self, index: int) -> any:
+        if self.__isEmpty():
+            return None        
+        if index < 0 or index > self.size:
+            raise IndexError("Index out of bounds")
+        
+        
+        if (2 * index) < self.size:
+            return self.tree[2 * index] 
+        else:
+            return None
+    
+    def getRight(self, index: int) -> any:
+        if self.__isEmpty():
+            return None
+        if index < 0 or index > self.size:
+            raise IndexError("Index out of bounds")
+
+        if (2 * index) < self.size:
+            return self.tree[2 * index + 1] 
+        else:
+            return None
+ 
+    def print(self) -> None:
+        print(self.tree[1:])
+
+    def dump(self, fileobj: any) -> None:
+        """
+        Writes the tree to a binary file object as a flat array of its nodes in index order
+        """
+
+        _dump(fileobj, self, self.tree[1:])
+
+    @classmethod
+    def load(cls, fileobj: any) -> 'ArrayBinaryTree':
+        """
+        Reads a tree written by dump from a binary file object
+
+        :raises ValueError: If the file does not hold a dump of this class
+        """
+
+        values, = _load(fileobj, cls)
+        tree: ArrayBinaryTree = cls()
+        tree.tree.extend(values)
+        tree.size = len(values)
+        return tree
+
+    def __isEmpty(self) -> bool:
+        return self.size == 0
+
+
+class BST:
+    """
+    Binary search tree - A structure similar to a binary tree however the tree has an ordered property.
+                      Meaning nodes smaller than the root will be inserted into the left subtree 
+                      whereas nodes larger than the root will be inserted into the right subtree.
+    """
+
+    def __init__(self):
+        self.root = None
+
+    def insert(self, val: any) -> None:
+        """ Inserts a value into the binary search tree """
+
+        newNode = TreeNode(val)
+
+        if self.__isEmpty():
+            self.root = newNode
+        
+        parent = None
+        curr = self.root
+        while curr:
+            parent = curr
+            if curr.val > val:
+                curr = curr.left
+            elif curr.val < val:
+                curr = curr.right
+            else:
+                return
+        if parent.val > val:
+            parent.left = newNode
+        else:
+            parent.right = newNode
+        return
+    
+    def remove(self, val: any) -> None:
+        """ Removes a value from the binary search tree """
+        
+        if self.__isEmpty():
+            return
+
+        curr = self.root
+        while curr: 
+            if curr.val > val:
+                curr = curr.left
+            elif curr.val < val:
+                curr = curr.right
+            else:
+                if not curr.left:
+                    pass 
+        return False
+
+    def search(self, val: any) -> bool:
+        """ Searches for a specified value in the binary search tree, returns true if found else false """
+        
+        curr = self.root
+        while curr:
+            if curr.val == val:
+                return True
+            elif curr.val > val:
+                curr = curr.left
+            else:
+                curr = curr.right
+        return False
+    
+    def preOrder(self) -> None:
+        """
+        Prints nodes in pre-order (root, left, right)  
+        """
+
+        self._preOrder(self.root) 
+        
+    def _preOrder(self, root) -> None:
+        if not root:
+            return
+
+        print(root.val, end="")
+        self._preOrder(root.left)
+        self._preOrder(root.right)
+
+
+    def inOrder(self) -> None:
+        """
+        Prints nodes in-order (left, root, right) 
+        """
+
+        self._inOrder(self.root)
+    
+    def _inOrder(self, root) -> None:
+        if not root:
+            return
+
+        self._inOrder(root.left)
+        print(root.val, end="")
+        self._inOrder(root.right)
+
+
+    def postOrder(self) -> list:
+        """
+        Prints nodes in post-order (left, right, root) 
+        """
+
+        self._postOrder(self.root)
+    
+    def _postOrder(self, root) -> None:
+        if not root:
+            return 
+
+        self._postOrder(root.left)
+        self._postOrder(root.right)
+        print(root.val, end="")
+    
+
+    def floor(self, k: int) -> int:
+        """ Returns the largest element that is less than or equal to k """
+        
+        return self.__floor(k, self.root)
+
+    def __floor(self, k: int, root: TreeNode) -> int:
+        if not root:
+            return -1
+
+        if root.val == k:
+            return root.val        
+        if root.val > k:
+            return self.__floor(k, root.left)
+        
+        floor: TreeNode | int = self.__floor(k, root.right)
+        return floor if floor <= k and floor != -1 else root.val
+
+
+    def ceil(self, k: int) -> int:
+        """ Returns the smallest values that is greater than or equal to k """
+        
+        return self.__ceil(k, self.root)
+    
+    def __ceil(self, k: int, root: TreeNode) -> int:
+        if not root:
+            return -1
+        
+        if root.val == k:
+            return root.val
+        if root.val < k:
+           return self.__ceil(k, root.right) 
+        
+        ceil: TreeNode | int = self.__ceil(k, root.left)
+        return ceil if ceil >= k else root.val
+
+    def dump(self, fileobj: any) -> None:
+        """
+        Writes the tree to a binary file object. Values are written in pre-order with a byte of shape bits per node saying
+        whether it has a left (1) & right (2) child, so no recursion is needed either way
+        """
+
+        values: list = []
+        shape: bytearray = bytearray()
+        stack: list = [self.root] if self.root else []
+        while stack:
+            node: TreeNode = stack.pop()
+            values.append(node.val)
+            shape.append((node.left is not None) | (node.right is not None) << 1)
+            if node.right:
+                stack.append(node.right)
+            if node.left:
+                stack.append(node.left)
+        _dump(fileobj, self, values, memoryview(shape))
+
+    @classmethod
+    def load(cls, fileobj: any) -> 'BST':
+        """
+        Reads a tree written by dump from a binary file object
+
+        :raises ValueError: If the file does not hold a dump of this class
+        """
+
+        values, shape = _load(fileobj, cls)
+        tree: BST = cls()
+        # Each slot is a (parent, is right child) pair waiting for the next node in pre-order
+        slots: list = [(None, False)]
+        for val, bits in zip(values, shape):
+            parent, right = slots.pop()
+            node: TreeNode = TreeNode(val)
+            if parent is None:
+                tree.root = node
+            elif right:
+                parent.right = node
+            else:
+                parent.left = node
+            if bits & 2:
+                slots.append((node, True))
+            if bits & 1:
+                slots.append((node, False))
+        return tree
+
+    def print(self) -> None:
+        if self.__isEmpty():
+            print("Tree is empty")
+            return 
+        
+        height = self.__getHeight(self.root)
+        max_width = 2**height
+        level_nodes = [(self.root, max_width // 2)]
+
+        for level in range(height):
+            new_level_nodes = []
+            line = [" "] * max_width
+
+            for node, pos in level_nodes:
+                if node:
+                    line[pos] = str(node.val)
+                    new_level_nodes.append((node.left, pos-2**(height-level-2)))
+                    new_level_nodes.append((node.right, pos+2**(height-level-2)))
+            print("".join(line).rstrip())
+
+            if level < height-1:
+                slash_line = [" "] * max_width
+                for node, pos in level_nodes:
+                    if node and node.left:
+                        slash_line[pos-1] = "/"
+                    if node and node.right:
+                        slash_line[pos+1] = "\\"
+                print("".join(slash_line).rstrip())
+            
+            level_nodes = new_level_nodes
+
+    def __minVal(self, root: TreeNode) -> any:
+        """ Returns the minimum node of a subtree specified by an input root """
+
+        curr = root
+        while curr and curr.left:
+            curr = curr.left 
+        return curr 
+
+    def __getHeight(self, node) -> int:
+        """ Helper function to calculate height of binary search tree """
+
+        if not node:
+            return 0
+        return 1 + max(self.__getHeight(node.left), self.__getHeight(node.right)) 
+
+    def __isEmpty(self):
+        return not self.root
+
+
+class MinHeap:
+    """
+    MinHeap - A structure in which the root node is the smallest value among its descendant nodes 
+           And the same property must follow for it's left and right subtrees also.
+           The heap is stored in an array where the children of the node at index i 
+           are at indexes 2i+1 and 2i+2
+
+    Attributes:
+    -----------
+    heap: list
+        The underlying array which stores the nodes of the heap
+    key:
+        Function used to extract a comparison key from each element, defaults to the element itself
+
+    Methods:
+    --------
+    insert(val)
+        Inserts a value into the heap
+    delete()
+        Removes & returns the root of the heap
+    peek()
+        Returns the root of the heap without removing it
+    pushPop(val)
+        Inserts a value then removes & returns the root
+    replace(val)
+        Removes & returns the root then inserts a value
+    heapify(iterable)
+        Replaces contents of the heap with the elements of an iterable in O(n)
+    merge(other)
+        Adds all the elements of another heap or iterable to the heap
+    nSmallest(n)
+        Returns the n smallest elements in ascending order
+    nLargest(n)
+        Returns the n largest elements in descending order
+    print()
+        Prints contents of the heap
+    dump(fileobj) / load(fileobj)
+        Writes to or reads from a binary file object
+    """
+
+    def __init__(self, iterable: Iterable | None = None, key: Callable | None = None) -> None:
+        self.heap: list = []
+        self.key: Callable = key if key is not None else _identity
+        if iterable is not None:
+            self.heapify(iterable)
+
+    def __len__(self) -> int:
+        return len(self.heap)
+
+    def insert(self, val: any) -> None:
+        """ Inserts a value to the heap and orders depending on its value. Lowest becoming the root. """
+
+        self.heap.append(val)
+        self._siftUp(len(self.heap) - 1)
+
+    def delete(self) -> any:
+        """ 
+        Removes & returns the node with the smallest value from the heap 
+
+        :raises Exception: If the heap is empty
+        """
+
+        if self.__isEmpty():
+            raise Exception("Cannot delete from empty heap")
+
+        last: any = self.heap.pop()
+        if not self.heap:
+            return last
+
+        # Replace the root with the last leaf & percolate it down to restore the heap property
+        res: any = self.heap[0]
+        self.heap[0] = last
+        self._siftDown(0)
+        return res
+
+    def peek(self) -> any:
+        """
+        Returns the root of the heap without removing it
+
+        :raises Exception: If the heap is empty
+        """
+
+        if self.__isEmpty():
+            raise Exception("Cannot peek empty heap")
+        return self.heap[0]
+
+    def pushPop(self, val: any) -> any:
+        """
+        Inserts a value then removes & returns the root, faster than calling insert followed by delete
+        """
+
+        if self.heap and self._before(self.heap[0], val):
+            val, self.heap[0] = self.heap[0], val
+            self._siftDown(0)
+        return val
+
+    def replace(self, val: any) -> any:
+        """
+        Removes & returns the root then inserts a value, the returned value may be larger than val
+
+        :raises Exception: If the heap is empty
+        """
+
+        if self.__isEmpty():
+            raise Exception("Cannot replace in empty heap")
+
+        res: any = self.heap[0]
+        self.heap[0] = val
+        self._siftDown(0)
+        return res
+
+    def heapify(self, iterable: Iterable) -> None:
+        """
+        Replaces contents of the heap with the elements of an iterable. 
+        Builds the heap bottom-up by percolating down every non-leaf node which takes O(n)
+        """
+
+        self.heap = list(iterable)
+        self._build()
+
+    def merge(self, other: Iterable) -> None:
+        """
+        Adds all the elements of another heap or iterable to the heap in O(n + m)
+        """
+
+        # Copy even another heap's array, as merging a heap with itself would otherwise grow the list being read
+        items: list = list(other.heap) if isinstance(other, MinHeap) else list(other)
+        if len(items) > len(self.heap):
+            self.heap.extend(items)
+            self._build()
+        else:
+            # Inserting a small batch one by one is cheaper than rebuilding the whole heap
+            for val in items:
+                self.insert(val)
+
+    def nSmallest(self, n: int) -> list:
+        """
+        Returns the n smallest elements of the heap in ascending order without modifying the heap
+        """
+
+        return self._topN(n)
+
+    def nLargest(self, n: int) -> list:
+        """
+        Returns the n largest elements of the heap in descending order without modifying the heap
+        """
+
+        return self._bottomN(n)
+
+    def dump(self, fileobj: any) -> None:
+        """
+        Writes the heap to a binary file object as a flat array of its values in heap order. The key function is not written
+        """
+
+        _dump(fileobj, self, self.heap)
+
+    @classmethod
+    def load(cls, fileobj: any, key: Callable | None = None) -> 'MinHeap':
+        """
+        Reads a heap written by dump from a binary file object
+
+        :raises ValueError: If the file does not hold a dump of this class
+        """
+
+        values, = _load(fileobj, cls)
+        heap: MinHeap = cls(key=key)
+        heap.heap = list(values)
+        return heap
+
+    def print(self) -> None:
+        """
+        Prints contents of the heap
+        """
+
+        print(self.heap)
+
+    def _before(self, a: any, b: any) -> bool:
+        """ Returns True if a belongs above b in the heap """
+
+        return self.key(a) < self.key(b)
+
+    def _siftUp(self, index: int) -> None:
+        heap: list = self.heap
+        val: any = heap[index]
+        while index > 0:
+            parent: int = (index - 1) // 2
+            if not self._before(val, heap[parent]):
+                break
+            heap[index] = heap[parent]
+            index = parent
+        heap[index] = val
+
+    def _siftDown(self, index: int) -> None:
+        heap: list = self.heap
+        length: int = len(heap)
+        val: any = heap[index]
+        child: int = 2 * index + 1
+        # While current node is not a leaf node move the higher priority child up
+        while child < length:
+            if child + 1 < length and self._before(heap[child + 1], heap[child]):
+                child += 1
+            if not self._before(heap[child], val):
+                break
+            heap[index] = heap[child]
+            index = child
+            child = 2 * index + 1
+        heap[index] = val
+
+    def _topN(self, n: int) -> list:
+        """ Returns the first n elements in heap order by expanding a frontier from the root in O(n log n) """
+
+        heap: list = self.heap
+        out: list = []
+        if n <= 0 or not heap:
+            return out
+
+        key: Callable = self.key
+        frontier = self.__class__(key=lambda i: key(heap[i]))
+        frontier.insert(0)
+        while frontier and len(out) < n:
+            index: int = frontier.delete()
+            out.append(heap[index])
+            for child in self._children(index):
+                frontier.insert(child)
+        return out
+
+    def _bottomN(self, n: int) -> list:
+        """ Returns the last n elements in heap order by scanning with a bounded heap in O(m log n) """
+
+        if n <= 0:
+            return []
+
+        kept = self.__class__(key=self.key)
+        for val in self.heap:
+            if len(kept) < n:
+                kept.insert(val)
+            elif self._before(kept.heap[0], val):
+                kept.replace(val)
+
+        out: list = []
+        while kept:
+            out.append(kept.delete())
+        out.reverse()
+        return out
+
+    def _children(self, index: int) -> range:
+        return range(2 * index + 1, min(2 * index + 3, len(self.heap)))
+
+    def _build(self) -> None:
+        for index in range(len(self.heap) // 2 - 1, -1, -1):
+            self._siftDown(index)
+
+    def __isEmpty(self) -> bool:
+        return len(self.heap) == 0
+
+
+class MaxHeap(MinHeap):
+    """
+    MaxHeap - A structure in which the root node is the largest value among its descendant nodes 
+           And the same property must follow for it's left and right subtrees also.
+           Shares the interface of MinHeap with the ordering reversed.
+    """
+
+    def nSmallest(self, n: int) -> list:
+        """
+        Returns the n smallest elements of the heap in ascending order without modifying the heap
+        """
+
+        return self._bottomN(n)
+
+    def nLargest(self, n: int) -> list:
+        """
+        Returns the n largest elements of the heap in descending order without modifying the heap
+        """
+
+        return self._topN(n)
+
+    def _before(self, a: any, b: any) -> bool:
+        return self.key(b) < self.key(a)
+
+
+class DAryHeap(MinHeap):
+    """
+    D-ary heap - A min heap where each node has up to d children instead of two. 
+              The children of the node at index i are at indexes di+1 to di+d. 
+              A wider heap has fewer levels, making insertions cheaper & keeping each node's 
+              children next to each other in the array, at the cost of more comparisons per deletion.
+              Shares the interface of MinHeap.
+
+    Attributes:
+    -----------
+    d: int
+        The maximum number of children of each node
+    """
+
+    def __init__(self, iterable: Iterable | None = None, key: Callable | None = None, d: int = 4) -> None:
+        if d < 2:
+            raise ValueError("Arity of heap must be at least 2")
+        self.d: int = d
+        super().__init__(iterable, key)
+
+    def _siftUp(self, index: int) -> None:
+        heap: list = self.heap
+        d: int = self.d
+        val: any = heap[index]
+        while index > 0:
+            parent: int = (index - 1) // d
+            if not self._before(val, heap[parent]):
+                break
+            heap[index] = heap[parent]
+            index = parent
+        heap[index] = val
+
+    def _siftDown(self, index: int) -> None:
+        heap: list = self.heap
+        d: int = self.d
+        length: int = len(heap)
+        val: any = heap[index]
+        first: int = d * index + 1
+        while first < length:
+            # Find the highest priority of the (up to) d children
+            best: int = first
+            for child in range(first + 1, min(first + d, length)):
+                if self._before(heap[child], heap[best]):
+                    best = child
+            if not self._before(heap[best], val):
+                break
+            heap[index] = heap[best]
+            index = best
+            first = d * index + 1
+        heap[index] = val
+
+    def _children(self, index: int) -> range:
+        return range(self.d * index + 1, min(self.d * index + self.d + 1, len(self.heap)))
+
+    def _build(self) -> None:
+        for index in range((len(self.heap) - 2) // self.d, -1, -1):
+            self._siftDown(index)
+
+    def dump(self, fileobj: any) -> None:
+        """
+        Writes the heap to a binary file object as a flat array of its values in heap order. The key function is not written
+        """
+
+        _dump(fileobj, self, [self.d], self.heap)
+
+    @classmethod
+    def load(cls, fileobj: any, key: Callable | None = None) -> 'DAryHeap':
+        """
+        Reads a heap written by dump from a binary file object
+
+        :raises ValueError: If the file does not hold a dump of this class
+        """
+
+        (d,), values = _load(fileobj, cls)
+        heap: DAryHeap = cls(key=key, d=d)
+        heap.heap = list(values)
+        return heap
+
+
+class HeapHandle:
+    """
+    Helper class for IndexedMinHeap, returned on insertion & used to refer back to an element 
+    """
+    def __init__(self, val: any, priority: any) -> None:
+        self.val: any = val
+        self.priority: any = priority
+        self.index: int = -1
+
+
+class IndexedMinHeap:
+    """
+    Indexed min heap - A min heap where each inserted element is given a handle that tracks its 
+                    position in the underlying array, allowing its priority to be changed or the 
+                    element to be removed in O(log n)
+
+    Attributes:
+    -----------
+    heap: list
+        The underlying array which stores the handles of the heap ordered by priority
+
+    Methods:
+    --------
+    insert(val, priority)
+        Inserts a value with a given priority & returns its handle
+    delete()
+        Removes & returns the value with the smallest priority
+    peek()
+        Returns the value with the smallest priority without removing it
+    decreaseKey(handle, priority)
+        Lowers the priority of an element 
+    updateKey(handle, priority)
+        Changes the priority of an element to any value
+    remove(handle)
+        Removes an element from the heap
+    """
+
+    def __init__(self) -> None:
+        self.heap: list[HeapHandle] = []
+
+    def __len__(self) -> int:
+        return len(self.heap)
+
+    def __contains__(self, handle: HeapHandle) -> bool:
+        return 0 <= handle.index < len(self.heap) and self.heap[handle.index] is handle
+
+    def insert(self, val: any, priority: any) -> HeapHandle:
+        """
+        Inserts a value with a given priority & returns its handle
+        """
+
+        handle: HeapHandle = HeapHandle(val, priority)
+        handle.index = len(self.heap)
+        self.heap.append(handle)
+        self.__siftUp(handle.index)
+        return handle
+
+    def delete(self) -> any:
+        """
+        Removes & returns the value with the smallest priority
+
+        :raises Exception: If the heap is empty
+        """
+
+        if self.__isEmpty():
+            raise Exception("Cannot delete from empty heap")
+        return self.__removeAt(0).val
+
+    def peek(self) -> any:
+        """
+        Returns the value with the smallest priority without removing it
+
+        :raises Exception: If the heap is empty
+        """
+
+        if self.__isEmpty():
+            raise Exception("Cannot peek empty heap")
+        return self.heap[0].val
+
+    def decreaseKey(self, handle: HeapHandle, priority: any) -> None:
+        """
+        Lowers the priority of an element 
+
+        :raises ValueError: If the new priority is larger than the current priority 
+        :raises Exception: If the handle does not belong to the heap
+        """
+
+        self.__checkHandle(handle)
+        if handle.priority < priority:
+            raise ValueError("New priority must not be larger than current priority")
+
+        handle.priority = priority
+        self.__siftUp(handle.index)
+
+    def updateKey(self, handle: HeapHandle, priority: any) -> None:
+        """
+        Changes the priority of an element to any value
+
+        :raises Exception: If the handle does not belong to the heap
+        """
+
+        self.__checkHandle(handle)
+        handle.priority = priority
+        self.__siftUp(handle.index)
+        self.__siftDown(handle.index)
+
+    def remove(self, handle: HeapHandle) -> any:
+        """
+        Removes an element from the heap & returns its value
+
+        :raises Exception: If the handle does not belong to the heap
+        """
+
+        self.__checkHandle(handle)
+        return self.__removeAt(handle.index).val
+
+    def print(self) -> None:
+        """
+        Prints contents of the heap as (value, priority) pairs
+        """
+
+        print([(handle.val, handle.priority) for handle in self.heap])
+
+    def __removeAt(self, index: int) -> HeapHandle:
+        heap: list = self.heap
+        handle: HeapHandle = heap[index]
+        last: HeapHandle = heap.pop()
+        if last is not handle:
+            heap[index] = last
+            last.index = index
+            self.__siftUp(index)
+            self.__siftDown(last.index)
+        handle.index = -1
+        return handle
+
+    def __siftUp(self, index: int) -> None:
+        heap: list = self.heap
+        handle: HeapHandle = heap[index]
+        while index > 0:
+            parent: int = (index - 1) // 2
+            if not handle.priority < heap[parent].priority:
+                break
+            heap[index] = heap[parent]
+            heap[index].index = index
+            index = parent
+        heap[index] = handle
+        handle.index = index
+
+    def __siftDown(self, index: int) -> None:
+        heap: list = self.heap
+        length: int = len(heap)
+        handle: HeapHandle = heap[index]
+        child: int = 2 * index + 1
+        while child < length:
+            if child + 1 < length and heap[child + 1].priority < heap[child].priority:
+                child += 1
+            if not heap[child].priority < handle.priority:
+                break
+            heap[index] = heap[child]
+            heap[index].index = index
+            index = child
+            child = 2 * index + 1
+        heap[index] = handle
+        handle.index = index
+
+    def __checkHandle(self, handle: HeapHandle) -> None:
+        if handle not in self:
+            raise Exception("Handle does not belong to heap")
+
+    def __isEmpty(self) -> bool:
+        return len(self.heap) == 0
+
+
+class PairingNode:
+    """
+    Helper class for PairingHeap, returned on insertion & used to refer back to an element
+    """
+    def __init__(self, val: any, priority: any) -> None:
+        self.val: any = val
+        self.priority: any = priority
+        self.child: PairingNode | None = None
+        self.next: PairingNode | None = None
+        # The parent if this node is the first child, else the previous sibling
+        self.prev: PairingNode | None = None
+        # The ownership cell of the heap holding the node, None once removed
+        self.owner: list | None = None
+
+
+class PairingHeap:
+    """
+    Pairing heap - A min heap stored as a multi-way tree where each node points to its first child 
+                & next sibling. Insertion, merging & decreasing a priority just link two trees together 
+                in O(1), while deleting the root pairs up its children in amortized O(log n). 
+                Shares the interface of IndexedMinHeap.
+
+    Attributes:
+    -----------
+    root: PairingNode
+        The node with the smallest priority 
+    length: int
+        The number of elements currently in the heap
+
+    Methods:
+    --------
+    insert(val, priority)
+        Inserts a value with a given priority & returns its node
+    delete()
+        Removes & returns the value with the smallest priority
+    peek()
+        Returns the value with the smallest priority without removing it
+    decreaseKey(node, priority)
+        Lowers the priority of an element 
+    remove(node)
+        Removes an element from the heap
+    merge(other)
+        Moves all the elements of another pairing heap into the heap in O(1)
+    """
+
+    def __init__(self) -> None:
+        self.root: PairingNode | None = None
+        self.length: int = 0
+        # Nodes point at this cell, which holds the heap or, once the heap is merged into another, 
+        # the cell of that heap, so merging does not need to visit every node
+        self.__owner: list = [self]
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __contains__(self, node: PairingNode) -> bool:
+        cell: list | None = node.owner
+        if cell is None:
+            return False
+        while type(cell[0]) == list:
+            following: list = cell[0]
+            if type(following[0]) == list:
+                # Point past the next cell along the chain of merges so later lookups are shorter
+                cell[0] = following[0]
+            cell = following
+        return cell[0] is self
+
+    def insert(self, val: any, priority: any) -> PairingNode:
+        """
+        Inserts a value with a given priority & returns its node
+        """
+
+        node: PairingNode = PairingNode(val, priority)
+        node.owner = self.__owner
+        self.root = self.__link(self.root, node)
+        self.length += 1
+        return node
+
+    def delete(self) -> any:
+        """
+        Removes & returns the value with the smallest priority
+
+        :raises Exception: If the heap is empty
+        """
+
+        if self.__isEmpty():
+            raise Exception("Cannot delete from empty heap")
+
+        root: PairingNode = self.root
+        self.root = self.__mergePairs(root.child)
+        root.child = None
+        root.owner = None
+        self.length -= 1
+        return root.val
+
+    def peek(self) -> any:
+        """
+        Returns the value with the smallest priority without removing it
+
+        :raises Exception: If the heap is empty
+        """
+
+        if self.__isEmpty():
+            raise Exception("Cannot peek empty heap")
+        return self.root.val
+
+    def decreaseKey(self, node: PairingNode, priority: any) -> None:
+        """
+        Lowers the priority of an element by cutting its subtree out & linking it to the root
+
+        :raises ValueError: If the new priority is larger than the current priority 
+        :raises Exception: If the node does not belong to the heap
+        """
+
+        self.__checkNode(node)
+        if node.priority < priority:
+            raise ValueError("New priority must not be larger than current priority")
+
+        node.priority = priority
+        if node is not self.root:
+            self.__cut(node)
+            self.root = self.__link(self.root, node)
+
+    def remove(self, node: PairingNode) -> any:
+        """
+        Removes an element from the heap & returns its value
+
+        :raises Exception: If the node does not belong to the heap
+        """
+
+        self.__checkNode(node)
+        if node is self.root:
+            return self.delete()
+
+        self.__cut(node)
+        self.root = self.__link(self.root, self.__mergePairs(node.child))
+        node.child = None
+        node.owner = None
+        self.length -= 1
+        return node.val
+
+    def merge(self, other: 'PairingHeap') -> None:
+        """
+        Moves all the elements of another pairing heap into the heap in O(1), leaving the other heap empty
+
+        :raises ValueError: If other is this heap
+        """
+
+        if other is self:
+            raise ValueError("Cannot merge a heap with itself")
+        self.root = self.__link(self.root, other.root)
+        self.length += other.length
+        other.root = None
+        other.length = 0
+        other.__owner[0] = self.__owner
+        other.__owner = [other]
+
+    def print(self) -> None:
+        """
+        Prints the (value, priority) pairs of the heap in pre-order
+        """
+
+        out: list = []
+        stack: list = [self.root] if self.root else []
+        while stack:
+            node: PairingNode = stack.pop()
+            out.append((node.val, node.priority))
+            if node.next:
+                stack.append(node.next)
+            if node.child:
+                stack.append(node.child)
+        print(out)
+
+    def __link(self, a: PairingNode | None, b: PairingNode | None) -> PairingNode | None:
+        """ Makes the root with the larger priority the first child of the other, returns the new root """
+
+        if a is None:
+            return b
+        if b is None:
+            return a
+        if b.priority < a.priority:
+            a, b = b, a
+
+        b.prev = a
+        b.next = a.child
+        if a.child:
+            a.child.prev = b
+        a.child = b
+        a.next = None
+        a.prev = None
+        return a
+
+    def __mergePairs(self, first: PairingNode | None) -> PairingNode | None:
+        """ Links siblings together in pairs from left to right then merges the pairs from right to left """
+
+        pairs: list = []
+        while first:
+            a: PairingNode = first
+            b: PairingNode | None = a.next
+            first = b.next if b else None
+            a.next = a.prev = None
+            if b:
+                b.next = b.prev = None
+            pairs.append(self.__link(a, b))
+
+        root: PairingNode | None = None
+        for pair in reversed(pairs):
+            root = self.__link(pair, root)
+        return root
+
+    def __cut(self, node: PairingNode) -> None:
+        """ Detaches a node (& its subtree) from its parent or previous sibling """
+
+        if node.prev.child is node:
+            node.prev.child = node.next
+        else:
+            node.prev.next = node.next
+        if node.next:
+            node.next.prev = node.prev
+        node.next = None
+        node.prev = None
+
+    def __checkNode(self, node: PairingNode) -> None:
+        if node not in self:
+            raise Exception("Node does not belong to heap")
+
+    def __isEmpty(self) -> bool:
+        return self.root is None
+
+
+def _rowData(m: 'Matrix', row: int) -> any:
+    """ Returns the raw numbers of a row of a matrix without copying, with empty cells as NaN """
+
+    if m.backend == "numpy":
+        return m.data[row]
+    return memoryview(m.data)[row * m.columns:(row + 1) * m.columns]
+
+
+class _MatrixRow:
+    """
+    Helper class for Matrix, a view of one row that reads empty cells as None & writes through to the matrix
+    """
+
+    def __init__(self, matrix: 'Matrix', row: int) -> None:
+        self.matrix: Matrix = matrix
+        self.row: int = row
+
+    def __len__(self) -> int:
+        return self.matrix.columns
+
+    def __iter__(self) -> Iterator:
+        for val in _rowData(self.matrix, self.row).tolist():
+            yield None if val != val else val
+
+    def __contains__(self, val: any) -> bool:
+        return any(item == val for item in self)
+
+    def __getitem__(self, index: int | slice) -> any:
+        if isinstance(index, slice):
+            return list(self)[index]
+        return self.matrix[self.row, index]
+
+    def __setitem__(self, index: int, val: any) -> None:
+        self.matrix.insert(_EMPTY if val is None else val, self.row, index)
+
+    def __repr__(self) -> str:
+        return f"MatrixRow({list(self)})"
+
+    def tolist(self) -> list:
+        """ Returns a copy of the row as a list """
+
+        return list(self)
+
+
+class Vector:
+    """ 
+    Vector - A one-dimensional sequence of floats for numeric work, stored in a numpy array when numpy 
+             is installed, otherwise in an array.array. Operations run over the whole vector at once 
+             rather than element by element. A vector can view a row of a Matrix without copying it
+
+    Attributes:
+    -----------
+    data: numpy.ndarray | array.array | memoryview
+        The underlying array that stores the elements, or a view of a matrix row
+    backend: str
+        "numpy" or "python"
+
+    Methods:
+    --------
+    zeros(n, backend)
+        Creates a vector of n zeros
+    fromRow(m, row)
+        Creates a vector viewing a row of a matrix
+    dot(v)
+        Returns the dot product with another vector
+    norm(p)
+        Returns the 1, 2 or infinity norm
+    axpy(a, x)
+        Adds a times vector x to the vector in place
+    cosine(v)
+        Returns the cosine similarity with another vector
+    topK(m, k)
+        Returns the k rows of a matrix with the largest dot products with the vector
+    tolist()
+        Returns the elements as a list
+    dump(fileobj) / load(fileobj)
+        Writes to or reads from a binary file object
+    """
+
+    def __init__(self, values: Iterable = (), backend: str | None = None) -> None:
+        if backend is None:
+            backend = "numpy" if np is not None else "python"
+        if backend not in ("numpy", "python"):
+            raise ValueError("Backend must be either numpy or python")
+        if backend == "numpy" and np is None:
+            raise ImportError("numpy is not installed")
+
+        self.backend: str = backend
+        if backend == "numpy":
+            self.data = np.array(values if isinstance(values, (list, tuple)) else list(values), dtype="d")
+        else:
+            self.data = array.array("d", values)
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __iter__(self) -> Iterator:
+        return iter(self.tolist())
+
+    def __getitem__(self, index: int) -> float:
+        return float(self.data[_checkIndex(index, len(self))])
+
+    def __setitem__(self, index: int, val: float) -> None:
+        self.data[_checkIndex(index, len(self))] = val
+
+    def __repr__(self) -> str:
+        return f"Vector({self.tolist()})"
+
+    def __add__(self, v: 'Vector | int | float') -> 'Vector':
+        return self.__apply(v, operator.add)
+
+    def __sub__(self, v: 'Vector | int | float') -> 'Vector':
+        return self.__apply(v, operator.sub)
+
+    def __mul__(self, v: 'Vector | int | float') -> 'Vector':
+        return self.__apply(v, operator.mul)
+
+    def __rmul__(self, k: int | float) -> 'Vector':
+        return self.__apply(k, operator.mul)
+
+    def __truediv__(self, v: 'Vector | int | float') -> 'Vector':
+        return self.__apply(v, operator.truediv)
+
+    def __matmul__(self, v: 'Vector') -> float:
+        return self.dot(v)
+
+    @classmethod
+    def zeros(cls, n: int, backend: str | None = None) -> 'Vector':
+        """
+        Creates a vector of n zeros
+        """
+
+        v: Vector = cls((), backend)
+        v.data = np.zeros(n) if v.backend == "numpy" else array.array("d", [0.0]) * n
+        return v
+
+    @classmethod
+    def fromRow(cls, m: 'Matrix', row: int) -> 'Vector':
+        """
+        Creates a vector viewing a row of a float matrix, writes to either are seen by the other
+
+        :raises TypeError: If the matrix does not store doubles
+        :raises IndexError: If the row is out of matrix bounds
+        """
+
+        if m.dtype != "d":
+            raise TypeError("Only rows of a matrix of doubles can be viewed as a vector")
+
+        v: Vector = cls.__new__(cls)
+        v.backend, v.data = m.backend, _rowData(m, _checkIndex(row, m.rows))
+        return v
+
+    def dot(self, v: 'Vector') -> float:
+        """
+        Returns the dot product with another vector
+
+        :raises Exception: If the vectors are not the same length
+        """
+
+        self.__checkLength(v)
+        if self.backend == "numpy":
+            return float(np.dot(self.data, self.__asArray(v)))
+        return sum(map(operator.mul, self.data, memoryview(v.data)))
+
+    def norm(self, p: int | float = 2) -> float:
+        """
+        Returns the 1 norm (sum of absolute values), 2 norm (euclidean length) or 
+        infinity norm (largest absolute value) of the vector
+
+        :raises ValueError: If p is not 1, 2 or infinity
+        """
+
+        if p not in (1, 2, float("inf")):
+            raise ValueError("Norm must be 1, 2 or infinity")
+
+        if self.backend == "numpy":
+            return float(np.linalg.norm(self.data, p))
+        if p == 1:
+            return sum(map(abs, self.data))
+        if p == 2:
+            return math.sqrt(sum(map(operator.mul, self.data, self.data)))
+        return max(map(abs, self.data), default=0.0)
+
+    def axpy(self, a: int | float, x: 'Vector') -> None:
+        """
+        Adds a times vector x to the vector in place, without allocating a scaled copy of x
+
+        :raises Exception: If the vectors are not the same length
+        """
+
+        self.__checkLength(x)
+        if self.backend == "numpy":
+            self.data += a * self.__asArray(x)
+        else:
+            self.data[:] = array.array("d", map(operator.add, self.data, map(operator.mul, repeat(a), memoryview(x.data))))
+
+    def cosine(self, v: 'Vector') -> float:
+        """
+        Returns the cosine of the angle between this & another vector, 0 if either has no length
+
+        :raises Exception: If the vectors are not the same length
+        """
+
+        lengths: float = self.norm() * v.norm()
+        return self.dot(v) / lengths if lengths else 0.0
+
+    def topK(self, m: 'Matrix', k: int) -> list:
+        """
+        Scores every row of a matrix by its dot product with the vector in one pass, 
+        returns the (row, score) pairs of the k highest scoring rows in descending order
+
+        :raises Exception: If the vector length does not match the number of columns of m
+        """
+
+        if len(self) != m.columns:
+            raise Exception("Vector length must match the number of columns of the matrix")
+        k = min(k, m.rows)
+        if k <= 0:
+            return []
+
+        if self.backend == "numpy":
+            rows = m.data if m.backend == "numpy" else np.frombuffer(m.data, dtype=m.dtype).reshape(m.rows, m.columns)
+            scores = rows @ self.data
+            best = np.argpartition(-scores, k - 1)[:k]
+            best = best[np.argsort(-scores[best], kind="stable")]
+            return [(int(row), float(scores[row])) for row in best]
+
+        # Keep the k best seen so far in a min heap so each row costs at most one O(log k) replacement
+        kept: MinHeap = MinHeap(key=lambda pair: pair[1])
+        for row in range(m.rows):
+            score: float = sum(map(operator.mul, _rowData(m, row), self.data))
+            if len(kept) < k:
+                kept.insert((row, score))
+            elif score > kept.peek()[1]:
+                kept.replace((row, score))
+        return sorted(kept.heap, key=lambda pair: -pair[1])
+
+    def dump(self, fileobj: any) -> None:
+        """
+        Writes the vector to a binary file object as a raw buffer
+        """
+
+        _dump(fileobj, self, self.data)
+
+    @classmethod
+    def load(cls, fileobj: any, backend: str | None = None) -> 'Vector':
+        """
+        Reads a vector written by dump from a binary file object
+
+        :raises ValueError: If the file does not hold a dump of this class
+        """
+
+        data, = _load(fileobj, cls)
+        v: Vector = cls((), backend)
+        v.data = np.frombuffer(data, dtype="d") if v.backend == "numpy" else data
+        return v
+
+    def tolist(self) -> list:
+        """
+        Returns the elements of the vector as a list
+        """
+
+        return self.data.tolist()
+
+    def __apply(self, v: 'Vector | int | float', op: Callable) -> 'Vector':
+        """ Returns a new vector from applying op elementwise with another vector or scalar """
+
+        result: Vector = Vector.__new__(Vector)
+        result.backend = self.backend
+        if isinstance(v, Vector):
+            self.__checkLength(v)
+            other: any = self.__asArray(v) if self.backend == "numpy" else memoryview(v.data)
+        else:
+            other = v if self.backend == "numpy" else repeat(v)
+
+        if self.backend == "numpy":
+            result.data = op(self.data, other).astype("d", copy=False)
+        else:
+            result.data = array.array("d", map(op, self.data, other))
+        return result
+
+    def __checkLength(self, v: 'Vector') -> None:
+        if len(v) != len(self):
+            raise Exception("Vectors must be the same length")
+
+    def __asArray(self, v: 'Vector') -> any:
+        """ Returns the data of another vector as a numpy array without copying """
+
+        return v.data if v.backend == "numpy" else np.frombuffer(v.data, dtype="d")
+
+
+# The process pool shared by parallel matrix operations & its number of workers
+_POOL: ProcessPoolExecutor | None = None
+_POOL_WORKERS: int = 0
+
+
+def _pool(workers: int) -> ProcessPoolExecutor:
+    """ 
+    Returns the shared process pool with at least a given number of workers, reused between calls. 
+    The pool is only replaced when more workers are needed, as callers split their work by their own count
+    """
+
+    global _POOL, _POOL_WORKERS
+    if _POOL is None or workers > _POOL_WORKERS:
+        shutdownPool()
+        _POOL = ProcessPoolExecutor(workers)
+        _POOL_WORKERS = workers
+    return _POOL
+
+
+def shutdownPool() -> None:
+    """
+    Shuts down the worker processes used by parallel matrix operations, they are started again when next needed. 
+    Called automatically when the interpreter exits
+    """
+
+    global _POOL, _POOL_WORKERS
+    if _POOL is not None:
+        _POOL.shutdown()
+        _POOL = None
+        _POOL_WORKERS = 0
+
+
+atexit.register(shutdownPool)
+
+
+def _shareMatrix(m: 'Matrix', segments: list) -> tuple:
+    """ Copies the data of a matrix into a new shared memory segment, returns a description of it for the workers """
+
+    data: memoryview = memoryview(m.data).cast("B")
+    shm: shared_memory.SharedMemory = shared_memory.SharedMemory(create=True, size=max(len(data), 1))
+    segments.append(shm)
+    shm.buf[:len(data)] = data
+    return shm.name, m.rows, m.columns, m.dtype, m.backend
+
+
+def _attachMatrix(spec: tuple, segments: list, start: int = 0, stop: int | None = None) -> 'Matrix':
+    """ Returns a matrix viewing rows start to stop of a shared matrix without copying """
+
+    name, rows, cols, dtype, backend = spec
+    shm: shared_memory.SharedMemory = shared_memory.SharedMemory(name=name)
+    segments.append(shm)
+
+    stop = rows if stop is None else stop
+    m: Matrix = Matrix.__new__(Matrix)
+    m.rows, m.columns, m.dtype, m.backend = stop - start, cols, dtype, backend
+    if backend == "numpy":
+        m.data = np.ndarray((rows, cols), dtype=dtype, buffer=shm.buf)[start:stop]
+    else:
+        m.data = shm.buf[:rows * cols * array.array(dtype).itemsize].cast(dtype)[start * cols:stop * cols]
+    return m
+
+
+def _matrixBlock(task: tuple) -> None:
+    """ Computes rows start to stop of the result of a matrix operation in a worker process """
+
+    op, start, stop, a, b, out, args = task
+    segments: list = []
+    try:
+        left: Matrix = _attachMatrix(a, segments, start, stop)
+        if not isinstance(b, tuple):
+            right: any = b
+        elif op != "matmul" and b[1] == a[1]:
+            right = _attachMatrix(b, segments, start, stop)
+        else:
+            right = _attachMatrix(b, segments)
+
+        if op == "matmul":
+            result: Matrix = left.multiply(right, *args)
+        else:
+            result = left.elementwise(right, getattr(operator, op))
+        target: Matrix = _attachMatrix(out, segments, start, stop)
+        target.data[:] = result.data
+        del left, right, result, target
+    finally:
+        for shm in segments:
+            shm.close()
+
+
+class Matrix:
+    """
+    Matrix - A two-dimnensional structure arranged in rows and columns   
+
+             Elements are stored in a numpy array when numpy is installed, otherwise in a flat 
+             row-major array.array where the element at (i, j) is at index i * columns + j. 
+             Arithmetic is applied to whole rows or the whole matrix at once rather than element by element.
+             Cells of floating point matrices start empty & empty cells are stored as NaN.
+
+    Attributes:
+    -----------
+    data: numpy.ndarray | array.array
+        The underlying array that stores the elements in the matrix 
+    rows: int
+        The number of rows in the matrix     
+    columns: int
+        The number of columns in the matrix 
+    dtype: str
+        The array.array typecode of the elements, "d" for floats by default
+    backend: str
+        "numpy" or "python"
+    mmap: mmap.mmap | None
+        The memory map of the file storing the matrix, if opened with openMmap
+    
+    Methods:
+    --------
+    openMmap(path, rows, cols, dtype, backend)
+        Opens a matrix stored in a file
+    flush() / close()
+        Writes a memory mapped matrix back to its file & closes it
+    insert(val, row, column)
+        Inserts and overwrites a value into the matrix at a given position 
+    remove(row, column)
+        Empties the cell at a given position
+    search(target)
+        Checks if a value is in the matrix
+    add(m, workers)
+        Adds a matrix, row, column or scalar to the matrix
+    subtract(m, workers)
+        Subtracts a matrix, row, column or scalar from the matrix
+    scalarMultiply(k, workers)
+        Multiplies the matrix by a scalar
+    elementwise(m, op)
+        Applies a binary function elementwise with a matrix, row, column or scalar
+    multiply(m, blockSize, threshold, workers)
+        Returns the matrix product with another matrix
+    transpose()
+        Returns the transpose of the matrix
+    sum(axis) / min(axis) / max(axis) / mean(axis)
+        Reductions over the whole matrix, each column (axis 0) or each row (axis 1), ignoring empty cells
+    tolist()
+        Returns the rows of the matrix as lists with None for empty cells
+    print()
+        Prints contents of the matrix
+    dump(fileobj) / load(fileobj)
+        Writes to or reads from a binary file object
+    """
+
+    mmap: 'mmap.mmap | None' = None
+
+    def __init__(self, rows: int, cols: int, dtype: str = "d", backend: str | None = None) -> None:
+        if backend is None:
+            backend = "numpy" if np is not None else "python"
+        if backend not in ("numpy", "python"):
+            raise ValueError("Backend must be either numpy or python")
+        if backend == "numpy" and np is None:
+            raise ImportError("numpy is not installed")
+        if _typecode(dtype) is None:
+            raise TypeError("Matrix elements must be a numeric type")
+
+        self.rows: int = rows
+        self.columns: int = cols
+        self.dtype: str = _typecode(dtype)
+        self.backend: str = backend
+        fill: float = _EMPTY if self.dtype in _FLOAT_TYPECODES else 0
+        if backend == "numpy":
+            self.data = np.full((rows, cols), fill, dtype=self.dtype)
+        else:
+            self.data = array.array(self.dtype, [fill]) * (rows * cols)
+
+    def __len__(self) -> int:
+        return self.rows
+
+    def __iter__(self) -> Iterator:
+        """ Iterates over views of the rows of the matrix """
+
+        for i in range(self.rows):
+            yield self[i]
+
+    def __contains__(self, val: any) -> bool:
+        return self.search(val)
+
+    def __getitem__(self, index: int | slice | tuple) -> any:
+        """
+        Returns the element at a given (row, column) position, None if the cell is empty, 
+        a view of a given row that also reads empty cells as None, or a raw view of a contiguous slice of rows
+
+        :raises IndexError: If the row or column is out of matrix bounds
+        """
+
+        if isinstance(index, tuple):
+            row, column = index
+            row = _checkIndex(row, self.rows)
+            column = _checkIndex(column, self.columns)
+            if self.backend == "numpy":
+                val: any = self.data[row, column].item()
+            else:
+                val = self.data[row * self.columns + column]
+            return None if val != val else val
+
+        if isinstance(index, slice):
+            rows: range = range(self.rows)[index]
+            if rows.step != 1:
+                raise IndexError("Only contiguous slices of rows are supported")
+            start, stop = rows.start, max(rows.start, rows.stop)
+        else:
+            return _MatrixRow(self, _checkIndex(index, self.rows))
+        if self.backend == "numpy":
+            return self.data[start:stop]
+        # The flat data of a matrix is never resized, so rows can be viewed with a memoryview
+        return memoryview(self.data)[start * self.columns:stop * self.columns]
+
+    def __add__(self, m: 'Matrix | int | float') -> 'Matrix':
+        return self.__result(self.__apply(m, operator.add))
+
+    def __sub__(self, m: 'Matrix | int | float') -> 'Matrix':
+        return self.__result(self.__apply(m, operator.sub))
+
+    def __mul__(self, m: 'Matrix | int | float') -> 'Matrix':
+        return self.__result(self.__apply(m, operator.mul))
+
+    def __rmul__(self, k: int | float) -> 'Matrix':
+        return self.__result(self.__apply(k, operator.mul))
+
+    def __truediv__(self, m: 'Matrix | int | float') -> 'Matrix':
+        return self.__result(self.__apply(m, operator.truediv))
+
+    def __matmul__(self, m: 'Matrix') -> 'Matrix':
+        return self.multiply(m)
+
+    @classmethod
+    def fromList(cls, values: list, dtype: str = "d", backend: str | None = None) -> 'Matrix':
+        """
+        Creates a matrix from a list of rows, None values become empty cells
+
+        :raises Exception: If the rows are not all the same length
+        """
+
+        rows: int = len(values)
+        cols: int = len(values[0]) if rows else 0
+        if any(len(row) != cols for row in values):
+            raise Exception("Rows must all be the same length")
+
+        m: Matrix = cls(rows, cols, dtype, backend)
+        flat: list = [_EMPTY if val is None else val for row in values for val in row]
+        if m.backend == "numpy":
+            m.data = np.array(flat, dtype=m.dtype).reshape(rows, cols)
+        else:
+            m.data = array.array(m.dtype, flat)
+        return m
+
+    @classmethod
+    def openMmap(cls, path: str, rows: int, cols: int, dtype: str = "d", backend: str | None = None) -> 'Matrix':
+        """
+        Opens a matrix stored in a file, creating it with every cell set to 0 if it does not exist. 
+        Cells are read & written through a memory map, so the file is paged in as it is used, rows are 
+        views of it & in place arithmetic writes straight back to it
+
+        :raises ValueError: If the file holds a matrix of a different shape or dtype
+        """
+
+        m: Matrix = cls(0, 0, dtype, backend)
+        m.mmap, _ = _openMmap(path, m.dtype, rows, cols)
+        m.rows, m.columns = rows, cols
+        if m.backend == "numpy":
+            m.data = np.ndarray((rows, cols), dtype=m.dtype, buffer=m.mmap, offset=_MMAP_HEADER.size)
+        else:
+            m.data = memoryview(m.mmap)[_MMAP_HEADER.size:].cast(m.dtype)
+        return m
+
+    def flush(self) -> None:
+        """
+        Writes the changes to a memory mapped matrix to disk
+        """
+
+        if self.mmap is not None:
+            self.mmap.flush()
+
+    def close(self) -> None:
+        """
+        Flushes & unmaps a memory mapped matrix, any views of it must be released first
+        """
+
+        if self.mmap is not None:
+            self.flush()
+            if isinstance(self.data, memoryview):
+                self.data.release()
+            self.data = None
+            self.mmap.close()
+
+    @classmethod
+    def zeros(cls, rows: int, cols: int, dtype: str = "d", backend: str | None = None) -> 'Matrix':
+        """
+        Creates a matrix with every cell set to 0
+        """
+
+        m: Matrix = cls(rows, cols, dtype, backend)
+        if m.backend == "numpy":
+            m.data.fill(0)
+        else:
+            m.data = array.array(m.dtype, [0]) * (rows * cols)
+        return m
+
+    def insert(self, val: any, row: int, column: int) -> None:
+        """ 
+        Inserts and overwrites a value into the matrix at a given position 
+
+        :raises IndexError: If the row or column is out of matrix bounds
+        """
+
+        row = _checkIndex(row, self.rows)
+        column = _checkIndex(column, self.columns)
+        if self.backend == "numpy":
+            self.data[row, column] = val
+        else:
+            self.data[row * self.columns + column] = val
+    
+    def remove(self, row: int, column: int) -> None:
+        """
+        Removes an element from the matrix at a specified index
+
+        :raises: Exception: If the index specified is empty
+        :raises: TypeError: If the matrix stores integers which cannot be empty
+        """
+
+        if self[row, column] == None:
+            raise Exception("Cannot remove empty element")
+        if self.dtype not in _FLOAT_TYPECODES:
+            raise TypeError("Cells of an integer matrix cannot be empty")
+        
+        self.insert(_EMPTY, row, column)
+    
+    def search(self, target: any) -> bool:
+        """
+        Searches for an element within the matrix, return True if found else False.
+        Searching for None checks for an empty cell
+        """
+
+        if self.backend == "numpy":
+            if target is None:
+                return bool(np.isnan(self.data).any()) if self.dtype in _FLOAT_TYPECODES else False
+            return bool((self.data == target).any())
+
+        if target is None:
+            return any(val != val for val in self.data)
+        return target in self.data
+    
+    def add(self, m: 'Matrix | int | float', workers: int = 1) -> None:
+        """
+        Performs matrix addition with another N x M matrix. A 1 x M row, N x 1 column or scalar 
+        is added to every row, column or element respectively
+
+        :param workers: The number of processes to split the rows between
+        :raises Exception: If the matricies are not equal in size
+        """
+
+        self.__update(self.__apply(m, operator.add, workers))
+
+    def subtract(self, m: 'Matrix | int | float', workers: int = 1) -> None:
+        """
+        Performs matrix subtraction with another N x M matrix. A 1 x M row, N x 1 column or scalar 
+        is subtracted from every row, column or element respectively
+
+        :param workers: The number of processes to split the rows between
+        :raises Exception: If the matricies are not equal in size
+        """
+
+        self.__update(self.__apply(m, operator.sub, workers))
+    
+    def scalarMultiply(self, k: int | float, workers: int = 1) -> None:
+        """
+        Multiplies matrix by given scalar k, empty cells stay empty
+
+        :param workers: The number of processes to split the rows between
+        """
+        
+        self.__update(self.__apply(k, operator.mul, workers))
+
+    def elementwise(self, m: 'Matrix | int | float', op: Callable) -> 'Matrix':
+        """
+        Returns a new matrix from applying a binary function elementwise with another matrix, 
+        row, column or scalar. With numpy op is called once with whole arrays, so must be a 
+        numpy ufunc or a function built from them (e.g. operator.pow, np.maximum)
+
+        :raises Exception: If the matricies are not compatible in size
+        """
+
+        return self.__result(self.__apply(m, op))
+
+    def multiply(self, m: 'Matrix', blockSize: int = 64, threshold: int | None = 128, workers: int = 1) -> 'Matrix':
+        """
+        Returns the matrix product of this N x K matrix with a K x M matrix
+
+        Without numpy the product is computed tile by tile over the transpose of m, and Strassen's 
+        algorithm is used once every dimension exceeds the threshold, no dimension is more than twice 
+        another (so padding to a square stays cheap) & neither matrix has empty cells
+
+        :param blockSize: The side length of the tiles multiplied at a time
+        :param threshold: The size at or below which Strassen's algorithm falls back to tiled multiplication, None to never use it
+        :param workers: The number of processes to split the rows of the product between
+        :raises Exception: If the number of columns does not match the number of rows of m
+        """
+
+        if self.columns != m.rows:
+            raise Exception("Number of columns must match number of rows of other matrix")
+        if blockSize < 1:
+            raise ValueError("Block size must be positive")
+        if workers > 1 and self.rows > 1:
+            return self.__result(self.__parallel(m, "matmul", workers, blockSize, threshold))
+
+        if self.backend == "numpy":
+            return self.__result((self.data @ self.__asArray(m), self.rows, m.columns))
+
+        m = self.__asPython(m)
+        a: list = self.__pyRows(self)
+        dims: tuple = (self.rows, self.columns, m.columns)
+        if threshold is not None and min(dims) > threshold and max(dims) <= 2 * min(dims) and \
+                not self.__hasEmpty() and not m.__hasEmpty():
+            # Pad to a square so every level of the recursion splits into equal quadrants
+            size: int = max(self.rows, self.columns, m.columns)
+            b: list = self.__pyRows(m)
+            rows: list = Matrix.__strassen(Matrix.__pad(a, size), Matrix.__pad(b, size), blockSize, max(threshold, 1))
+            rows = [row[:m.columns] for row in rows[:self.rows]]
+        else:
+            rows = Matrix.__tiled(a, self.__pyRows(m.transpose()), blockSize)
+        return self.__result((self.__pyArray(chain.from_iterable(rows), m), self.rows, m.columns))
+
+    def transpose(self) -> 'Matrix':
+        """
+        Returns the transpose of the matrix
+        """
+
+        if self.backend == "numpy":
+            return self.__result((self.data.T.copy(), self.columns, self.rows))
+
+        data: array.array = array.array(self.dtype)
+        for j in range(self.columns):
+            data.extend(self.data[j::self.columns])
+        return self.__result((data, self.columns, self.rows))
+
+    def sum(self, axis: int | None = None) -> 'float | Matrix':
+        """
+        Returns the sum of the matrix, or a 1 x M matrix of column sums (axis 0) 
+        or N x 1 matrix of row sums (axis 1), ignoring empty cells
+        """
+
+        return self.__reduce(axis, "nansum", sum)
+
+    def min(self, axis: int | None = None) -> 'float | Matrix':
+        """
+        Returns the minimum of the matrix, each column (axis 0) or each row (axis 1), ignoring empty cells
+        """
+
+        return self.__reduce(axis, "nanmin", min)
+
+    def max(self, axis: int | None = None) -> 'float | Matrix':
+        """
+        Returns the maximum of the matrix, each column (axis 0) or each row (axis 1), ignoring empty cells
+        """
+
+        return self.__reduce(axis, "nanmax", max)
+
+    def mean(self, axis: int | None = None) -> 'float | Matrix':
+        """
+        Returns the mean of the matrix, each column (axis 0) or each row (axis 1), ignoring empty cells
+        """
+
+        return self.__reduce(axis, "nanmean", lambda vals: sum(vals) / len(vals))
+
+    def tolist(self) -> list:
+        """
+        Returns the rows of the matrix as lists with None for empty cells
+        """
+
+        return [[self[i, j] for j in range(self.columns)] for i in range(self.rows)]
+         
+    def dump(self, fileobj: any) -> None:
+        """
+        Writes the matrix to a binary file object, its cells as a raw row-major buffer
+        """
+
+        _dump(fileobj, self, [self.rows, self.columns], self.data)
+
+    @classmethod
+    def load(cls, fileobj: any, backend: str | None = None) -> 'Matrix':
+        """
+        Reads a matrix written by dump from a binary file object
+
+        :raises ValueError: If the file does not hold a dump of this class
+        """
+
+        (rows, cols), data = _load(fileobj, cls)
+        m: Matrix = cls(0, 0, data.typecode, backend)
+        m.rows, m.columns = rows, cols
+        m.data = np.frombuffer(data, dtype=data.typecode).reshape(rows, cols) if m.backend == "numpy" else data
+        return m
+
+    def print(self) -> None:
+        """
+        Prints contents of the matrix
+        """
+
+        for row in self.tolist():
+            for val in row:
+                print(val, end=" ")
+            print()
+
+    def __apply(self, m: 'Matrix | int | float', op: Callable, workers: int = 1) -> tuple:
+        """ Applies op elementwise with broadcasting, returns the resulting data & its shape """
+
+        if isinstance(m, Matrix):
+            self.__checkBroadcast(m)
+        if workers > 1 and self.rows > 1:
+            return self.__parallel(m, op.__name__, workers)
+
+        if self.backend == "numpy":
+            return op(self.data, self.__asArray(m) if isinstance(m, Matrix) else m), self.rows, self.columns
+
+        if isinstance(m, Matrix):
+            m = self.__asPython(m)
+        if not isinstance(m, Matrix):
+            other: Iterable = repeat(m)
+        elif m.rows == self.rows and m.columns == self.columns:
+            other = m.data
+        elif m.rows == 1 and m.columns == self.columns:
+            other = chain.from_iterable(repeat(m.data, self.rows))
+        else:
+            other = chain.from_iterable(repeat(val, self.columns) for val in m.data)
+
+        floating: bool = op is operator.truediv or self.dtype in _FLOAT_TYPECODES or \
+            (m.dtype in _FLOAT_TYPECODES if isinstance(m, Matrix) else type(m) == float)
+        return array.array("d" if floating else self.dtype, map(op, self.data, other)), self.rows, self.columns
+
+    def __parallel(self, m: 'Matrix | int | float', op: str, workers: int, *args: any) -> tuple:
+        """ 
+        Splits the rows of the result of an operation into one block per worker process. The operands & 
+        result are passed through shared memory, only their descriptions are sent to the workers
+        """
+
+        cols: int = m.columns if op == "matmul" else self.columns
+        if self.backend == "numpy":
+            dtype: str = np.result_type(self.data.dtype, np.dtype(m.dtype) if isinstance(m, Matrix) else m).char
+        else:
+            floating: bool = self.dtype in _FLOAT_TYPECODES or \
+                (m.dtype in _FLOAT_TYPECODES if isinstance(m, Matrix) else type(m) == float)
+            dtype = "d" if floating else self.dtype
+
+        segments: list = []
+        try:
+            a: tuple = _shareMatrix(self, segments)
+            b: any = _shareMatrix(m, segments) if isinstance(m, Matrix) else m
+            out: Matrix = Matrix.zeros(self.rows, cols, dtype, self.backend)
+            result: tuple = _shareMatrix(out, segments)
+            workers = min(workers, self.rows)
+            bounds: list = [self.rows * i // workers for i in range(workers + 1)]
+            tasks: list = [(op, bounds[i], bounds[i + 1], a, b, result, args) for i in range(workers)]
+            list(_pool(workers).map(_matrixBlock, tasks))
+            view: memoryview = memoryview(out.data).cast("B")
+            view[:] = segments[-1].buf[:len(view)]
+            view.release()
+        finally:
+            for shm in segments:
+                shm.close()
+                shm.unlink()
+        return out.data, self.rows, cols
+
+    def __checkBroadcast(self, m: 'Matrix') -> None:
+        if (m.rows, m.columns) in ((self.rows, self.columns), (1, self.columns), (self.rows, 1)):
+            return
+        raise Exception("Matricies my be the same size")
+
+    def __asArray(self, m: 'Matrix') -> any:
+        """ Returns the data of another matrix as a 2D numpy array """
+
+        if m.backend == "numpy":
+            return m.data
+        return np.frombuffer(m.data, dtype=m.dtype).reshape(m.rows, m.columns)
+
+    def __asPython(self, m: 'Matrix') -> 'Matrix':
+        """ Returns another matrix with its data in a flat array.array """
+
+        if m.backend == "python":
+            return m
+        return m.__result((array.array(m.dtype, m.data.ravel().tobytes()), m.rows, m.columns), "python")
+
+    def __pyArray(self, values: list, m: 'Matrix') -> array.array:
+        floating: bool = self.dtype in _FLOAT_TYPECODES or m.dtype in _FLOAT_TYPECODES
+        return array.array("d" if floating else self.dtype, values)
+
+    def __pyRows(self, m: 'Matrix') -> list:
+        """ Returns the rows of a python backed matrix as lists """
+
+        return [m.data[i * m.columns:(i + 1) * m.columns].tolist() for i in range(m.rows)]
+
+    def __hasEmpty(self) -> bool:
+        return self.dtype in _FLOAT_TYPECODES and any(val != val for val in self.data)
+
+    @staticmethod
+    def __tiled(a: list, t: list, blockSize: int) -> list:
+        """ 
+        Multiplies the rows a by the columns t of the other matrix, one blockSize square tile at a time 
+        so the slices being multiplied stay small & are reused while they are hot
+        """
+
+        inner: int = len(t[0]) if t else 0
+        out: list = [[0] * len(t) for _ in a]
+        for k in range(0, inner, blockSize):
+            aTile: list = [row[k:k + blockSize] for row in a]
+            tTile: list = [col[k:k + blockSize] for col in t]
+            for i0 in range(0, len(a), blockSize):
+                for j0 in range(0, len(t), blockSize):
+                    cols: list = tTile[j0:j0 + blockSize]
+                    for i in range(i0, min(i0 + blockSize, len(a))):
+                        row, outRow = aTile[i], out[i]
+                        for j, col in enumerate(cols, j0):
+                            outRow[j] += sum(map(operator.mul, row, col))
+        return out
+
+    @staticmethod
+    def __strassen(a: list, b: list, blockSize: int, threshold: int) -> list:
+        """ Multiplies two square matrices given as lists of rows using seven half sized products """
+
+        n: int = len(a)
+        if n <= threshold:
+            return Matrix.__tiled(a, [list(col) for col in zip(*b)], blockSize)
+        if n % 2:
+            rows: list = Matrix.__strassen(Matrix.__pad(a, n + 1), Matrix.__pad(b, n + 1), blockSize, threshold)
+            return [row[:n] for row in rows[:n]]
+
+        h: int = n // 2
+        add = lambda x, y: [list(map(operator.add, r, s)) for r, s in zip(x, y)]
+        sub = lambda x, y: [list(map(operator.sub, r, s)) for r, s in zip(x, y)]
+        a11, a12 = [row[:h] for row in a[:h]], [row[h:] for row in a[:h]]
+        a21, a22 = [row[:h] for row in a[h:]], [row[h:] for row in a[h:]]
+        b11, b12 = [row[:h] for row in b[:h]], [row[h:] for row in b[:h]]
+        b21, b22 = [row[:h] for row in b[h:]], [row[h:] for row in b[h:]]
+
+        product = lambda x, y: Matrix.__strassen(x, y, blockSize, threshold)
+        m1: list = product(add(a11, a22), add(b11, b22))
+        m2: list = product(add(a21, a22), b11)
+        m3: list = product(a11, sub(b12, b22))
+        m4: list = product(a22, sub(b21, b11))
+        m5: list = product(add(a11, a12), b22)
+        m6: list = product(sub(a21, a11), add(b11, b12))
+        m7: list = product(sub(a12, a22), add(b21, b22))
+
+        c11: list = add(sub(add(m1, m4), m5), m7)
+        c12: list = add(m3, m5)
+        c21: list = add(m2, m4)
+        c22: list = add(add(sub(m1, m2), m3), m6)
+        return [r + s for r, s in zip(c11, c12)] + [r + s for r, s in zip(c21, c22)]
+
+    @staticmethod
+    def __pad(rows: list, size: int) -> list:
+        """ Pads a list of rows with zeros up to a size x size square """
+
+        padded: list = [row + [0] * (size - len(row)) for row in rows]
+        return padded + [[0] * size for _ in range(size - len(rows))]
+
+    def __update(self, result: tuple) -> None:
+        if self.mmap is not None:
+            # Write into the mapped file rather than replacing it, which needs the element type to stay the same
+            code: str = result[0].typecode if self.backend == "python" else result[0].dtype.char
+            if (code in _FLOAT_TYPECODES) != (self.dtype in _FLOAT_TYPECODES) or \
+                    array.array(code).itemsize != array.array(self.dtype).itemsize:
+                raise TypeError("Result must have the same type as the memory mapped matrix")
+            self.data[:] = result[0] if self.backend == "numpy" else array.array(self.dtype, result[0])
+            return
+        self.data = result[0]
+        self.dtype = self.data.typecode if self.backend == "python" else self.data.dtype.char
+
+    def __result(self, result: tuple, backend: str | None = None) -> 'Matrix':
+        data, rows, cols = result
+        m: Matrix = Matrix.__new__(Matrix)
+        m.rows, m.columns, m.data = rows, cols, data
+        m.backend = backend or self.backend
+        m.dtype = data.typecode if m.backend == "python" else data.dtype.char
+        return m
+
+    def __reduce(self, axis: int | None, npName: str, pyFn: Callable) -> 'float | Matrix':
+        if axis not in (None, 0, 1):
+            raise ValueError("Axis must be None, 0 or 1")
+
+        if self.backend == "numpy":
+            if axis is None:
+                return getattr(np, npName)(self.data).item()
+            values = getattr(np, npName)(self.data, axis=axis, keepdims=True).astype("d")
+            return self.__result((values, values.shape[0], values.shape[1]))
+
+        def reduce(vals: Iterable) -> float:
+            # Like numpy, the sum of no cells is 0 while other reductions of no cells are empty
+            present: list = [val for val in vals if val == val]
+            return pyFn(present) if present else 0.0 if npName == "nansum" else _EMPTY
+
+        if axis is None:
+            return reduce(self.data)
+        if axis == 0:
+            values = array.array("d", (reduce(self.data[j::self.columns]) for j in range(self.columns)))
+            return self.__result((values, 1, self.columns))
+        values = array.array("d", (reduce(self.data[i * self.columns:(i + 1) * self.columns]) for i in range(self.rows)))
+        return self.__result((values, self.rows, 1))
+
+
+class SparseMatrix:
+    """
+    SparseMatrix - The shared behaviour of the sparse matrix formats, which only store the nonzero 
+                   cells of a matrix so their memory is proportional to the number of nonzeros.
+                   Cells that are not stored are zero, & Matrix cells that are empty or zero are not stored
+
+    Attributes:
+    -----------
+    rows: int
+        The number of rows in the matrix
+    columns: int
+        The number of columns in the matrix
+    dtype: str
+        The array.array typecode of the stored values
+    values: array.array
+        The stored values
+
+    Methods:
+    --------
+    nnz()
+        Returns the number of stored values
+    fromMatrix(m)
+        Creates a sparse matrix from the nonzero cells of a dense Matrix
+    toMatrix(backend)
+        Returns a dense Matrix with the stored values & zeros elsewhere
+    toCOO() / toCSR() / toCSC()
+        Converts to another sparse format
+    multiply(m)
+        Returns the matrix product with a dense Matrix or another sparse matrix
+    elementwise(m, op)
+        Applies a binary function elementwise with another sparse matrix or a scalar
+    dump(fileobj) / load(fileobj)
+        Writes to or reads from a binary file object
+    """
+
+    def __len__(self) -> int:
+        return self.rows
+
+    def __add__(self, m: 'SparseMatrix') -> 'CSRMatrix':
+        return self.elementwise(m, operator.add)
+
+    def __sub__(self, m: 'SparseMatrix') -> 'CSRMatrix':
+        return self.elementwise(m, operator.sub)
+
+    def __mul__(self, m: 'SparseMatrix | int | float') -> 'CSRMatrix':
+        return self.elementwise(m, operator.mul)
+
+    def __rmul__(self, k: int | float) -> 'CSRMatrix':
+        return self.elementwise(k, operator.mul)
+
+    def __truediv__(self, k: int | float) -> 'CSRMatrix':
+        return self.elementwise(k, operator.truediv)
+
+    def __matmul__(self, m: 'Matrix | SparseMatrix') -> 'Matrix | CSRMatrix':
+        return self.multiply(m)
+
+    def nnz(self) -> int:
+        return len(self.values)
+
+    @classmethod
+    def fromMatrix(cls, m: 'Matrix') -> 'SparseMatrix':
+        """
+        Creates a sparse matrix from the cells of a dense matrix that are neither empty nor zero
+        """
+
+        coo: COOMatrix = COOMatrix(m.rows, m.columns, m.dtype)
+        for i, row in enumerate(m.tolist()):
+            for j, val in enumerate(row):
+                if val:
+                    coo.insert(val, i, j)
+        return coo if cls is COOMatrix else cls.fromCOO(coo)
+
+    def toMatrix(self, backend: str | None = None) -> 'Matrix':
+        """
+        Returns a dense matrix holding the stored values with zeros in every other cell
+        """
+
+        coo: COOMatrix = self.toCOO()
+        m: Matrix = Matrix.zeros(self.rows, self.columns, self.dtype, backend)
+        if m.backend == "numpy":
+            np.add.at(m.data, (np.asarray(coo.rowIndices), np.asarray(coo.colIndices)), np.asarray(coo.values))
+        else:
+            for row, column, val in zip(coo.rowIndices, coo.colIndices, coo.values):
+                m.data[row * self.columns + column] += val
+        return m
+
+    def toCSR(self) -> 'CSRMatrix':
+        return CSRMatrix.fromCOO(self.toCOO())
+
+    def toCSC(self) -> 'CSCMatrix':
+        return CSCMatrix.fromCOO(self.toCOO())
+
+    def dump(self, fileobj: any) -> None:
+        """
+        Writes the matrix to a binary file object, its index & value arrays as raw buffers
+        """
+
+        _dump(fileobj, self, [self.rows, self.columns], *(getattr(self, name) for name in self._arrays))
+
+    @classmethod
+    def load(cls, fileobj: any) -> 'SparseMatrix':
+        """
+        Reads a matrix written by dump from a binary file object
+
+        :raises ValueError: If the file does not hold a dump of this class
+        """
+
+        (rows, cols), *arrays = _load(fileobj, cls)
+        m: SparseMatrix = cls(rows, cols, arrays[-1].typecode)
+        for name, values in zip(cls._arrays, arrays):
+            setattr(m, name, values)
+        return m
+
+    def multiply(self, m: 'Matrix | SparseMatrix') -> 'Matrix | CSRMatrix':
+        """
+        Returns the matrix product of this N x K matrix with a K x M matrix. The product with a 
+        dense Matrix is a dense Matrix, the product with a sparse matrix is a CSR matrix
+
+        :raises Exception: If the number of columns does not match the number of rows of m
+        """
+
+        if self.columns != m.rows:
+            raise Exception("Number of columns must match number of rows of other matrix")
+
+        a: CSRMatrix = self.toCSR()
+        if isinstance(m, Matrix):
+            return a.__denseProduct(m)
+
+        # Gustavson's algorithm: each row of the product is a sum of the rows of b scaled by row i of a
+        b: CSRMatrix = m.toCSR()
+        indptr: array.array = array.array("q", [0])
+        indices: array.array = array.array("q")
+        values: list = []
+        for i in range(a.rows):
+            row: dict = {}
+            for k in range(a.indptr[i], a.indptr[i + 1]):
+                val: any = a.values[k]
+                inner: int = a.indices[k]
+                for p in range(b.indptr[inner], b.indptr[inner + 1]):
+                    column: int = b.indices[p]
+                    row[column] = row.get(column, 0) + val * b.values[p]
+            for column in sorted(row):
+                if row[column]:
+                    indices.append(column)
+                    values.append(row[column])
+            indptr.append(len(indices))
+        return CSRMatrix._build(a.rows, b.columns, indptr, indices, values, a.dtype, b.dtype)
+
+    def elementwise(self, m: 'SparseMatrix | int | float', op: Callable) -> 'CSRMatrix':
+        """
+        Returns a new CSR matrix from applying a binary function elementwise with another sparse 
+        matrix of the same size, or with a scalar. A scalar is only applied to the stored values, 
+        so it is only accepted when op(0, scalar) is 0 (e.g. multiplying or dividing)
+
+        :raises Exception: If the matricies are not equal in size
+        :raises TypeError: If applying op with a scalar would change the cells that are not stored
+        """
+
+        a: CSRMatrix = self.toCSR()
+        if not isinstance(m, SparseMatrix):
+            if op(0, m) != 0:
+                raise TypeError("Scalar operation would change the zero cells, convert with toMatrix() first")
+            return CSRMatrix._build(a.rows, a.columns, a.indptr, a.indices, list(map(op, a.values, repeat(m))), 
+                                    a.dtype, _typecode(type(m)) or "d")
+        if (m.rows, m.columns) != (self.rows, self.columns):
+            raise Exception("Matricies must be the same size")
+
+        # Merge the sorted column indexes of each pair of rows, missing cells are zero
+        b: CSRMatrix = m.toCSR()
+        indptr: array.array = array.array("q", [0])
+        indices: array.array = array.array("q")
+        values: list = []
+        for i in range(a.rows):
+            p, pEnd = a.indptr[i], a.indptr[i + 1]
+            q, qEnd = b.indptr[i], b.indptr[i + 1]
+            while p < pEnd or q < qEnd:
+                if q == qEnd or (p < pEnd and a.indices[p] < b.indices[q]):
+                    column, val = a.indices[p], op(a.values[p], 0)
+                    p += 1
+                elif p == pEnd or b.indices[q] < a.indices[p]:
+                    column, val = b.indices[q], op(0, b.values[q])
+                    q += 1
+                else:
+                    column, val = a.indices[p], op(a.values[p], b.values[q])
+                    p += 1
+                    q += 1
+                if val:
+                    indices.append(column)
+                    values.append(val)
+            indptr.append(len(indices))
+        return CSRMatrix._build(a.rows, a.columns, indptr, indices, values, a.dtype, b.dtype)
+
+    def __denseProduct(self, m: 'Matrix') -> 'Matrix':
+        """ Multiplies a CSR matrix by a dense matrix, scaling & summing the rows of m picked out by each row """
+
+        floating: bool = self.dtype in _FLOAT_TYPECODES or m.dtype in _FLOAT_TYPECODES
+        out: Matrix = Matrix.zeros(self.rows, m.columns, "d" if floating else self.dtype, m.backend)
+        if m.backend == "numpy":
+            if self.nnz():
+                rowIds = np.repeat(np.arange(self.rows), np.diff(np.asarray(self.indptr)))
+                values = np.asarray(self.values)[:, None] * m.data[np.asarray(self.indices)]
+                np.add.at(out.data, rowIds, values)
+            return out
+
+        cols: int = m.columns
+        for i in range(self.rows):
+            row: list = [0] * cols
+            for k in range(self.indptr[i], self.indptr[i + 1]):
+                inner: int = self.indices[k]
+                row = list(map(operator.add, row, map(operator.mul, repeat(self.values[k]), m.data[inner * cols:(inner + 1) * cols])))
+            out.data[i * cols:(i + 1) * cols] = array.array(out.dtype, row)
+        return out
+
+
+class COOMatrix(SparseMatrix):
+    """
+    COOMatrix - A sparse matrix stored as parallel arrays of (row, column, value) triples in insertion
+                order, for building a matrix before converting it to CSR or CSC. 
+                Triples inserted for the same cell are summed
+
+    Attributes:
+    -----------
+    rowIndices: array.array
+        The row of each stored value
+    colIndices: array.array
+        The column of each stored value
+
+    Methods:
+    --------
+    insert(val, row, column)
+        Adds a value to the matrix at a given position
+    transpose()
+        Returns the transpose of the matrix
+    """
+
+    _arrays: tuple = ("rowIndices", "colIndices", "values")
+
+    def __init__(self, rows: int, cols: int, dtype: str = "d") -> None:
+        self.rows: int = rows
+        self.columns: int = cols
+        self.dtype: str = _typecode(dtype)
+        if self.dtype is None:
+            raise TypeError("Matrix elements must be a numeric type")
+        self.rowIndices: array.array = array.array("q")
+        self.colIndices: array.array = array.array("q")
+        self.values: array.array = array.array(self.dtype)
+
+    def insert(self, val: any, row: int, column: int) -> None:
+        """
+        Adds a value to the matrix at a given position
+
+        :raises IndexError: If the row or column is out of matrix bounds
+        """
+
+        self.rowIndices.append(_checkIndex(row, self.rows))
+        self.colIndices.append(_checkIndex(column, self.columns))
+        self.values.append(val)
+
+    def transpose(self) -> 'COOMatrix':
+        """
+        Returns the transpose of the matrix, sharing the arrays of this matrix
+        """
+
+        m: COOMatrix = COOMatrix(self.columns, self.rows, self.dtype)
+        m.rowIndices, m.colIndices, m.values = self.colIndices, self.rowIndices, self.values
+        return m
+
+    def toCOO(self) -> 'COOMatrix':
+        return self
+
+
+class _CompressedMatrix(SparseMatrix):
+    """
+    The shared implementation of CSR & CSC. The values along each major line (rows for CSR, 
+    columns for CSC) are stored contiguously sorted by their minor index, & line i occupies 
+    indices[indptr[i]:indptr[i + 1]]
+    """
+
+    byRow: bool = True
+    _arrays: tuple = ("indptr", "indices", "values")
+
+    def __init__(self, rows: int, cols: int, dtype: str = "d") -> None:
+        self.rows: int = rows
+        self.columns: int = cols
+        self.dtype: str = _typecode(dtype)
+        if self.dtype is None:
+            raise TypeError("Matrix elements must be a numeric type")
+        self.indptr: array.array = array.array("q", [0]) * (self.__shape()[0] + 1)
+        self.indices: array.array = array.array("q")
+        self.values: array.array = array.array(self.dtype)
+
+    def __shape(self) -> tuple:
+        """ Returns the number of major & minor lines """
+
+        return (self.rows, self.columns) if self.byRow else (self.columns, self.rows)
+
+    def __getitem__(self, index: int | slice | tuple) -> any:
+        """
+        Returns the value at a given (row, column) position, or a matrix of the rows of a CSR 
+        matrix or the columns of a CSC matrix selected by an index or slice
+
+        :raises IndexError: If the row or column is out of matrix bounds
+        """
+
+        major, minor = self.__shape()
+        if isinstance(index, tuple):
+            row, column = _checkIndex(index[0], self.rows), _checkIndex(index[1], self.columns)
+            line, target = (row, column) if self.byRow else (column, row)
+            pos: int = bisect_left(self.indices, target, self.indptr[line], self.indptr[line + 1])
+            if pos < self.indptr[line + 1] and self.indices[pos] == target:
+                return self.values[pos]
+            return 0
+
+        if isinstance(index, slice):
+            lines: range = range(major)[index]
+            if lines.step != 1:
+                raise IndexError("Only contiguous slices are supported")
+            start, stop = lines.start, max(lines.start, lines.stop)
+        else:
+            start = _checkIndex(index, major)
+            stop = start + 1
+
+        lo, hi = self.indptr[start], self.indptr[stop]
+        indptr: array.array = array.array("q", (ptr - lo for ptr in self.indptr[start:stop + 1]))
+        shape: tuple = (stop - start, minor) if self.byRow else (minor, stop - start)
+        return type(self)._build(*shape, indptr, self.indices[lo:hi], self.values[lo:hi], self.dtype)
+
+    @classmethod
+    def fromCOO(cls, coo: 'COOMatrix') -> '_CompressedMatrix':
+        """
+        Compresses a COO matrix, summing the values inserted for the same cell
+        """
+
+        major, minor = (coo.rowIndices, coo.colIndices) if cls.byRow else (coo.colIndices, coo.rowIndices)
+        m: _CompressedMatrix = cls(coo.rows, coo.columns, coo.dtype)
+        counts: list = [0] * len(m.indptr)
+        prev: tuple | None = None
+        for k in sorted(range(coo.nnz()), key=lambda k: (major[k], minor[k])):
+            cell: tuple = (major[k], minor[k])
+            if cell == prev:
+                m.values[-1] += coo.values[k]
+                continue
+            prev = cell
+            counts[cell[0] + 1] += 1
+            m.indices.append(cell[1])
+            m.values.append(coo.values[k])
+        m.indptr = array.array("q", accumulate(counts))
+        return m
+
+    @classmethod
+    def _build(cls, rows: int, cols: int, indptr: array.array, indices: array.array, values: Iterable, *dtypes: str) -> '_CompressedMatrix':
+        """ 
+        Creates a matrix from its arrays. The values keep the dtype of the operands when they all 
+        share it & every value fits, otherwise they are stored as floats
+        """
+
+        values = list(values)
+        dtype: str = dtypes[0] if all(dtype == dtypes[0] for dtype in dtypes) else "d"
+        if dtype not in _FLOAT_TYPECODES and not all(isinstance(val, int) for val in values):
+            dtype = "d"
+        m: _CompressedMatrix = cls.__new__(cls)
+        m.rows, m.columns, m.dtype = rows, cols, dtype
+        m.indptr, m.indices, m.values = indptr, indices, array.array(m.dtype, values)
+        return m
+
+    def transpose(self) -> '_CompressedMatrix':
+        """
+        Returns the transpose of the matrix in the other compressed format, sharing the arrays of this matrix
+        """
+
+        cls: type = CSCMatrix if self.byRow else CSRMatrix
+        m: _CompressedMatrix = cls.__new__(cls)
+        m.rows, m.columns, m.dtype = self.columns, self.rows, self.dtype
+        m.indptr, m.indices, m.values = self.indptr, self.indices, self.values
+        return m
+
+    def toCOO(self) -> 'COOMatrix':
+        m: COOMatrix = COOMatrix(self.rows, self.columns, self.dtype)
+        lines: array.array = array.array("q")
+        for line in range(len(self.indptr) - 1):
+            lines.extend(repeat(line, self.indptr[line + 1] - self.indptr[line]))
+        m.rowIndices, m.colIndices = (lines, self.indices[:]) if self.byRow else (self.indices[:], lines)
+        m.values = self.values[:]
+        return m
+
+
+class CSRMatrix(_CompressedMatrix):
+    """
+    CSRMatrix - A compressed sparse row matrix, where the column indexes & values of each row are 
+                stored contiguously. Fast for row slicing & multiplying by another matrix
+
+    Attributes:
+    -----------
+    indptr: array.array
+        The offset of the start of each row in indices & values, followed by the number of stored values
+    indices: array.array
+        The column of each stored value, sorted within each row
+
+    Methods:
+    --------
+    transpose()
+        Returns the transpose as a CSC matrix without copying
+    [i] / [start:stop]
+        Returns a CSR matrix of the selected rows
+    [row, column]
+        Returns the value at a position, 0 if it is not stored
+    """
+
+    byRow: bool = True
+
+    def toCSR(self) -> 'CSRMatrix':
+        return self
+
+
+class CSCMatrix(_CompressedMatrix):
+    """
+    CSCMatrix - A compressed sparse column matrix, where the row indexes & values of each column are 
+                stored contiguously. Fast for column slicing
+
+    Attributes:
+    -----------
+    indptr: array.array
+        The offset of the start of each column in indices & values, followed by the number of stored values
+    indices: array.array
+        The row of each stored value, sorted within each column
+
+    Methods:
+    --------
+    transpose()
+        Returns the transpose as a CSR matrix without copying
+    [j] / [start:stop]
+        Returns a CSC matrix of the selected columns
+    [row, column]
+        Returns the value at a position, 0 if it is not stored
+    """
+
+    byRow: bool = False
+
+    def toCSC(self) -> 'CSCMatrix':
+        return self
+
+
+class HashTable:
+    """
+    Hash Table - A structure that creates a mapping between keys and values using hashing  
+                 this implementation uses chaining to deal with collisions
+
+    Attributes:
+    -----------
+    capacity: int
+        The maximum size of the hash table
+    table: list
+        The actual hash table data structure
+
+    Methods:
+    --------
+    __hash(key)
+        Takes a key argument of either type string or int and performs hash function to produce some index 
+    insert(item)
+        Inserts an item into the hash table 
+    remove(item)
+        Removes an item from the hash table 
+    print()
+        Prints the contents of the hash table  
+    __getCapacity()
+        Getter method for capacity
+    dump(fileobj) / load(fileobj)
+        Writes to or reads from a binary file object
+    """
+
+    def __init__(self, capacity: int) -> None:
+        self.capacity: int = capacity
+        self.table: list[list] = [[] for _ in range(capacity)]
+
+    def __hash(self, key: any) -> int:
+        """ 
+        Takes a key argument of either type string or int and performs hash function to produce some index 
+
+        :param key: The key that will be mapped to a value
+        """
+        
+        if type(key) == int:
+            # Use division hash algorithm h(key) = key % capacity
+            return key % self.capacity
+        if type(key) == str:
+            # Use ASCII characters: h(key) = sum(a for c in s) % capacity
+            # where a is ascii value, c is the character, s is the string input
+            return (sum(ord(c) for c in key) % self.capacity)
+
+    def insert(self, item: any) -> None:
+        """ 
+        Inserts an item into the hash table 
+
+        :param item: Item that will be inserted into the hash table
+        """
+        
+        index: int = self.__hash(item)
+        self.table[index].append(item)
+
+    def remove(self, item: any) -> None:
+        """ 
+        Removes an item from the hash table 
+
+        :param item: Item that will be removed from the hash table
+        """
+
+        index: int = self.__hash(item)
+        if item not in self.table[index]:
+            return
+        self.table[index].remove(item)
+    
+    def dump(self, fileobj: any) -> None:
+        """
+        Writes the table to a binary file object as the size of each bucket followed by the items of every bucket
+        """
+
+        _dump(fileobj, self, [self.capacity], [len(bucket) for bucket in self.table], chain.from_iterable(self.table))
+
+    @classmethod
+    def load(cls, fileobj: any) -> 'HashTable':
+        """
+        Reads a table written by dump from a binary file object
+
+        :raises ValueError: If the file does not hold a dump of this class
+        """
+
+        (capacity,), sizes, items = _load(fileobj, cls)
+        table: HashTable = cls(capacity)
+        ends: list = list(accumulate(sizes))
+        table.table = [list(items[start:end]) for start, end in zip(chain((0,), ends), ends)]
+        return table
+
+    def print(self) -> None:
+        """ 
+        Prints the contents of the hash table  
+        """
+        
+        for i in range(self.capacity):
+            print(f"{i}", end="")
+            for j in self.table[i]:
+                print(f" --> {j}", end="")
+            print()
+    
+    def __getCapacity(self) -> int: return self.capacity 
+
+
+class PersistentStack:
+    """
+    Persistent stack - An immutable last-in-first-out (LIFO) stack stored as a linked list of 
+                    (value, next) pairs. push & pop return a new stack in O(1) that shares every 
+                    node with the old one, so keeping old versions as snapshots costs nothing.
+
+    Attributes:
+    -----------
+    head: tuple | None
+        The (value, next) pair at the top of the stack
+    length: int
+        The number of elements in the stack
+
+    Methods:
+    --------
+    push(val)
+        Returns a new stack with a value added to the top
+    pop()
+        Returns a new stack without the top value
+    peek()
+        Returns the top value of the stack
+    print()
+        Prints contents of stack from top to bottom
+    dump(fileobj) / load(fileobj)
+        Writes to or reads from a binary file object
+    """
+
+    def __init__(self, iterable: Iterable | None = None) -> None:
+        self.head: tuple | None = None
+        self.length: int = 0
+        if iterable is not None:
+            for val in iterable:
+                self.head = (val, self.head)
+                self.length += 1
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __iter__(self) -> Iterator:
+        """ Iterates from the top to the bottom of the stack """
+
+        node: tuple | None = self.head
+        while node is not None:
+            yield node[0]
+            node = node[1]
+
+    def push(self, val: any) -> 'PersistentStack':
+        """
+        Returns a new stack with a value added to the top 
+        """
+
+        return self.__new((val, self.head), self.length + 1)
+
+    def pop(self) -> 'PersistentStack':
+        """
+        Returns a new stack without the top value
+
+        :raises Exception: If the stack is empty
+        """
+
+        if self.head is None:
+            raise Exception("Cannot pop from empty stack")
+        return self.__new(self.head[1], self.length - 1)
+
+    def peek(self) -> any:
+        """
+        Returns the top value of the stack
+
+        :raises Exception: If the stack is empty
+        """
+
+        if self.head is None:
+            raise Exception("Cannot peek empty stack")
+        return self.head[0]
+
+    def dump(self, fileobj: any) -> None:
+        """
+        Writes the stack to a binary file object as a flat array of its values from bottom to top
+        """
+
+        _dump(fileobj, self, reversed(list(self)))
+
+    @classmethod
+    def load(cls, fileobj: any) -> 'PersistentStack':
+        """
+        Reads a stack written by dump from a binary file object
+
+        :raises ValueError: If the file does not hold a dump of this class
+        """
+
+        values, = _load(fileobj, cls)
+        return cls(values)
+
+    def print(self) -> None:
+        """
+        Prints contents of stack from top to bottom
+        """
+
+        print(list(self))
+
+    def __new(self, head: tuple | None, length: int) -> 'PersistentStack':
+        stack: PersistentStack = PersistentStack()
+        stack.head = head
+        stack.length = length
+        return stack
+
+
+class PersistentVector:
+    """
+    Persistent vector - An immutable array stored as a tree where each node has up to 32 children, 
+                     with the last (up to) 32 elements kept in a separate tail. Updates copy only 
+                     the path from the root to the changed leaf & return a new vector sharing 
+                     everything else with the old one, so get, set, append & pop take O(log32 n).
+
+    Attributes:
+    -----------
+    length: int
+        The number of elements in the vector
+    shift: int
+        The number of index bits consumed above the leaves, 5 per level
+    root: list
+        The root node of the tree
+    tail: list
+        The last (up to) 32 elements
+
+    Methods:
+    --------
+    get(index)
+        Returns the element at a given index
+    set(index, val)
+        Returns a new vector with the element at a given index replaced
+    append(val)
+        Returns a new vector with a value added to the end
+    pop()
+        Returns a new vector without the last element
+    print()
+        Prints contents of the vector
+    dump(fileobj) / load(fileobj)
+        Writes to or reads from a binary file object
+    """
+
+    BITS: int = 5
+    WIDTH: int = 1 << BITS
+    MASK: int = WIDTH - 1
+
+    def __init__(self, iterable: Iterable | None = None) -> None:
+        self.length: int = 0
+        self.shift: int = self.BITS
+        self.root: list = []
+        self.tail: list = []
+        if iterable is not None:
+            vector: PersistentVector = self
+            for val in iterable:
+                vector = vector.append(val)
+            self.length, self.shift, self.root, self.tail = vector.length, vector.shift, vector.root, vector.tail
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __iter__(self) -> Iterator:
+        for start in range(0, self.length, self.WIDTH):
+            yield from self.__leafFor(start)
+
+    def __getitem__(self, index: int) -> any:
+        return self.get(index)
+
+    def get(self, index: int) -> any:
+        """
+        Returns the element at a given index
+
+        :raises IndexError: If specified index is out of the vector bounds
+        """
+
+        index = _checkIndex(index, self.length)
+        return self.__leafFor(index)[index & self.MASK]
+
+    def set(self, index: int, val: any) -> 'PersistentVector':
+        """
+        Returns a new vector with the element at a given index replaced
+
+        :raises IndexError: If specified index is out of the vector bounds
+        """
+
+        index = _checkIndex(index, self.length)
+        if index >= self.__tailOffset():
+            tail: list = list(self.tail)
+            tail[index & self.MASK] = val
+            return self.__new(self.length, self.shift, self.root, tail)
+        return self.__new(self.length, self.shift, self.__setPath(self.shift, self.root, index, val), self.tail)
+
+    def append(self, val: any) -> 'PersistentVector':
+        """
+        Returns a new vector with a value added to the end
+        """
+
+        if self.length - self.__tailOffset() < self.WIDTH:
+            return self.__new(self.length + 1, self.shift, self.root, self.tail + [val])
+
+        # The tail is full so it becomes a leaf of the tree
+        shift: int = self.shift
+        if (self.length >> self.BITS) > (1 << self.shift):
+            # The tree is full so grow a new root above it
+            root: list = [self.root, self.__newPath(self.shift, self.tail)]
+            shift += self.BITS
+        else:
+            root = self.__pushTail(self.shift, self.root, self.tail)
+        return self.__new(self.length + 1, shift, root, [val])
+
+    def pop(self) -> 'PersistentVector':
+        """
+        Returns a new vector without the last element
+
+        :raises Exception: If the vector is empty
+        """
+
+        if self.length == 0:
+            raise Exception("Cannot pop from empty vector")
+        if self.length == 1:
+            return PersistentVector()
+        if self.length - self.__tailOffset() > 1:
+            return self.__new(self.length - 1, self.shift, self.root, self.tail[:-1])
+
+        # The tail empties so the last leaf of the tree becomes the new tail
+        tail: list = self.__leafFor(self.length - 2)
+        root: list | None = self.__popTail(self.shift, self.root)
+        shift: int = self.shift
+        if root is None:
+            root = []
+        if shift > self.BITS and len(root) == 1:
+            root = root[0]
+            shift -= self.BITS
+        return self.__new(self.length - 1, shift, root, tail)
+
+    def dump(self, fileobj: any) -> None:
+        """
+        Writes the vector to a binary file object as a flat array of its values
+        """
+
+        _dump(fileobj, self, list(self))
+
+    @classmethod
+    def load(cls, fileobj: any) -> 'PersistentVector':
+        """
+        Reads a vector written by dump from a binary file object
+
+        :raises ValueError: If the file does not hold a dump of this class
+        """
+
+        values, = _load(fileobj, cls)
+        return cls(values)
+
+    def print(self) -> None:
+        """
+        Prints contents of the vector
+        """
+
+        print(list(self))
+
+    def __new(self, length: int, shift: int, root: list, tail: list) -> 'PersistentVector':
+        vector: PersistentVector = PersistentVector()
+        vector.length, vector.shift, vector.root, vector.tail = length, shift, root, tail
+        return vector
+
+    def __tailOffset(self) -> int:
+        if self.length < self.WIDTH:
+            return 0
+        return ((self.length - 1) >> self.BITS) << self.BITS
+
+    def __leafFor(self, index: int) -> list:
+        """ Returns the leaf (or tail) holding a given index """
+
+        if index >= self.__tailOffset():
+            return self.tail
+        node: list = self.root
+        for level in range(self.shift, 0, -self.BITS):
+            node = node[(index >> level) & self.MASK]
+        return node
+
+    def __setPath(self, level: int, node: list, index: int, val: any) -> list:
+        copy: list = list(node)
+        if level == 0:
+            copy[index & self.MASK] = val
+        else:
+            child: int = (index >> level) & self.MASK
+            copy[child] = self.__setPath(level - self.BITS, node[child], index, val)
+        return copy
+
+    def __newPath(self, level: int, leaf: list) -> list:
+        node: list = leaf
+        for _ in range(level, 0, -self.BITS):
+            node = [node]
+        return node
+
+    def __pushTail(self, level: int, parent: list, tail: list) -> list:
+        child: int = ((self.length - 1) >> level) & self.MASK
+        copy: list = list(parent)
+        if level == self.BITS:
+            node: list = tail
+        elif child < len(parent):
+            node = self.__pushTail(level - self.BITS, parent[child], tail)
+        else:
+            node = self.__newPath(level - self.BITS, tail)
+
+        if child < len(copy):
+            copy[child] = node
+        else:
+            copy.append(node)
+        return copy
+
+    def __popTail(self, level: int, node: list) -> list | None:
+        child: int = ((self.length - 2) >> level) & self.MASK
+        if level > self.BITS:
+            new_child: list | None = self.__popTail(level - self.BITS, node[child])
+            if new_child is None and child == 0:
+                return None
+            copy: list = list(node)
+            if new_child is None:
+                copy.pop()
+            else:
+                copy[child] = new_child
+            return copy
+        if child == 0:
+            return None
+        return node[:child]
+
+
+class _HamtNode:
+    """
+    Helper class for PersistentHashMap, a node with up to 32 entries indexed by a bitmap. 
+    Each entry is a (key, value) pair or a child node
+    """
+    __slots__ = ("bitmap", "entries")
+
+    def __init__(self, bitmap: int, entries: list) -> None:
+        self.bitmap: int = bitmap
+        self.entries: list = entries
+
+
+class _CollisionNode:
+    """
+    Helper class for PersistentHashMap, holds (key, value) pairs whose keys have identical hashes
+    """
+    __slots__ = ("hash", "entries")
+
+    def __init__(self, hash: int, entries: list) -> None:
+        self.hash: int = hash
+        self.entries: list = entries
+
+
+class PersistentHashMap:
+    """
+    Persistent hash map - An immutable mapping stored as a hash array mapped trie. Each level of the 
+                       trie uses 5 bits of a key's hash to choose one of up to 32 entries, & a bitmap 
+                       records which entries exist so nodes only store what is present. Updates copy 
+                       only the path to the changed entry, taking O(log32 n) & sharing everything else.
+
+    Attributes:
+    -----------
+    root: _HamtNode
+        The root node of the trie
+    length: int
+        The number of keys in the map
+
+    Methods:
+    --------
+    get(key, default)
+        Returns the value for a key, or default if the key is not present
+    set(key, val)
+        Returns a new map with a key set to a value
+    remove(key)
+        Returns a new map without a key
+    items()
+        Iterates over (key, value) pairs
+    print()
+        Prints contents of the map
+    dump(fileobj) / load(fileobj)
+        Writes to or reads from a binary file object
+    """
+
+    BITS: int = 5
+    MASK: int = (1 << BITS) - 1
+
+    def __init__(self, items: Iterable | dict | None = None) -> None:
+        self.root: _HamtNode = _HamtNode(0, [])
+        self.length: int = 0
+        if items is not None:
+            pairs: Iterable = items.items() if isinstance(items, dict) else items
+            mapping: PersistentHashMap = self
+            for key, val in pairs:
+                mapping = mapping.set(key, val)
+            self.root, self.length = mapping.root, mapping.length
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __iter__(self) -> Iterator:
+        for key, _ in self.items():
+            yield key
+
+    def __contains__(self, key: any) -> bool:
+        return self.get(key, _REMOVED) is not _REMOVED
+
+    def __getitem__(self, key: any) -> any:
+        val: any = self.get(key, _REMOVED)
+        if val is _REMOVED:
+            raise KeyError(key)
+        return val
+
+    def get(self, key: any, default: any = None) -> any:
+        """
+        Returns the value for a key, or default if the key is not present
+        """
+
+        h: int = self.__hash(key)
+        node: _HamtNode | _CollisionNode = self.root
+        shift: int = 0
+        while True:
+            if type(node) == _CollisionNode:
+                for k, v in node.entries:
+                    if k == key:
+                        return v
+                return default
+
+            bit: int = 1 << ((h >> shift) & self.MASK)
+            if not node.bitmap & bit:
+                return default
+            entry: any = node.entries[(node.bitmap & (bit - 1)).bit_count()]
+            if type(entry) == tuple:
+                return entry[1] if entry[0] == key else default
+            node = entry
+            shift += self.BITS
+
+    def set(self, key: any, val: any) -> 'PersistentHashMap':
+        """
+        Returns a new map with a key set to a value
+        """
+
+        root, added = self.__set(self.root, 0, self.__hash(key), key, val)
+        return self.__new(root, self.length + added)
+
+    def remove(self, key: any) -> 'PersistentHashMap':
+        """
+        Returns a new map without a key
+
+        :raises KeyError: If the key is not present
+        """
+
+        root: any = self.__remove(self.root, 0, self.__hash(key), key)
+        if root is self.root:
+            raise KeyError(key)
+        if root is None:
+            root = _HamtNode(0, [])
+        return self.__new(root, self.length - 1)
+
+    def items(self) -> Iterator:
+        """
+        Iterates over (key, value) pairs in no particular order
+        """
+
+        stack: list = [self.root]
+        while stack:
+            node: _HamtNode | _CollisionNode = stack.pop()
+            for entry in node.entries:
+                if type(entry) == tuple:
+                    yield entry
+                else:
+                    stack.append(entry)
+
+    def dump(self, fileobj: any) -> None:
+        """
+        Writes the map to a binary file object as flat arrays of its keys & values
+        """
+
+        items: list = list(self.items())
+        _dump(fileobj, self, [key for key, _ in items], [val for _, val in items])
+
+    @classmethod
+    def load(cls, fileobj: any) -> 'PersistentHashMap':
+        """
+        Reads a map written by dump from a binary file object
+
+        :raises ValueError: If the file does not hold a dump of this class
+        """
+
+        keys, values = _load(fileobj, cls)
+        return cls(zip(keys, values))
+
+    def print(self) -> None:
+        """
+        Prints contents of the map
+        """
+
+        print(dict(self.items()))
+
+    def __new(self, root: _HamtNode, length: int) -> 'PersistentHashMap':
+        mapping: PersistentHashMap = PersistentHashMap()
+        mapping.root, mapping.length = root, length
+        return mapping
+
+    def __hash(self, key: any) -> int:
+        return hash(key) & 0xFFFFFFFFFFFFFFFF
+
+    def __set(self, node: _HamtNode | _CollisionNode, shift: int, h: int, key: any, val: any) -> tuple:
+        """ Returns the updated copy of a node & whether a new key was added """
+
+        if type(node) == _CollisionNode:
+            if h != node.hash:
+                # Only keys with equal full hashes may share a collision node, so give it a parent 
+                # indexed by its hash at this level & insert the key alongside it
+                wrapper: _HamtNode = _HamtNode(1 << ((node.hash >> shift) & self.MASK), [node])
+                return self.__set(wrapper, shift, h, key, val)
+            entries: list = [entry for entry in node.entries if entry[0] != key]
+            added: bool = len(entries) == len(node.entries)
+            entries.append((key, val))
+            return _CollisionNode(node.hash, entries), added
+
+        bit: int = 1 << ((h >> shift) & self.MASK)
+        index: int = (node.bitmap & (bit - 1)).bit_count()
+        entries = list(node.entries)
+        if not node.bitmap & bit:
+            entries.insert(index, (key, val))
+            return _HamtNode(node.bitmap | bit, entries), True
+
+        entry: any = entries[index]
+        if type(entry) != tuple:
+            entries[index], added = self.__set(entry, shift + self.BITS, h, key, val)
+            return _HamtNode(node.bitmap, entries), added
+        if entry[0] == key:
+            entries[index] = (key, val)
+            return _HamtNode(node.bitmap, entries), False
+
+        # Two different keys share this slot so push both down a level 
+        entries[index] = self.__split(shift + self.BITS, entry, self.__hash(entry[0]), (key, val), h)
+        return _HamtNode(node.bitmap, entries), True
+
+    def __split(self, shift: int, a: tuple, ha: int, b: tuple, hb: int) -> _HamtNode | _CollisionNode:
+        if ha == hb:
+            return _CollisionNode(ha, [a, b])
+
+        bitA: int = 1 << ((ha >> shift) & self.MASK)
+        bitB: int = 1 << ((hb >> shift) & self.MASK)
+        if bitA == bitB:
+            return _HamtNode(bitA, [self.__split(shift + self.BITS, a, ha, b, hb)])
+        return _HamtNode(bitA | bitB, [a, b] if bitA < bitB else [b, a])
+
+    def __remove(self, node: _HamtNode | _CollisionNode, shift: int, h: int, key: any) -> any:
+        """ 
+        Returns the updated copy of a node, the same node if the key was not found, 
+        a lone (key, value) pair if only one remains, or None if the node is now empty
+        """
+
+        if type(node) == _CollisionNode:
+            entries: list = [entry for entry in node.entries if entry[0] != key]
+            if len(entries) == len(node.entries):
+                return node
+            return entries[0] if len(entries) == 1 else _CollisionNode(node.hash, entries)
+
+        bit: int = 1 << ((h >> shift) & self.MASK)
+        if not node.bitmap & bit:
+            return node
+        index: int = (node.bitmap & (bit - 1)).bit_count()
+        entry: any = node.entries[index]
+
+        if type(entry) == tuple:
+            if entry[0] != key:
+                return node
+            replacement: any = None
+        else:
+            replacement = self.__remove(entry, shift + self.BITS, h, key)
+            if replacement is entry:
+                return node
+
+        entries = list(node.entries)
+        bitmap: int = node.bitmap
+        if replacement is None:
+            del entries[index]
+            bitmap ^= bit
+        else:
+            entries[index] = replacement
+
+        if not entries:
+            return None
+        if len(entries) == 1 and type(entries[0]) == tuple and shift > 0:
+            # Collapse a node holding a single pair into its parent
+            return entries[0]
+        return _HamtNode(bitmap, entries)
+
+
+class Graph:
+    """
+    Graph - A structure of vertices numbered 0 to n - 1 joined by weighted edges. Each vertex keeps a 
+            dict from its neighbours to the weights of the edges to them, so edges are added, removed 
+            & looked up in O(1). An undirected edge is stored in the dicts of both of its ends.
+
+    Attributes:
+    -----------
+    adj: list[dict]
+        The neighbours of each vertex mapped to the weights of the edges to them
+    directed: bool
+        Whether edges only go from their first vertex to their second
+    edgeCount: int
+        The number of edges in the graph
+
+    Methods:
+    --------
+    fromEdges(edges, n, directed)
+        Creates a graph from (u, v) or (u, v, weight) edges
+    addVertex()
+        Adds a vertex & returns its number
+    addEdge(u, v, weight)
+        Adds or reweights an edge
+    removeEdge(u, v)
+        Removes an edge
+    hasEdge(u, v)
+        Checks if there is an edge from u to v
+    neighbors(u)
+        Returns the (neighbour, weight) pairs of a vertex
+    transpose()
+        Returns the graph with every edge reversed
+    freeze()
+        Returns a read-only CSRGraph of the graph
+    """
+
+    def __init__(self, n: int = 0, directed: bool = False) -> None:
+        self.adj: list[dict] = [{} for _ in range(n)]
+        self.directed: bool = directed
+        self.edgeCount: int = 0
+
+    def __len__(self) -> int:
+        return len(self.adj)
+
+    def __iter__(self) -> Iterator:
+        return iter(range(len(self.adj)))
+
+    @classmethod
+    def fromEdges(cls, edges: Iterable, n: int = 0, directed: bool = False) -> 'Graph':
+        """
+        Creates a graph from (u, v) edges of weight 1 or (u, v, weight) edges, 
+        with enough vertices for every edge & at least n
+        """
+
+        graph: Graph = cls(n, directed)
+        for edge in edges:
+            graph.addEdge(*edge)
+        return graph
+
+    def addVertex(self) -> int:
+        """
+        Adds a vertex with no edges & returns its number
+        """
+
+        self.adj.append({})
+        return len(self.adj) - 1
+
+    def addEdge(self, u: int, v: int, weight: int | float = 1) -> None:
+        """
+        Adds an edge from u to v, replacing the weight of an existing edge. 
+        Vertices up to the larger of u & v are added if they do not exist
+
+        :raises IndexError: If a vertex is negative
+        """
+
+        if u < 0 or v < 0:
+            raise IndexError("Vertex out of bounds")
+        while max(u, v) >= len(self.adj):
+            self.adj.append({})
+
+        if v not in self.adj[u]:
+            self.edgeCount += 1
+        self.adj[u][v] = weight
+        if not self.directed:
+            self.adj[v][u] = weight
+
+    def removeEdge(self, u: int, v: int) -> None:
+        """
+        Removes the edge from u to v
+
+        :raises KeyError: If there is no such edge
+        """
+
+        if not self.hasEdge(u, v):
+            raise KeyError(f"No edge from {u} to {v}")
+        del self.adj[u][v]
+        if not self.directed:
+            self.adj[v].pop(u, None)
+        self.edgeCount -= 1
+
+    def hasEdge(self, u: int, v: int) -> bool:
+        """
+        Checks if there is an edge from u to v
+        """
+
+        return 0 <= u < len(self.adj) and v in self.adj[u]
+
+    def neighbors(self, u: int) -> Iterable:
+        """
+        Returns the (neighbour, weight) pairs of the edges leaving a vertex
+
+        :raises IndexError: If the vertex does not exist
+        """
+
+        return self.adj[_checkIndex(u, len(self.adj))].items()
+
+    def transpose(self) -> 'Graph':
+        """
+        Returns a graph with every edge reversed, or the graph itself if it is undirected
+        """
+
+        if not self.directed:
+            return self
+        graph: Graph = Graph(len(self.adj), True)
+        for u, edges in enumerate(self.adj):
+            for v, weight in edges.items():
+                graph.adj[v][u] = weight
+        graph.edgeCount = self.edgeCount
+        return graph
+
+    def freeze(self) -> 'CSRGraph':
+        """
+        Returns a read-only compressed sparse row copy of the graph, with neighbours in ascending order
+        """
+
+        indptr: array.array = array.array("q", [0])
+        indices: array.array = array.array("q")
+        weights: array.array = array.array("d")
+        for edges in self.adj:
+            for v in sorted(edges):
+                indices.append(v)
+                weights.append(edges[v])
+            indptr.append(len(indices))
+        return CSRGraph(indptr, indices, weights, self.directed)
+
+    def print(self) -> None:
+        """
+        Prints the neighbours of each vertex
+        """
+
+        for u, edges in enumerate(self.adj):
+            print(f"{u}: {edges}")
+
+
+class CSRGraph:
+    """
+    CSR graph - A read-only graph stored in compressed sparse row form: the neighbours of vertex u are 
+                indices[indptr[u]:indptr[u + 1]] in ascending order, with the weights of the edges to 
+                them at the same positions in weights. Three flat typed arrays hold the whole graph, 
+                so it is compact & neighbours are read without creating any objects per edge.
+
+    Attributes:
+    -----------
+    indptr: array.array
+        The offset of the first edge of each vertex, followed by the number of stored edges
+    indices: array.array
+        The neighbour at the end of each edge
+    weights: array.array
+        The weight of each edge
+    directed: bool
+        Whether edges only go from their first vertex to their second
+    edgeCount: int
+        The number of edges in the graph
+
+    Methods:
+    --------
+    neighbors(u)
+        Returns the (neighbour, weight) pairs of a vertex
+    hasEdge(u, v)
+        Checks if there is an edge from u to v in O(log degree)
+    transpose()
+        Returns the graph with every edge reversed
+    """
+
+    def __init__(self, indptr: array.array, indices: array.array, weights: array.array, directed: bool = False) -> None:
+        self.indptr: array.array = indptr
+        self.indices: array.array = indices
+        self.weights: array.array = weights
+        self.directed: bool = directed
+        self.edgeCount: int = len(indices) if directed else (len(indices) + self.__loops()) // 2
+
+    def __len__(self) -> int:
+        return len(self.indptr) - 1
+
+    def __iter__(self) -> Iterator:
+        return iter(range(len(self)))
+
+    def neighbors(self, u: int) -> Iterable:
+        """
+        Returns the (neighbour, weight) pairs of the edges leaving a vertex
+
+        :raises IndexError: If the vertex does not exist
+        """
+
+        u = _checkIndex(u, len(self))
+        start, stop = self.indptr[u], self.indptr[u + 1]
+        return zip(self.indices[start:stop], self.weights[start:stop])
+
+    def hasEdge(self, u: int, v: int) -> bool:
+        """
+        Checks if there is an edge from u to v by binary searching the neighbours of u
+        """
+
+        if not 0 <= u < len(self):
+            return False
+        stop: int = self.indptr[u + 1]
+        pos: int = bisect_left(self.indices, v, self.indptr[u], stop)
+        return pos < stop and self.indices[pos] == v
+
+    def transpose(self) -> 'CSRGraph':
+        """
+        Returns a graph with every edge reversed, or the graph itself if it is undirected
+        """
+
+        if not self.directed:
+            return self
+
+        # Counting sort the edges by their end vertex, which keeps the start vertices ascending
+        n: int = len(self)
+        counts: list = [0] * (n + 1)
+        for v in self.indices:
+            counts[v + 1] += 1
+        indptr: array.array = array.array("q", accumulate(counts))
+        nxt: list = list(indptr[:-1])
+        indices: array.array = array.array("q", bytes(8 * len(self.indices)))
+        weights: array.array = array.array("d", bytes(8 * len(self.weights)))
+        for u in range(n):
+            for k in range(self.indptr[u], self.indptr[u + 1]):
+                v: int = self.indices[k]
+                indices[nxt[v]] = u
+                weights[nxt[v]] = self.weights[k]
+                nxt[v] += 1
+        return CSRGraph(indptr, indices, weights, True)
+
+    def print(self) -> None:
+        """
+        Prints the neighbours of each vertex
+        """
+
+        for u in self:
+            print(f"{u}: {dict(self.neighbors(u))}")
+
+    def __loops(self) -> int:
+        """ Returns the number of edges from a vertex to itself, which undirected graphs store once """
+
+        return sum(self.indices[k] == u for u in range(len(self)) for k in range(self.indptr[u], self.indptr[u + 1]))
+
+
+class DisjointSet:
+    """
+    Disjoint set - A structure (also called union-find) that splits the elements 0 to n - 1 into disjoint 
+                   sets, each identified by a root element. Parents & set sizes are stored in typed arrays; 
+                   finding a root halves the path to it & union attaches the smaller set under the larger, 
+                   so operations take near-constant amortised time
+
+    Attributes:
+    -----------
+    parent: array.array
+        The parent of each element, where a root is its own parent
+    sizes: array.array
+        The number of elements in the set of each root
+    count: int
+        The number of disjoint sets
+
+    Methods:
+    --------
+    add()
+        Adds an element in a set of its own & returns it
+    find(x)
+        Returns the root of the set containing an element
+    union(a, b)
+        Merges the sets containing two elements
+    unionMany(pairs)
+        Merges the sets of each pair of elements
+    connected(a, b)
+        Checks if two elements are in the same set
+    size(x)
+        Returns the number of elements in the set containing an element
+    groups()
+        Returns the elements of each set
+    """
+
+    def __init__(self, n: int = 0) -> None:
+        self.parent: array.array = array.array("q", range(n))
+        self.sizes: array.array = array.array("q", repeat(1, n))
+        self.count: int = n
+
+    def __len__(self) -> int:
+        return len(self.parent)
+
+    def add(self) -> int:
+        """
+        Adds an element in a set of its own & returns it
+        """
+
+        x: int = len(self.parent)
+        self.parent.append(x)
+        self.sizes.append(1)
+        self.count += 1
+        return x
+
+    def find(self, x: int) -> int:
+        """
+        Returns the root of the set containing an element, pointing every other element on the way 
+        at its grandparent
+
+        :raises IndexError: If the element does not exist
+        """
+
+        parent: array.array = self.parent
+        x = _checkIndex(x, len(parent))
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    def union(self, a: int, b: int) -> bool:
+        """
+        Merges the sets containing two elements & returns False if they were already in the same set
+
+        :raises IndexError: If an element does not exist
+        """
+
+        a, b = self.find(a), self.find(b)
+        if a == b:
+            return False
+        if self.sizes[a] < self.sizes[b]:
+            a, b = b, a
+        self.parent[b] = a
+        self.sizes[a] += self.sizes[b]
+        self.count -= 1
+        return True
+
+    def unionMany(self, pairs: Iterable) -> int:
+        """
+        Merges the sets of each (a, b) pair of elements & returns the number of merges made
+
+        :raises IndexError: If an element does not exist
+        """
+
+        return sum(self.union(a, b) for a, b in pairs)
+
+    def connected(self, a: int, b: int) -> bool:
+        """
+        Checks if two elements are in the same set
+
+        :raises IndexError: If an element does not exist
+        """
+
+        return self.find(a) == self.find(b)
+
+    def size(self, x: int) -> int:
+        """
+        Returns the number of elements in the set containing an element
+
+        :raises IndexError: If the element does not exist
+        """
+
+        return self.sizes[self.find(x)]
+
+    def groups(self) -> list:
+        """
+        Returns a list of the elements of each set, in order of their smallest element
+        """
+
+        groups: dict = {}
+        for x in range(len(self.parent)):
+            groups.setdefault(self.find(x), []).append(x)
+        return list(groups.values())
+
+    def print(self) -> None:
+        """
+        Prints the elements of each set
+        """
+
+        print(self.groups())
+
+
+class KeyedDisjointSet:
+    """
+    Keyed disjoint set - A disjoint set of any hashable elements. Each element is numbered when it is 
+                         first seen & the numbers are kept in a DisjointSet, so elements are added 
+                         implicitly by union & find
+
+    Attributes:
+    -----------
+    sets: DisjointSet
+        The disjoint set of element numbers
+    keys: list
+        The element of each number
+    index: dict
+        The number of each element
+
+    Methods:
+    --------
+    add(key)
+        Adds an element in a set of its own if it is not already present
+    find(key)
+        Returns the root element of the set containing an element
+    union(a, b)
+        Merges the sets containing two elements
+    unionMany(pairs)
+        Merges the sets of each pair of elements
+    connected(a, b)
+        Checks if two elements are in the same set
+    size(key)
+        Returns the number of elements in the set containing an element
+    groups()
+        Returns the elements of each set
+    """
+
+    def __init__(self, keys: Iterable = ()) -> None:
+        self.sets: DisjointSet = DisjointSet()
+        self.keys: list = []
+        self.index: dict = {}
+        for key in keys:
+            self.add(key)
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def __contains__(self, key: any) -> bool:
+        return key in self.index
+
+    @property
+    def count(self) -> int:
+        return self.sets.count
+
+    def add(self, key: any) -> None:
+        """
+        Adds an element in a set of its own if it is not already present
+        """
+
+        self.__number(key)
+
+    def find(self, key: any) -> any:
+        """
+        Returns the root element of the set containing an element
+
+        :raises KeyError: If the element has not been added
+        """
+
+        return self.keys[self.sets.find(self.index[key])]
+
+    def union(self, a: any, b: any) -> bool:
+        """
+        Merges the sets containing two elements, adding them if needed, & returns False if they were 
+        already in the same set
+        """
+
+        return self.sets.union(self.__number(a), self.__number(b))
+
+    def unionMany(self, pairs: Iterable) -> int:
+        """
+        Merges the sets of each (a, b) pair of elements & returns the number of merges made
+        """
+
+        return sum(self.union(a, b) for a, b in pairs)
+
+    def connected(self, a: any, b: any) -> bool:
+        """
+        Checks if two elements are in the same set, which is False if either has not been added
+        """
+
+        return a in self.index and b in self.index and self.sets.connected(self.index[a], self.index[b])
+
+    def size(self, key: any) -> int:
+        """
+        Returns the number of elements in the set containing an element
+
+        :raises KeyError: If the element has not been added
+        """
+
+        return self.sets.size(self.index[key])
+
+    def groups(self) -> list:
+        """
+        Returns a list of the elements of each set, in order of when their first element was added
+        """
+
+        return [[self.keys[x] for x in group] for group in self.sets.groups()]
+
+    def print(self) -> None:
+        """
+        Prints the elements of each set
+        """
+
+        print(self.groups())
+
+    def __number(self, key: any) -> int:
+        """ Returns the number of an element, numbering it first if it is new """
+
+        x: int | None = self.index.get(key)
+        if x is None:
+            x = self.index[key] = self.sets.add()
+            self.keys.append(key)
+        return x
+
+
+def _checkStringKey(key: any) -> str:
+    """ Checks a key of a Trie or RadixTree is a string """
+
+    if not isinstance(key, str):
+        raise TypeError("Keys must be strings")
+    return key
+
+
+def _checkSortedKeys(keys: list, values: list | None) -> None:
+    """ Checks keys for bulk construction are strings in strictly ascending order, with one value each if values are given """
+
+    for i, key in enumerate(keys):
+        _checkStringKey(key)
+        if i and keys[i - 1] >= key:
+            raise ValueError("Keys must be sorted & unique")
+    if values is not None and len(values) != len(keys):
+        raise ValueError("Number of values must match number of keys")
+
+
+def _matchLength(label: str, key: str, start: int) -> int:
+    """ Returns the number of leading characters of label that match key from index start """
+
+    n: int = min(len(label), len(key) - start)
+    i: int = 0
+    while i < n and label[i] == key[start + i]:
+        i += 1
+    return i
+
+
+class _TrieNode:
+    """
+    Helper class for Trie, holds its children in a list in the order of their characters in chars
+    """
+    __slots__ = ("chars", "children", "terminal", "value")
+
+    def __init__(self) -> None:
+        self.chars: str = ""
+        self.children: list = []
+        self.terminal: bool = False
+        self.value: any = None
+
+
+class Trie:
+    """
+    Trie - A tree of string keys with one character on each edge, so every key with a given prefix 
+           is below the node reached by following that prefix. Each node keeps the characters of 
+           its children in a sorted string next to a list of the children rather than a dict, which 
+           is compact for small alphabets, found with str.find & gives keys in lexicographic order. 
+           A value can be stored with each key
+
+    Attributes:
+    -----------
+    root: _TrieNode
+        The node of the empty prefix
+    size: int
+        The number of keys in the trie
+
+    Methods:
+    --------
+    fromSorted(keys, values)
+        Builds a trie from keys in ascending order in O(total length)
+    insert(key, value)
+        Adds a key or replaces its value
+    search(key)
+        Checks if a key is in the trie
+    get(key, default)
+        Returns the value of a key
+    startsWith(prefix)
+        Checks if any key starts with a prefix
+    keysWithPrefix(prefix)
+        Lazily yields the keys starting with a prefix in lexicographic order
+    items(prefix)
+        Lazily yields the (key, value) pairs of the keys starting with a prefix
+    longestPrefix(s)
+        Returns the longest key that is a prefix of s
+    remove(key)
+        Removes a key
+    """
+
+    def __init__(self, keys: Iterable = ()) -> None:
+        self.root: _TrieNode = _TrieNode()
+        self.size: int = 0
+        for key in keys:
+            self.insert(key)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __contains__(self, key: any) -> bool:
+        return isinstance(key, str) and self.search(key)
+
+    def __iter__(self) -> Iterator:
+        return self.keysWithPrefix("")
+
+    @classmethod
+    def fromSorted(cls, keys: Iterable, values: Iterable | None = None) -> 'Trie':
+        """
+        Builds a trie from keys in ascending order, with the matching value of each key if values are given. 
+        Each key shares the path of its common prefix with the previous key & adds the rest as the last 
+        children of the nodes it passes, so no searching or inserting into children is needed
+
+        :raises TypeError: If a key is not a string
+        :raises ValueError: If the keys are not sorted & unique or there is not one value per key
+        """
+
+        keys = list(keys)
+        values = None if values is None else list(values)
+        _checkSortedKeys(keys, values)
+        trie: Trie = cls()
+        path: list = [trie.root]
+        prev: str = ""
+        for key, value in zip(keys, repeat(None) if values is None else values):
+            shared: int = _matchLength(prev, key, 0)
+            del path[shared + 1:]
+            node: _TrieNode = path[-1]
+            for c in key[shared:]:
+                child: _TrieNode = _TrieNode()
+                node.chars += c
+                node.children.append(child)
+                path.append(child)
+                node = child
+            node.terminal = True
+            node.value = value
+            prev = key
+        trie.size = len(keys)
+        return trie
+
+    def insert(self, key: str, value: any = None) -> None:
+        """
+        Adds a key to the trie with a value, replacing the value if the key is already present
+
+        :raises TypeError: If the key is not a string
+        """
+
+        node: _TrieNode = self.root
+        for c in _checkStringKey(key):
+            i: int = node.chars.find(c)
+            if i < 0:
+                i = bisect_left(node.chars, c)
+                node.chars = node.chars[:i] + c + node.chars[i:]
+                node.children.insert(i, _TrieNode())
+            node = node.children[i]
+        if not node.terminal:
+            node.terminal = True
+            self.size += 1
+        node.value = value
+
+    def search(self, key: str) -> bool:
+        """
+        Checks if a key is in the trie in O(length of key)
+        """
+
+        node: _TrieNode | None = self.__find(key)
+        return node is not None and node.terminal
+
+    def get(self, key: str, default: any = None) -> any:
+        """
+        Returns the value of a key, or default if the key is not in the trie
+        """
+
+        node: _TrieNode | None = self.__find(key)
+        return node.value if node is not None and node.terminal else default
+
+    def startsWith(self, prefix: str) -> bool:
+        """
+        Checks if any key in the trie starts with a prefix
+        """
+
+        node: _TrieNode | None = self.__find(prefix)
+        return node is not None and (node.terminal or len(node.children) > 0)
+
+    def keysWithPrefix(self, prefix: str) -> Iterator:
+        """
+        Lazily yields the keys starting with a prefix in lexicographic order
+        """
+
+        return (key for key, _ in self.items(prefix))
+
+    def items(self, prefix: str = "") -> Iterator:
+        """
+        Lazily yields the (key, value) pairs of the keys starting with a prefix in lexicographic order
+        """
+
+        node: _TrieNode | None = self.__find(prefix)
+        if node is None:
+            return
+        stack: list = [(node, prefix)]
+        while stack:
+            node, path = stack.pop()
+            if node.terminal:
+                yield path, node.value
+            for i in range(len(node.children) - 1, -1, -1):
+                stack.append((node.children[i], path + node.chars[i]))
+
+    def longestPrefix(self, s: str) -> str | None:
+        """
+        Returns the longest key that is a prefix of s, or None if no key is
+        """
+
+        node: _TrieNode = self.root
+        longest: int = 0 if node.terminal else -1
+        for depth, c in enumerate(s, 1):
+            i: int = node.chars.find(c)
+            if i < 0:
+                break
+            node = node.children[i]
+            if node.terminal:
+                longest = depth
+        return s[:longest] if longest >= 0 else None
+
+    def remove(self, key: str) -> None:
+        """
+        Removes a key from the trie along with any nodes left without keys below them
+
+        :raises TypeError: If the key is not a string
+        :raises KeyError: If the key is not in the trie
+        """
+
+        path: list = [self.root]
+        for c in _checkStringKey(key):
+            i: int = path[-1].chars.find(c)
+            if i < 0:
+                break
+            path.append(path[-1].children[i])
+        if len(path) != len(key) + 1 or not path[-1].terminal:
+            raise KeyError(key)
+
+        node: _TrieNode = path.pop()
+        node.terminal = False
+        node.value = None
+        self.size -= 1
+        while path and not node.terminal and not node.children:
+            parent: _TrieNode = path.pop()
+            i = parent.children.index(node)
+            parent.chars = parent.chars[:i] + parent.chars[i + 1:]
+            del parent.children[i]
+            node = parent
+
+    def print(self) -> None:
+        """
+        Prints the keys of the trie in lexicographic order
+        """
+
+        print(list(self))
+
+    def __find(self, prefix: str) -> _TrieNode | None:
+        """ Returns the node reached by following a prefix, or None if no key starts with it """
+
+        node: _TrieNode = self.root
+        for c in _checkStringKey(prefix):
+            i: int = node.chars.find(c)
+            if i < 0:
+                return None
+            node = node.children[i]
+        return node
+
+
+class _RadixNode:
+    """
+    Helper class for RadixTree, holds the label of the edge into it & its children in a list 
+    in the order of the first characters of their labels in chars
+    """
+    __slots__ = ("label", "chars", "children", "terminal", "value")
+
+    def __init__(self, label: str = "") -> None:
+        self.label: str = label
+        self.chars: str = ""
+        self.children: list = []
+        self.terminal: bool = False
+        self.value: any = None
+
+
+class RadixTree:
+    """
+    Radix tree - A compressed trie where each chain of nodes with a single child & no key is merged 
+                 into one edge labelled with a whole substring, so it has at most twice as many nodes 
+                 as keys however long they are. Children are kept as in Trie, by the first characters 
+                 of their labels in a sorted string next to a list of the children
+
+    Attributes:
+    -----------
+    root: _RadixNode
+        The node of the empty prefix
+    size: int
+        The number of keys in the tree
+
+    Methods:
+    --------
+    fromSorted(keys, values)
+        Builds a tree from keys in ascending order in O(total length)
+    insert(key, value)
+        Adds a key or replaces its value
+    search(key)
+        Checks if a key is in the tree
+    get(key, default)
+        Returns the value of a key
+    startsWith(prefix)
+        Checks if any key starts with a prefix
+    keysWithPrefix(prefix)
+        Lazily yields the keys starting with a prefix in lexicographic order
+    items(prefix)
+        Lazily yields the (key, value) pairs of the keys starting with a prefix
+    longestPrefix(s)
+        Returns the longest key that is a prefix of s
+    remove(key)
+        Removes a key
+    """
+
+    def __init__(self, keys: Iterable = ()) -> None:
+        self.root: _RadixNode = _RadixNode()
+        self.size: int = 0
+        for key in keys:
+            self.insert(key)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __contains__(self, key: any) -> bool:
+        return isinstance(key, str) and self.search(key)
+
+    def __iter__(self) -> Iterator:
+        return self.keysWithPrefix("")
+
+    @classmethod
+    def fromSorted(cls, keys: Iterable, values: Iterable | None = None) -> 'RadixTree':
+        """
+        Builds a tree from keys in ascending order, with the matching value of each key if values are given. 
+        Sorted keys sharing a prefix are adjacent, so each node is built from a run of keys whose 
+        common prefix is the common prefix of the first & last of them
+
+        :raises TypeError: If a key is not a string
+        :raises ValueError: If the keys are not sorted & unique or there is not one value per key
+        """
+
+        keys = list(keys)
+        values = None if values is None else list(values)
+        _checkSortedKeys(keys, values)
+        values = [None] * len(keys) if values is None else values
+        tree: RadixTree = cls()
+        # Each entry is a node with the run of keys below it & the length of the path to it
+        stack: list = [(tree.root, 0, len(keys), 0)] if keys else []
+        while stack:
+            node, lo, hi, depth = stack.pop()
+            if len(keys[lo]) == depth:
+                node.terminal = True
+                node.value = values[lo]
+                lo += 1
+            chars: list = []
+            while lo < hi:
+                c: str = keys[lo][depth]
+                end: int = lo + 1
+                while end < hi and keys[end][depth] == c:
+                    end += 1
+                shared: int = depth + _matchLength(keys[lo][depth:], keys[end - 1], depth)
+                child: _RadixNode = _RadixNode(keys[lo][depth:shared])
+                chars.append(c)
+                node.children.append(child)
+                stack.append((child, lo, end, shared))
+                lo = end
+            node.chars = "".join(chars)
+        tree.size = len(keys)
+        return tree
+
+    def insert(self, key: str, value: any = None) -> None:
+        """
+        Adds a key to the tree with a value, replacing the value if the key is already present. 
+        An edge whose label only partly matches the key is split in two
+
+        :raises TypeError: If the key is not a string
+        """
+
+        node: _RadixNode = self.root
+        i: int = 0
+        _checkStringKey(key)
+        while i < len(key):
+            j: int = node.chars.find(key[i])
+            if j < 0:
+                child: _RadixNode = _RadixNode(key[i:])
+                j = bisect_left(node.chars, key[i])
+                node.chars = node.chars[:j] + key[i] + node.chars[j:]
+                node.children.insert(j, child)
+                node = child
+                break
+
+            child = node.children[j]
+            matched: int = _matchLength(child.label, key, i)
+            if matched < len(child.label):
+                mid: _RadixNode = _RadixNode(child.label[:matched])
+                child.label = child.label[matched:]
+                mid.chars = child.label[0]
+                mid.children.append(child)
+                node.children[j] = child = mid
+            node = child
+            i += matched
+
+        if not node.terminal:
+            node.terminal = True
+            self.size += 1
+        node.value = value
+
+    def search(self, key: str) -> bool:
+        """
+        Checks if a key is in the tree in O(length of key)
+        """
+
+        node: _RadixNode | None = self.__find(key)
+        return node is not None and node.terminal
+
+    def get(self, key: str, default: any = None) -> any:
+        """
+        Returns the value of a key, or default if the key is not in the tree
+        """
+
+        node: _RadixNode | None = self.__find(key)
+        return node.value if node is not None and node.terminal else default
+
+    def startsWith(self, prefix: str) -> bool:
+        """
+        Checks if any key in the tree starts with a prefix
+        """
 
-            if level < height-1:
-                slash_line = [" "] * max_width
-                for node, pos in level_nodes:
-                    if node and node.left:
-                        slash_line[pos-1] = "/"
-                    if node and node.right:
-                        slash_line[pos+1] = "\\"
-                print("".join(slash_line).rstrip())
-            
-            level_nodes = new_level_nodes
+        located: tuple | None = self.__locate(prefix)
+        return located is not None and (located[0].terminal or len(located[0].children) > 0)
 
-    def __getHeight(self, node) -> int:
+    def keysWithPrefix(self, prefix: str) -> Iterator:
         """
-        Helper function to calculate height of binary tree
+        Lazily yields the keys starting with a prefix in lexicographic order
         """
-        if not node:
-            return 0
-        return 1 + max(self.__getHeight(node.left), self.__getHeight(node.right))
-    
-    def __remDeepest(self, root, target) -> None:
+
+        return (key for key, _ in self.items(prefix))
+
+    def items(self, prefix: str = "") -> Iterator:
         """
-        Helper function to delete deepest node in binary tree 
+        Lazily yields the (key, value) pairs of the keys starting with a prefix in lexicographic order
         """
 
-        q = [root]
-        while q:
-            curr = q.pop(0)
-            if curr == target:
-                curr = None
-                del target
-                return 
-            
-            if curr.right:
-                if curr.right == target:
-                    curr.right = None
-                    del target
-                    return
-                q.append(curr.right)
-            
-            if curr.left:
-                if curr.left == target:
-                    curr.left = None
-                    del target
-                    return
-                q.append(curr.left)
+        located: tuple | None = self.__locate(prefix)
+        if located is None:
+            return
+        stack: list = [located]
+        while stack:
+            node, path = stack.pop()
+            if node.terminal:
+                yield path, node.value
+            for i in range(len(node.children) - 1, -1, -1):
+                stack.append((node.children[i], path + node.children[i].label))
 
+    def longestPrefix(self, s: str) -> str | None:
+        """
+        Returns the longest key that is a prefix of s, or None if no key is
+        """
 
-    def __isEmpty(self) -> bool:
-        return not self.root
+        node: _RadixNode = self.root
+        longest: int = 0 if node.terminal else -1
+        i: int = 0
+        while i < len(s):
+            j: int = node.chars.find(s[i])
+            if j < 0 or not s.startswith(node.children[j].label, i):
+                break
+            node = node.children[j]
+            i += len(node.label)
+            if node.terminal:
+                longest = i
+        return s[:longest] if longest >= 0 else None
 
+    def remove(self, key: str) -> None:
+        """
+        Removes a key from the tree, then removes its node if it has no children or merges it 
+        into its child if it has one, so the tree stays compressed
 
-class ArrayBinaryTree:
-    """
-     Binary tree (array) - A structure in which data is arranged in a tree-like structure
-               consiting of a root node, branch nodes and leaf nodes. Each node can have
-               a maximum of two child nodes. Nodes are implemented using array indexes.  
-    
-    """
-    def __init__(self) -> None:
-        self.tree = [0]
-        self.size = 0
-    
-    def insert(self, val: any) -> None: 
-        self.tree.append(val)
-        self.size += 1
-    
-    def remove(self) -> any:
-        val = self.tree.pop()
+        :raises TypeError: If the key is not a string
+        :raises KeyError: If the key is not in the tree
+        """
+
+        path: list = [self.root]
+        i: int = 0
+        _checkStringKey(key)
+        while i < len(key):
+            j: int = path[-1].chars.find(key[i])
+            if j < 0 or not key.startswith(path[-1].children[j].label, i):
+                break
+            path.append(path[-1].children[j])
+            i += len(path[-1].label)
+        if i != len(key) or not path[-1].terminal:
+            raise KeyError(key)
+
+        node: _RadixNode = path.pop()
+        node.terminal = False
+        node.value = None
         self.size -= 1
-        return val
+        if not path:
+            return
+        parent: _RadixNode = path[-1]
+        if not node.children:
+            j = parent.children.index(node)
+            parent.chars = parent.chars[:j] + parent.chars[j + 1:]
+            del parent.children[j]
+            if len(path) > 1 and not parent.terminal and len(parent.children) == 1:
+                self.__merge(parent)
+        elif len(node.children) == 1:
+            self.__merge(node)
 
-    def find(self, val: any) -> bool:
-        if self.__isEmpty():
-            return False
-        
-        curr = 1
-        while curr < self.size:
-            if self.tree[curr] == val:
-                return True
-            curr += 1
+    def print(self) -> None:
+        """
+        Prints the keys of the tree in lexicographic order
+        """
 
-    def getNode(self, index: int) -> any:
-        if self.__isEmpty():
-            return None        
-        if index < 0 or index > self.size:
-            raise IndexError("Index out of bounds")
- 
-        return self.tree[index]
+        print(list(self))
 
-    def getParent(self, index: int) -> any:
-        if self.__isEmpty():
-            return None        
-        if index < 0 or index > self.size:
-            raise IndexError("Index out of bounds")
- 
-        return self.tree[index // 2]
+    def __merge(self, node: _RadixNode) -> None:
+        """ Merges the only child of a node without a key into it """
 
-    def getLeft(self, index: int) -> any:
-        if self.__isEmpty():
-            return None        
-        if index < 0 or index > self.size:
-            raise IndexError("Index out of bounds")
-        
-        
-        if (2 * index) < self.size:
-            return self.tree[2 * index] 
-        else:
-            return None
-    
-    def getRight(self, index: int) -> any:
-        if self.__isEmpty():
-            return None
-        if index < 0 or index > self.size:
-            raise IndexError("Index out of bounds")
+        child: _RadixNode = node.children[0]
+        node.label += child.label
+        node.chars = child.chars
+        node.children = child.children
+        node.terminal = child.terminal
+        node.value = child.value
 
-        if (2 * index) < self.size:
-            return self.tree[2 * index + 1] 
-        else:
-            return None
- 
-    def print(self) -> None:
-        print(self.tree[1:])
+    def __find(self, key: str) -> _RadixNode | None:
+        """ Returns the node whose path is exactly key, or None if there is none """
 
-    def __isEmpty(self) -> bool:
-        return self.size == 0
+        node: _RadixNode = self.root
+        i: int = 0
+        _checkStringKey(key)
+        while i < len(key):
+            j: int = node.chars.find(key[i])
+            if j < 0 or not key.startswith(node.children[j].label, i):
+                return None
+            node = node.children[j]
+            i += len(node.label)
+        return node
 
+    def __locate(self, prefix: str) -> tuple | None:
+        """ 
+        Returns the highest node whose path starts with prefix & that path, or None if no key starts with prefix 
+        """
 
-class BST:
+        node: _RadixNode = self.root
+        i: int = 0
+        _checkStringKey(prefix)
+        while i < len(prefix):
+            j: int = node.chars.find(prefix[i])
+            if j < 0:
+                return None
+            node = node.children[j]
+            matched: int = _matchLength(node.label, prefix, i)
+            if i + matched == len(prefix):
+                return node, prefix[:i] + node.label
+            if matched < len(node.label):
+                return None
+            i += matched
+        return node, prefix
+
+
+def _checkRange(l: int, r: int, length: int) -> None:
+    """ Checks the half-open range [l, r) lies within a structure of the given length """
+
+    if not 0 <= l <= r <= length:
+        raise IndexError("Index out of bounds")
+
+
+class FenwickTree:
     """
-    Binary search tree - A structure similar to a binary tree however the tree has an ordered property.
-                      Meaning nodes smaller than the root will be inserted into the left subtree 
-                      whereas nodes larger than the root will be inserted into the right subtree.
+    Fenwick tree - A structure (also called a binary indexed tree) that answers prefix sums of an array 
+                   & adds to its elements in O(log n). Position i of the tree holds the sum of the i & -i 
+                   elements ending at element i - 1, so any prefix is the sum of at most log n positions. 
+                   Sums of ints & floats are kept in a typed array, of ints until a float is added, & 
+                   in a list once an int sum no longer fits in 64 bits or for other numbers such as 
+                   Decimal or Fraction. Ranges are half-open
+
+    Attributes:
+    -----------
+    tree: array.array | list
+        The partial sums at positions 1 to n, position 0 is unused
+
+    Methods:
+    --------
+    add(index, delta)
+        Adds to an element
+    set(index, val)
+        Sets an element
+    prefixSum(r)
+        Returns the sum of the elements before index r
+    rangeSum(l, r)
+        Returns the sum of the elements from index l up to but not including r
+    lowerBound(target)
+        Returns the shortest prefix with a sum of at least target
     """
 
-    def __init__(self):
-        self.root = None
+    def __init__(self, values: Iterable = ()) -> None:
+        values = list(values)
+        code: str | None = None
+        if all(type(val) in _TYPECODES for val in values):
+            code = "d" if any(isinstance(val, float) for val in values) else "q"
+        try:
+            self.tree: array.array | list = self.__build(array.array(code, [0]) if code else [0], values)
+        except OverflowError:
+            self.tree = self.__build([0], values)
 
-    def insert(self, val: any) -> None:
-        """ Inserts a value into the binary search tree """
+    def __len__(self) -> int:
+        return len(self.tree) - 1
 
-        newNode = TreeNode(val)
+    def __getitem__(self, index: int) -> int | float:
+        """
+        Returns the element at a given index in O(log n)
 
-        if self.__isEmpty():
-            self.root = newNode
-        
-        parent = None
-        curr = self.root
-        while curr:
-            parent = curr
-            if curr.val > val:
-                curr = curr.left
-            elif curr.val < val:
-                curr = curr.right
-            else:
-                return
-        if parent.val > val:
-            parent.left = newNode
-        else:
-            parent.right = newNode
-        return
-    
-    def remove(self, val: any) -> None:
-        """ Removes a value from the binary search tree """
-        
-        if self.__isEmpty():
-            return
+        :raises IndexError: If specified index is out of the tree bounds
+        """
 
-        curr = self.root
-        while curr: 
-            if curr.val > val:
-                curr = curr.left
-            elif curr.val < val:
-                curr = curr.right
-            else:
-                if not curr.left:
-                    pass 
-        return False
+        index = _checkIndex(index, len(self))
+        return self.rangeSum(index, index + 1)
 
-    def search(self, val: any) -> bool:
-        """ Searches for a specified value in the binary search tree, returns true if found else false """
-        
-        curr = self.root
-        while curr:
-            if curr.val == val:
-                return True
-            elif curr.val > val:
-                curr = curr.left
-            else:
-                curr = curr.right
-        return False
-    
-    def preOrder(self) -> None:
+    def add(self, index: int, delta: int | float) -> None:
         """
-        Prints nodes in pre-order (root, left, right)  
+        Adds delta to the element at a given index in O(log n)
+
+        :raises IndexError: If specified index is out of the tree bounds
         """
 
-        self._preOrder(self.root) 
-        
-    def _preOrder(self, root) -> None:
-        if not root:
-            return
+        index = _checkIndex(index, len(self)) + 1
+        if type(self.tree) == array.array and type(delta) not in _TYPECODES:
+            # Values that cannot be kept in a typed array move the sums into a list
+            self.tree = list(self.tree)
+        elif isinstance(delta, float) and type(self.tree) == array.array and self.tree.typecode == "q":
+            self.tree = array.array("d", self.tree)
+        tree: array.array | list = self.tree
+        while index < len(tree):
+            try:
+                tree[index] += delta
+            except OverflowError:
+                # The sum outgrew the typed array, nothing was stored so the remaining positions carry on in a list
+                self.tree = tree = list(tree)
+                tree[index] += delta
+            index += index & -index
 
-        print(root.val, end="")
-        self._preOrder(root.left)
-        self._preOrder(root.right)
+    def set(self, index: int, val: int | float) -> None:
+        """
+        Sets the element at a given index in O(log n)
+
+        :raises IndexError: If specified index is out of the tree bounds
+        """
 
+        self.add(index, val - self[index])
 
-    def inOrder(self) -> None:
+    def prefixSum(self, r: int) -> int | float:
         """
-        Prints nodes in-order (left, root, right) 
+        Returns the sum of the elements before index r in O(log n)
+
+        :raises IndexError: If r is not between 0 & the length of the tree
         """
 
-        self._inOrder(self.root)
-    
-    def _inOrder(self, root) -> None:
-        if not root:
-            return
+        _checkRange(0, r, len(self))
+        tree: array.array | list = self.tree
+        total: int | float = 0
+        while r > 0:
+            total += tree[r]
+            r &= r - 1
+        return total
 
-        self._inOrder(root.left)
-        print(root.val, end="")
-        self._inOrder(root.right)
+    def rangeSum(self, l: int, r: int) -> int | float:
+        """
+        Returns the sum of the elements from index l up to but not including r in O(log n)
+
+        :raises IndexError: If the range is not within the tree
+        """
 
+        _checkRange(l, r, len(self))
+        return self.prefixSum(r) - self.prefixSum(l)
 
-    def postOrder(self) -> list:
+    def lowerBound(self, target: int | float) -> int | None:
         """
-        Prints nodes in post-order (left, right, root) 
+        Returns the smallest r where prefixSum(r) >= target, or None if the whole tree sums to less than target, 
+        by descending the implicit tree in O(log n). The elements must not be negative
         """
 
-        self._postOrder(self.root)
-    
-    def _postOrder(self, root) -> None:
-        if not root:
-            return 
+        if target <= 0:
+            return 0
+        tree: array.array | list = self.tree
+        pos: int = 0
+        step: int = 1 << (len(self).bit_length() - 1) if len(self) else 0
+        while step:
+            if pos + step < len(tree) and tree[pos + step] < target:
+                pos += step
+                target -= tree[pos]
+            step >>= 1
+        return pos + 1 if pos < len(self) else None
 
-        self._postOrder(root.left)
-        self._postOrder(root.right)
-        print(root.val, end="")
-    
+    def print(self) -> None:
+        """
+        Prints the elements of the tree
+        """
 
-    def floor(self, k: int) -> int:
-        """ Returns the largest element that is less than or equal to k """
-        
-        return self.__floor(k, self.root)
+        print([self[i] for i in range(len(self))])
 
-    def __floor(self, k: int, root: TreeNode) -> int:
-        if not root:
-            return -1
+    @staticmethod
+    def __build(tree: array.array | list, values: list) -> array.array | list:
+        """ Builds the tree in O(n) by adding each position into the next one that covers it """
 
-        if root.val == k:
-            return root.val        
-        if root.val > k:
-            return self.__floor(k, root.left)
-        
-        floor: TreeNode | int = self.__floor(k, root.right)
-        return floor if floor <= k and floor != -1 else root.val
+        tree.extend(values)
+        n: int = len(values)
+        for i in range(1, n + 1):
+            j: int = i + (i & -i)
+            if j <= n:
+                tree[j] += tree[i]
+        return tree
 
 
-    def ceil(self, k: int) -> int:
-        """ Returns the smallest values that is greater than or equal to k """
-        
-        return self.__ceil(k, self.root)
-    
-    def __ceil(self, k: int, root: TreeNode) -> int:
-        if not root:
-            return -1
-        
-        if root.val == k:
-            return root.val
-        if root.val < k:
-           return self.__ceil(k, root.right) 
-        
-        ceil: TreeNode | int = self.__ceil(k, root.left)
-        return ceil if ceil >= k else root.val
+class RangeFenwickTree:
+    """
+    Range Fenwick tree - A pair of Fenwick trees over the differences between neighbouring elements of 
+                         an array that adds to a whole range & returns the sum of a range in O(log n). 
+                         Adding x to [l, r) changes two differences, & the sum of the first p elements 
+                         is p times the sum of the first p differences minus the sum of each difference 
+                         times its index. Ranges are half-open
+
+    Attributes:
+    -----------
+    diffs: FenwickTree
+        The differences d[i] = a[i] - a[i - 1]
+    weighted: FenwickTree
+        The differences multiplied by their index, d[i] * i
 
-    def print(self) -> None:
-        if self.__isEmpty():
-            print("Tree is empty")
-            return 
-        
-        height = self.__getHeight(self.root)
-        max_width = 2**height
-        level_nodes = [(self.root, max_width // 2)]
+    Methods:
+    --------
+    rangeAdd(l, r, delta)
+        Adds to every element from index l up to but not including r
+    add(index, delta)
+        Adds to an element
+    prefixSum(r)
+        Returns the sum of the elements before index r
+    rangeSum(l, r)
+        Returns the sum of the elements from index l up to but not including r
+    """
 
-        for level in range(height):
-            new_level_nodes = []
-            line = [" "] * max_width
+    def __init__(self, values: Iterable = ()) -> None:
+        values = list(values)
+        diffs: list = [val - prev for val, prev in zip(values, chain((0,), values))]
+        self.diffs: FenwickTree = FenwickTree(diffs)
+        self.weighted: FenwickTree = FenwickTree(d * i for i, d in enumerate(diffs))
 
-            for node, pos in level_nodes:
-                if node:
-                    line[pos] = str(node.val)
-                    new_level_nodes.append((node.left, pos-2**(height-level-2)))
-                    new_level_nodes.append((node.right, pos+2**(height-level-2)))
-            print("".join(line).rstrip())
+    def __len__(self) -> int:
+        return len(self.diffs)
 
-            if level < height-1:
-                slash_line = [" "] * max_width
-                for node, pos in level_nodes:
-                    if node and node.left:
-                        slash_line[pos-1] = "/"
-                    if node and node.right:
-                        slash_line[pos+1] = "\\"
-                print("".join(slash_line).rstrip())
-            
-            level_nodes = new_level_nodes
+    def __getitem__(self, index: int) -> int | float:
+        """
+        Returns the element at a given index in O(log n)
 
-    def __minVal(self, root: TreeNode) -> any:
-        """ Returns the minimum node of a subtree specified by an input root """
+        :raises IndexError: If specified index is out of the tree bounds
+        """
 
-        curr = root
-        while curr and curr.left:
-            curr = curr.left 
-        return curr 
+        return self.diffs.prefixSum(_checkIndex(index, len(self)) + 1)
 
-    def __getHeight(self, node) -> int:
-        """ Helper function to calculate height of binary search tree """
+    def rangeAdd(self, l: int, r: int, delta: int | float) -> None:
+        """
+        Adds delta to every element from index l up to but not including r in O(log n)
 
-        if not node:
-            return 0
-        return 1 + max(self.__getHeight(node.left), self.__getHeight(node.right)) 
+        :raises IndexError: If the range is not within the tree
+        """
 
-    def __isEmpty(self):
-        return not self.root
+        _checkRange(l, r, len(self))
+        if l == r:
+            return
+        self.diffs.add(l, delta)
+        self.weighted.add(l, delta * l)
+        if r < len(self):
+            self.diffs.add(r, -delta)
+            self.weighted.add(r, -delta * r)
 
+    def add(self, index: int, delta: int | float) -> None:
+        """
+        Adds delta to the element at a given index in O(log n)
 
-class MinHeap:
-    """
-    MinHeap - A structure in which the root node is the smallest value among its descendant nodes 
-           And the same property must follow for it's left and right subtrees also.
-    """
-    def __init__(self):
-        self.heap = []
+        :raises IndexError: If specified index is out of the tree bounds
+        """
 
-    def insert(self, val: any) -> None:
-        """ Inserts a value to the heap and orders depending on its value. Lowest becoming the root. """
-        self.heap.append(val)
-        index = len(self.heap) -1 
-        while index > 0 and self.heap[index-1 // 2] > self.heap[index]:
-            self.heap[index], self.heap[index-1 // 2] = self.heap[index-1 // 2], self.heap[index] 
-            index = (index - 1) // 2
-
-    def delete(self) -> None:
-        """ Removes the node with the smallest value from the heap """
-
-        # Stores value with minimum value i.e the 1st index in umderlying array 
-        res = self.heap[1]
-        # Update first element with last element 
-        self.heap[1] = self.heap.pop()
-        
-        # Ensure min property of heap 
-        # if root node is now larger than any of its descendatns move that node to the correct position 
+        index = _checkIndex(index, len(self))
+        self.rangeAdd(index, index + 1, delta)
 
-        # helper function to percolate nodes to correct position
-        self.__percolateDown()
-    
-    def __percolateDowm(self) -> None:
-        index = 1
-        # While current node is not a leaf node 
-        while 2*index < len(self.heap):
-            if (2*index + 1 < len(self.heap)) and self.heap[index] > self.heap[2*index+1]:
-                self.heap[index], self.heap[2*index+1] =  self.heap[2*index+1], self.heap[index]
-                index = 2*index+1
-            elif self.heap[index] > self.heap[2*index]:
-                self.heap[index], self.heap[2*index] =  self.heap[2*index], self.heap[index]
-                index = 2*index+1
-            else:
-                break
-        
+    def prefixSum(self, r: int) -> int | float:
+        """
+        Returns the sum of the elements before index r in O(log n)
 
+        :raises IndexError: If r is not between 0 & the length of the tree
+        """
 
-    def heapify(self, Iterable: list ) -> None:
-        pass
+        return r * self.diffs.prefixSum(r) - self.weighted.prefixSum(r)
 
+    def rangeSum(self, l: int, r: int) -> int | float:
+        """
+        Returns the sum of the elements from index l up to but not including r in O(log n)
 
-class MaxHeap:
-    pass
+        :raises IndexError: If the range is not within the tree
+        """
 
+        _checkRange(l, r, len(self))
+        return self.prefixSum(r) - self.prefixSum(l)
 
-class Vector:
-    """ 
-    """
+    def print(self) -> None:
+        """
+        Prints the elements of the tree
+        """
 
+        print([self[i] for i in range(len(self))])
 
-class Matrix:
+
+# Identities of the operations a SegmentTree can add to ranges with
+_SEGMENT_IDENTITIES: dict = {operator.add: 0, min: math.inf, max: -math.inf}
+
+
+class SegmentTree:
     """
-    Matrix - A two-dimnensional structure arranged in rows and columns   
+    Segment tree - A complete binary tree stored in an array where each node holds the combination of 
+                   the elements below it under any associative operation (sum, min, gcd, matrix product...), 
+                   answering the combination of any range & updating elements in O(log n). A range is 
+                   assigned or added to by tagging the O(log n) nodes covering it & pushing the tags down 
+                   only when a query or update passes through. Ranges are half-open
 
     Attributes:
     -----------
-    matrix: list
-        The underlying array that stores the elements in the matrix 
-    rows: int
-        The number of rows in the matrix     
-    cols: int
-        The number of columns in the matrix 
-    
+    op: Callable
+        An associative function of two arguments used to combine elements
+    identity: any
+        The value that op leaves any element unchanged with, used to pad the tree to a power of two
+    length: int
+        The number of elements
+    size: int
+        The number of leaves, the smallest power of two of at least length
+    tree: list
+        The combination of each node's elements, with the root at 1 & the children of k at 2k & 2k + 1
+    lazy: list
+        The pending (assign, value) tag of each internal node, or None
+
     Methods:
     --------
-    insert(val, row, column)
-        Inserts and overwrites a value into the matrix at a given position 
+    query(l, r)
+        Returns the combination of the elements from index l up to but not including r
+    set(index, val)
+        Sets an element
+    rangeAssign(l, r, val)
+        Sets every element of a range
+    rangeAdd(l, r, delta)
+        Adds to every element of a range, for sum, min & max trees
     """
 
-    def __init__(self, rows: int, cols: int) -> None:
-        self.rows: int = rows
-        self.columns: int = cols
-        self.matrix: list[list] = [[None for col in range(cols)] for _ in range(rows)]
+    def __init__(self, values: Iterable = (), op: Callable = operator.add, identity: any = None) -> None:
+        if identity is None:
+            if op not in _SEGMENT_IDENTITIES:
+                raise ValueError("An identity must be given for operations other than sum, min & max")
+            identity = _SEGMENT_IDENTITIES[op]
+        values = list(values)
+        self.op: Callable = op
+        self.identity: any = identity
+        self.length: int = len(values)
+        self.__log: int = max(len(values) - 1, 0).bit_length()
+        self.size: int = 1 << self.__log
+        self.tree: list = [identity] * self.size + values + [identity] * (self.size - len(values))
+        self.lazy: list = [None] * self.size
+        for k in range(self.size - 1, 0, -1):
+            self.tree[k] = op(self.tree[2 * k], self.tree[2 * k + 1])
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __iter__(self) -> Iterator:
+        for i in range(self.length):
+            yield self[i]
 
-    def insert(self, val: any, row: int, column: int) -> None:
-        """ 
-        Inserts and overwrites a value into the matrix at a given position 
+    def __getitem__(self, index: int) -> any:
+        """
+        Returns the element at a given index in O(log n)
 
-        :raises IndexError: If the row or column is out of matrix bounds
+        :raises IndexError: If specified index is out of the tree bounds
         """
 
-        if row < 0 or row > self.rows:
-            raise IndexError("Index out of bounds")
-        if column < 0 or column > self.columns:
-            raise IndexError("Index out of bounds")
-        
-        self.matrix[row][column] = val
-    
-    def remove(self, row: int, column: int) -> None:
+        index = _checkIndex(index, self.length) + self.size
+        for i in range(self.__log, 0, -1):
+            self.__push(index >> i)
+        return self.tree[index]
+
+    def query(self, l: int, r: int) -> any:
         """
-        Removes an element from the matrix at a specified index
+        Returns the combination of the elements from index l up to but not including r in order, 
+        or the identity if the range is empty, in O(log n)
 
-        :raises: Exception: If the index specified is empty
+        :raises IndexError: If the range is not within the tree
         """
 
-        if self.matrix[row][column] == None:
-            raise Exception("Cannot remove empty element")
-        
-        self.matrix[row][column] = None
-    
-    def search(self, target: any) -> bool:
+        _checkRange(l, r, self.length)
+        if l == r:
+            return self.identity
+        l += self.size
+        r += self.size
+        self.__pushBounds(l, r)
+
+        op: Callable = self.op
+        tree: list = self.tree
+        left: any = self.identity
+        right: any = self.identity
+        while l < r:
+            if l & 1:
+                left = op(left, tree[l])
+                l += 1
+            if r & 1:
+                r -= 1
+                right = op(tree[r], right)
+            l >>= 1
+            r >>= 1
+        return op(left, right)
+
+    def set(self, index: int, val: any) -> None:
         """
-        Searches for an element within the matrix, return True if found else False
+        Sets the element at a given index in O(log n)
+
+        :raises IndexError: If specified index is out of the tree bounds
         """
 
-        for i in range(self.rows):
-            for j in range(self.columns):
-                if self.matrix[i][j] == target:
-                    return True
-        return False
-    
-    def add(self, m: 'Matrix') -> None:
+        index = _checkIndex(index, self.length) + self.size
+        for i in range(self.__log, 0, -1):
+            self.__push(index >> i)
+        self.tree[index] = val
+        for i in range(1, self.__log + 1):
+            self.__pull(index >> i)
+
+    def rangeAssign(self, l: int, r: int, val: any) -> None:
         """
-        Performs matrix addition with another N x M matrix
+        Sets every element from index l up to but not including r to val in O(log n)
 
-        :raises Exception: If the matricies are not equal in size
+        :raises IndexError: If the range is not within the tree
         """
 
-        if (m.rows != self.rows) or (m.columns != self.columns):
-            raise Exception("Matricies my be the same size")
+        self.__update(l, r, (True, val))
 
-        for i in range(m.rows):
-            for j in range(m.columns):
-                self.matrix[i][j] += m.matrix[i][j]
+    def rangeAdd(self, l: int, r: int, delta: any) -> None:
+        """
+        Adds delta to every element from index l up to but not including r in O(log n)
 
-    def subtract(self, m: 'Matrix') -> None:
+        :raises ValueError: If the operation of the tree is not sum, min or max of numbers
+        :raises IndexError: If the range is not within the tree
         """
-        Performs matrix subtraction with another N x M matrix
 
-        :raises Exception: If the matricies are not equal in size
+        if self.op not in _SEGMENT_IDENTITIES or self.identity != _SEGMENT_IDENTITIES[self.op]:
+            raise ValueError("Range add is only supported for sum, min & max trees of numbers")
+        self.__update(l, r, (False, delta))
+
+    def print(self) -> None:
+        """
+        Prints the elements of the tree
         """
 
-        if (m.rows != self.rows) or (m.columns != self.columns):
-            raise Exception("Matricies my be the same size")
+        print(list(self))
 
-        for i in range(m.rows):
-            for j in range(m.columns):
-                self.matrix[i][j] -= m.matrix[i][j]
-    
-    def scalarMultiply(self, k: int) -> None:
+    def __update(self, l: int, r: int, tag: tuple) -> None:
+        """ Tags the nodes covering [l, r) & recombines their ancestors """
+
+        _checkRange(l, r, self.length)
+        if l == r:
+            return
+        l += self.size
+        r += self.size
+        self.__pushBounds(l, r)
+
+        lo, hi = l, r
+        while lo < hi:
+            if lo & 1:
+                self.__apply(lo, tag)
+                lo += 1
+            if hi & 1:
+                hi -= 1
+                self.__apply(hi, tag)
+            lo >>= 1
+            hi >>= 1
+
+        for i in range(1, self.__log + 1):
+            if (l >> i) << i != l:
+                self.__pull(l >> i)
+            if (r >> i) << i != r:
+                self.__pull((r - 1) >> i)
+
+    def __pushBounds(self, l: int, r: int) -> None:
+        """ Pushes the tags down the paths to the nodes either side of the leaf range [l, r) """
+
+        for i in range(self.__log, 0, -1):
+            if (l >> i) << i != l:
+                self.__push(l >> i)
+            if (r >> i) << i != r:
+                self.__push((r - 1) >> i)
+
+    def __apply(self, k: int, tag: tuple) -> None:
+        """ Applies an (assign, value) tag to node k & records it for its children """
+
+        length: int = self.size >> (k.bit_length() - 1)
+        assign, val = tag
+        if assign:
+            self.tree[k] = self.__repeat(val, length)
+        elif self.op is operator.add:
+            self.tree[k] += val * length
+        else:
+            self.tree[k] += val
+
+        if k < self.size:
+            pending: tuple | None = self.lazy[k]
+            if pending is not None and not assign:
+                # Adding after a pending assign or add folds into that tag
+                tag = (pending[0], pending[1] + val)
+            self.lazy[k] = tag
+
+    def __push(self, k: int) -> None:
+        """ Passes the pending tag of node k down to its children """
+
+        tag: tuple | None = self.lazy[k]
+        if tag is not None:
+            self.__apply(2 * k, tag)
+            self.__apply(2 * k + 1, tag)
+            self.lazy[k] = None
+
+    def __pull(self, k: int) -> None:
+        self.tree[k] = self.op(self.tree[2 * k], self.tree[2 * k + 1])
+
+    def __repeat(self, val: any, count: int) -> any:
+        """ Returns val combined with itself count times, by repeated squaring for general operations """
+
+        if self.op is operator.add:
+            return val * count
+        if self.op in _SEGMENT_IDENTITIES:
+            return val
+        result: any = self.identity
+        while count:
+            if count & 1:
+                result = self.op(result, val)
+            val = self.op(val, val)
+            count >>= 1
+        return result
+
+
+class SparseTable:
+    """
+    Sparse table - A read-only structure that answers range minimum (or maximum, gcd...) queries in O(1) 
+                   after O(n log n) preprocessing. Level k holds the result of each range of 2^k elements, 
+                   & any range is covered by two overlapping ranges from one level, so the operation must 
+                   be idempotent (combining an element with itself gives the element). Levels of all ints 
+                   or all floats are kept in typed arrays when every result fits in one. Ranges are half-open
+
+    Attributes:
+    -----------
+    op: Callable
+        An associative & idempotent function of two arguments used to combine elements
+    levels: list
+        The result of every range of 2^k elements starting at each index, for each k
+
+    Methods:
+    --------
+    query(l, r)
+        Returns the combination of the elements from index l up to but not including r
+    queryMany(ranges)
+        Returns the combination of the elements of each (l, r) range
+    """
+
+    def __init__(self, values: Iterable = (), op: Callable = min) -> None:
+        values = list(values)
+        self.op: Callable = op
+        # Mixed ints & floats stay in lists so every element keeps its own type
+        code: str | None = None
+        if all(type(val) is int for val in values):
+            code = "q"
+        elif all(type(val) is float for val in values):
+            code = "d"
+        try:
+            self.levels: list = self.__build(values, code)
+        except OverflowError:
+            self.levels = self.__build(values, None)
+
+    def __len__(self) -> int:
+        return len(self.levels[0])
+
+    def __getitem__(self, index: int) -> any:
         """
-        Multiplies matrix by given scalar k
+        Returns the element at a given index
+
+        :raises IndexError: If specified index is out of the table bounds
         """
-        
-        for i in range(self.rows):
-            for j in range(self.columns):
-                if self.matrix[i][j] is not None:
-                    self.matrix[i][j] *= k
-         
+
+        return self.levels[0][_checkIndex(index, len(self))]
+
+    def query(self, l: int, r: int) -> any:
+        """
+        Returns the combination of the elements from index l up to but not including r in O(1)
+
+        :raises IndexError: If the range is not within the table
+        :raises ValueError: If the range is empty
+        """
+
+        _checkRange(l, r, len(self))
+        if l == r:
+            raise ValueError("Range must not be empty")
+        k: int = (r - l).bit_length() - 1
+        level: array.array | list = self.levels[k]
+        return self.op(level[l], level[r - (1 << k)])
+
+    def queryMany(self, ranges: Iterable) -> list:
+        """
+        Returns the combination of the elements of each (l, r) range in O(1) per range
+
+        :raises IndexError: If a range is not within the table
+        :raises ValueError: If a range is empty
+        """
+
+        op: Callable = self.op
+        levels: list = self.levels
+        n: int = len(self)
+        out: list = []
+        for l, r in ranges:
+            if not 0 <= l < r <= n:
+                _checkRange(l, r, n)
+                raise ValueError("Range must not be empty")
+            k: int = (r - l).bit_length() - 1
+            out.append(op(levels[k][l], levels[k][r - (1 << k)]))
+        return out
+
     def print(self) -> None:
         """
-        Prints contents of the matrix
+        Prints the elements of the table
         """
 
-        for i in range(self.rows):
-            for j in range(len(self.matrix[i])):
-                print(self.matrix[i][j], end=" ")
-            print()
+        print(list(self.levels[0]))
 
+    def __build(self, values: list, code: str | None) -> list:
+        """ Builds every level, in typed arrays of the given typecode or lists if it is None """
 
-class HashTable:
+        level: array.array | list = array.array(code, values) if code else values
+        levels: list = [level]
+        width: int = 1
+        while 2 * width <= len(values):
+            count: int = len(level) - width
+            combined: Iterator = map(self.op, islice(level, count), islice(level, width, None))
+            level = array.array(code, combined) if code else list(combined)
+            levels.append(level)
+            width *= 2
+        return levels
+
+
+class SqrtDecomposition:
     """
-    Hash Table - A structure that creates a mapping between keys and values using hashing  
-                 this implementation uses chaining to deal with collisions
+    Sqrt decomposition - An array split into blocks of about sqrt(n) elements, each storing the combination 
+                         of its elements under any associative operation. A range query combines the whole 
+                         blocks inside it with the elements at either end, & a point update recombines one 
+                         block, both in O(sqrt n), which suits workloads mixing updates & queries. Sum, min 
+                         & max arrays can also add to a range, keeping a pending add for each whole block. 
+                         Ranges are half-open
 
     Attributes:
     -----------
-    capacity: int
-        The maximum size of the hash table
-    table: list
-        The actual hash table data structure
+    op: Callable
+        An associative function of two arguments used to combine elements
+    identity: any
+        The value that op leaves any element unchanged with, the result of an empty range
+    blockSize: int
+        The number of elements in each block
+    values: list
+        The elements, not including the pending adds of their blocks
+    blocks: list
+        The combination of each block, including its pending add
+    lazy: list | None
+        The pending add of each block, or None if the operation does not support range add
 
     Methods:
     --------
-    __hash(key)
-        Takes a key argument of either type string or int and performs hash function to produce some index 
-    insert(item)
-        Inserts an item into the hash table 
-    remove(item)
-        Removes an item from the hash table 
-    print()
-        Prints the contents of the hash table  
-    __getCapacity()
-        Getter method for capacity
+    query(l, r)
+        Returns the combination of the elements from index l up to but not including r
+    queryMany(ranges)
+        Returns the combination of the elements of each (l, r) range
+    set(index, val)
+        Sets an element
+    rangeAdd(l, r, delta)
+        Adds to every element of a range, for sum, min & max arrays
     """
 
-    def __init__(self, capacity: int) -> None:
-        self.capacity: int = capacity
-        self.table: list[list] = [[] for _ in range(capacity)]
+    def __init__(self, values: Iterable = (), op: Callable = operator.add, identity: any = None, blockSize: int | None = None) -> None:
+        if identity is None:
+            if op not in _SEGMENT_IDENTITIES:
+                raise ValueError("An identity must be given for operations other than sum, min & max")
+            identity = _SEGMENT_IDENTITIES[op]
+        if blockSize is not None and blockSize <= 0:
+            raise ValueError("Block size must be positive")
+        self.op: Callable = op
+        self.identity: any = identity
+        self.values: list = list(values)
+        self.blockSize: int = blockSize or max(math.isqrt(len(self.values)), 1)
+        self.blocks: list = [self.__combine(start, min(start + self.blockSize, len(self.values))) 
+                             for start in range(0, len(self.values), self.blockSize)]
+        # Pending adds only make sense for numbers, so a sum of strings or lists keeps none
+        numeric: bool = op in _SEGMENT_IDENTITIES and identity == _SEGMENT_IDENTITIES[op]
+        self.lazy: list | None = [0] * len(self.blocks) if numeric else None
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __iter__(self) -> Iterator:
+        for i in range(len(self.values)):
+            yield self[i]
+
+    def __getitem__(self, index: int) -> any:
+        """
+        Returns the element at a given index in O(1)
 
-    def __hash(self, key: any) -> int:
-        """ 
-        Takes a key argument of either type string or int and performs hash function to produce some index 
+        :raises IndexError: If specified index is out of the array bounds
+        """
 
-        :param key: The key that will be mapped to a value
+        index = _checkIndex(index, len(self.values))
+        if self.lazy is None:
+            return self.values[index]
+        return self.values[index] + self.lazy[index // self.blockSize]
+
+    def query(self, l: int, r: int) -> any:
         """
-        
-        if type(key) == int:
-            # Use division hash algorithm h(key) = key % capacity
-            return key % self.capacity
-        if type(key) == str:
-            # Use ASCII characters: h(key) = sum(a for c in s) % capacity
-            # where a is ascii value, c is the character, s is the string input
-            return (sum(ord(c) for c in key) % self.capacity)
+        Returns the combination of the elements from index l up to but not including r in order, 
+        or the identity if the range is empty, in O(sqrt n)
 
-    def insert(self, item: any) -> None:
-        """ 
-        Inserts an item into the hash table 
+        :raises IndexError: If the range is not within the array
+        """
 
-        :param item: Item that will be inserted into the hash table
+        _checkRange(l, r, len(self.values))
+        op: Callable = self.op
+        size: int = self.blockSize
+        first, last = -(-l // size), r // size
+        if first >= last:
+            return self.__partial(self.identity, l, r)
+
+        result: any = self.__partial(self.identity, l, first * size)
+        for b in range(first, last):
+            result = op(result, self.blocks[b])
+        return self.__partial(result, last * size, r)
+
+    def queryMany(self, ranges: Iterable) -> list:
         """
-        
-        index: int = self.__hash(item)
-        self.table[index].append(item)
+        Returns the combination of the elements of each (l, r) range in O(sqrt n) per range
 
-    def remove(self, item: any) -> None:
-        """ 
-        Removes an item from the hash table 
+        :raises IndexError: If a range is not within the array
+        """
 
-        :param item: Item that will be removed from the hash table
+        return [self.query(l, r) for l, r in ranges]
+
+    def set(self, index: int, val: any) -> None:
         """
+        Sets the element at a given index & recombines its block in O(sqrt n)
+
+        :raises IndexError: If specified index is out of the array bounds
+        """
+
+        index = _checkIndex(index, len(self.values))
+        b: int = index // self.blockSize
+        self.values[index] = val if self.lazy is None else val - self.lazy[b]
+        self.__rebuild(b)
+
+    def rangeAdd(self, l: int, r: int, delta: any) -> None:
+        """
+        Adds delta to every element from index l up to but not including r in O(sqrt n)
+
+        :raises ValueError: If the operation of the array is not sum, min or max
+        :raises IndexError: If the range is not within the array
+        """
+
+        if self.lazy is None:
+            raise ValueError("Range add is only supported for sum, min & max arrays")
+        _checkRange(l, r, len(self.values))
+        size: int = self.blockSize
+        b: int = l // size
+        while l < r:
+            stop: int = min((b + 1) * size, len(self.values))
+            if l == b * size and stop <= r:
+                # Whole block: record the add & adjust its combination without touching the elements
+                self.lazy[b] += delta
+                self.blocks[b] += delta * (stop - l) if self.op is operator.add else delta
+            else:
+                for i in range(l, min(stop, r)):
+                    self.values[i] += delta
+                self.__rebuild(b)
+            l = stop
+            b += 1
 
-        index: int = self.__hash(item)
-        if item not in self.table[index]:
-            return
-        self.table[index].remove(item)
-    
     def print(self) -> None:
-        """ 
-        Prints the contents of the hash table  
         """
-        
-        for i in range(self.capacity):
-            print(f"{i}", end="")
-            for j in self.table[i]:
-                print(f" --> {j}", end="")
-            print()
-    
-    def __getCapacity(self) -> int: return self.capacity 
+        Prints the elements of the array
+        """
+
+        print(list(self))
+
+    def __partial(self, result: any, l: int, r: int) -> any:
+        """ Combines result with the elements from l up to but not including r, a block at a time """
+
+        op: Callable = self.op
+        size: int = self.blockSize
+        while l < r:
+            b: int = l // size
+            stop: int = min((b + 1) * size, r)
+            vals: list = self.values[l:stop]
+            if self.lazy is None:
+                for val in vals:
+                    result = op(result, val)
+            elif op is operator.add:
+                result += sum(vals) + self.lazy[b] * len(vals)
+            else:
+                result = op(result, op(vals) + self.lazy[b])
+            l = stop
+        return result
+
+    def __combine(self, l: int, r: int) -> any:
+        """ Returns the combination of the stored values from l up to but not including r """
+
+        result: any = self.identity
+        for i in range(l, r):
+            result = self.op(result, self.values[i])
+        return result
+
+    def __rebuild(self, b: int) -> None:
+        """ Recombines a block from its elements & pending add """
+
+        start: int = b * self.blockSize
+        stop: int = min(start + self.blockSize, len(self.values))
+        if self.lazy is None:
+            self.blocks[b] = self.__combine(start, stop)
+        else:
+            self.blocks[b] = self.__partial(self.identity, start, stop)
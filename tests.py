@@ -1,9 +1,39 @@
+import algorithms
+import array
+import asyncio
+import datastructs
 from datastructs import *
+from decimal import Decimal
+from fractions import Fraction
+import io
+import math
+import operator
+import os
+import random
+import tempfile
+import threading
 import unittest
 
 # Static array test cases:
 class StaticArrayTests(unittest.TestCase):
-    pass
+    def testMmapPersistsElementsAndLength(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "ids.bin")
+            arr = Array.openMmap(path, 8, int)
+            for val in (5, 3, 9, 1):
+                arr.append(val)
+            arr.delete(9)
+            arr.sort()
+            view = arr[1:]
+            view[0] = 4
+            view.release()
+            arr.close()
+
+            arr = Array.openMmap(path, 8, int)
+            self.assertEqual((list(arr), arr.length), ([1, 4, 5], 3))
+            self.assertRaises(TypeError, arr.append, 1.5)
+            arr.close()
+            self.assertRaises(ValueError, Array.openMmap, path, 16, int)
 
 # Dynamic array test cases:
 class DynamicArrayTests(unittest.TestCase):
@@ -11,8 +41,948 @@ class DynamicArrayTests(unittest.TestCase):
 
 # Stack test cases:
 class StackTests(unittest.TestCase):
-    pass
+    def testBulkOperations(self):
+        stack = Stack()
+        stack.pushMany([1, 2, 3, 4])
+        self.assertEqual(stack.popMany(3), [4, 3, 2])
+        self.assertEqual(stack.peek(), 1)
+        self.assertEqual(stack.popMany(5), [1])
+        self.assertRaises(Exception, stack.pop)
+
+    def testCapacity(self):
+        stack = Stack(capacity=2)
+        stack.push("a")
+        self.assertRaises(OverflowError, stack.pushMany, ["b", "c"])
+        stack.push("b")
+        self.assertRaises(OverflowError, stack.push, "c")
+        stack.clear()
+        self.assertEqual(len(stack), 0)
+
+    def testTypedStack(self):
+        stack = Stack(type=float)
+        stack.pushMany([1.5, 2.5])
+        self.assertIsInstance(stack.stack, array.array)
+        self.assertRaises(TypeError, stack.push, "x")
+        self.assertRaises(TypeError, Stack(type=str).push, 1)
+        self.assertRaises(TypeError, Stack(type=int).push, True)
+        self.assertRaises(TypeError, stack.push, 1)
+        self.assertRaises(TypeError, stack.pushMany, [3.5, 4])
+        self.assertRaises(TypeError, MinMaxStack(type=int).pushMany, [1, 2.0])
+        self.assertEqual(list(stack), [1.5, 2.5])
+
+    def testMinMaxStack(self):
+        stack = MinMaxStack(type=int)
+        stack.pushMany([5, 3, 8])
+        stack.push(1)
+        self.assertEqual((stack.min(), stack.max()), (1, 8))
+        stack.pop()
+        self.assertEqual((stack.min(), stack.max()), (3, 8))
+        stack.popMany(2)
+        self.assertEqual((stack.min(), stack.max()), (5, 5))
 
 # Singly linked list test cases:
 class SinglyLLTests(unittest.TestCase):
-    pass
\ No newline at end of file
+    def testRemoveAtUnlinksNode(self):
+        ll = SinglyLL()
+        for i in range(4):
+            ll.insertTail(i)
+        ll.removeAt(3)
+        ll.removeAt(1)
+        self.assertEqual((ll.find(1), ll.find(2), ll.tail.val, ll.length), (-1, 1, 2, 2))
+
+
+# Unrolled linked list & indexable skip list test cases:
+class PositionalListTests(unittest.TestCase):
+    def checkList(self, ll):
+        for i in range(10):
+            ll.insertTail(i)
+        ll.insertHead(-1)
+        ll.insertAt(99, 5)
+        self.assertEqual([ll.get(i) for i in range(ll.length)], [-1, 0, 1, 2, 3, 99, 4, 5, 6, 7, 8, 9])
+        self.assertEqual(ll.removeAt(5), 99)
+        self.assertEqual((ll.removeHead(), ll.removeTail()), (-1, 9))
+        ll.reverse()
+        self.assertEqual(ll.find(8), 0)
+        self.assertEqual(ll.find(42), -1)
+        self.assertRaises(IndexError, ll.get, ll.length)
+
+    def testUnrolledLL(self):
+        self.checkList(UnrolledLL(blockSize=3))
+
+    def testIndexableSkipList(self):
+        self.checkList(IndexableSkipList())
+
+# Pointer binary tree test cases:
+class PointerBinaryTreeTests(unittest.TestCase):
+    def testInsertLevelOrder(self):
+        tree = PointerBinaryTree()
+        for i in range(7):
+            tree.insert(i)
+        self.assertEqual(tree.levelOrder(), list(range(7)))
+        self.assertEqual(tree.root.left.right.val, 4)
+
+    def testPopRemovesDeepest(self):
+        tree = PointerBinaryTree()
+        for i in range(5):
+            tree.insert(i)
+        self.assertEqual(tree.pop(), 4)
+        self.assertIsNone(tree.root.left.right)
+        self.assertEqual(tree.levelOrder(), [0, 1, 2, 3])
+
+    def testRemoveReplacesWithDeepest(self):
+        tree = PointerBinaryTree()
+        for i in range(5):
+            tree.insert(i)
+        tree.remove(1)
+        self.assertEqual(tree.levelOrder(), [0, 4, 2, 3])
+        tree.remove(3)
+        self.assertEqual(tree.levelOrder(), [0, 4, 2])
+
+    def testPopUntilEmpty(self):
+        tree = PointerBinaryTree()
+        tree.insert(1)
+        self.assertEqual(tree.pop(), 1)
+        self.assertIsNone(tree.root)
+        self.assertRaises(Exception, tree.pop)
+
+
+# Heap test cases:
+class HeapTests(unittest.TestCase):
+    def testMinHeapOrdering(self):
+        heap = MinHeap([5, 3, 8, 1, 9, 2])
+        heap.insert(0)
+        self.assertEqual([heap.delete() for _ in range(len(heap))], [0, 1, 2, 3, 5, 8, 9])
+        self.assertRaises(Exception, heap.delete)
+
+    def testMaxHeapWithKey(self):
+        heap = MaxHeap(["bb", "a", "dddd", "ccc"], key=len)
+        self.assertEqual(heap.peek(), "dddd")
+        self.assertEqual(heap.pushPop("eeeee"), "eeeee")
+        self.assertEqual(heap.replace("z"), "dddd")
+        self.assertEqual(heap.delete(), "ccc")
+
+    def testMergeAndSelection(self):
+        heap = MinHeap([4, 7, 1])
+        heap.merge(MinHeap([6, 2, 9, 3]))
+        self.assertEqual(heap.nSmallest(3), [1, 2, 3])
+        self.assertEqual(heap.nLargest(2), [9, 7])
+        self.assertEqual(MaxHeap(heap.heap).nSmallest(2), [1, 2])
+        self.assertEqual(len(heap), 7)
+        small = MinHeap([3, 1])
+        small.merge(small)
+        self.assertEqual([small.delete() for _ in range(len(small))], [1, 1, 3, 3])
+
+    def testIndexedHeapDecreaseKeyAndRemove(self):
+        heap = IndexedMinHeap()
+        handles = {name: heap.insert(name, p) for name, p in [("a", 5), ("b", 3), ("c", 8), ("d", 1)]}
+        heap.decreaseKey(handles["c"], 0)
+        self.assertEqual(heap.peek(), "c")
+        self.assertRaises(ValueError, heap.decreaseKey, handles["a"], 10)
+        self.assertEqual(heap.remove(handles["d"]), "d")
+        self.assertEqual([heap.delete() for _ in range(len(heap))], ["c", "b", "a"])
+        self.assertRaises(Exception, heap.remove, handles["a"])
+
+    def testDAryHeap(self):
+        values = [9, 4, 7, 1, 8, 2, 6, 3, 5, 0]
+        for d in (2, 3, 5):
+            heap = DAryHeap(values, d=d)
+            self.assertEqual(heap.nSmallest(3), [0, 1, 2])
+            self.assertEqual([heap.delete() for _ in range(len(heap))], sorted(values))
+        self.assertRaises(ValueError, DAryHeap, d=1)
+
+    def testPairingHeap(self):
+        heap = PairingHeap()
+        nodes = [heap.insert(str(p), p) for p in [5, 3, 8, 1, 9, 2]]
+        heap.decreaseKey(nodes[4], 0)
+        self.assertEqual(heap.peek(), "9")
+        self.assertEqual(heap.remove(nodes[0]), "5")
+        other = PairingHeap()
+        other.insert("x", -1)
+        heap.merge(other)
+        self.assertEqual(len(other), 0)
+        self.assertEqual([heap.delete() for _ in range(len(heap))], ["x", "9", "1", "2", "3", "8"])
+        self.assertRaises(Exception, heap.decreaseKey, nodes[1], 0)
+
+        # Nodes belong to the heap they were merged into & no other
+        first, second = PairingHeap(), PairingHeap()
+        a, b = first.insert("a", 2), second.insert("b", 1)
+        self.assertNotIn(b, first)
+        first.merge(second)
+        self.assertEqual((b in first, b in second, len(first)), (True, False, 2))
+        self.assertRaises(Exception, second.remove, b)
+        self.assertRaises(ValueError, first.merge, first)
+        first.decreaseKey(a, 0)
+        self.assertEqual([first.delete(), first.delete()], ["a", "b"])
+
+
+# Priority queue test cases:
+class PriorityQueueTests(unittest.TestCase):
+    def testStableOrdering(self):
+        for pq in (PriorityQueue(), PriorityQueue(levels=4)):
+            pq.pushMany([("a", 2), ("b", 1), ("c", 2), ("d", 0), ("e", 1)])
+            self.assertEqual(pq.peek(), "d")
+            self.assertEqual(pq.popMany(10), ["d", "b", "e", "a", "c"])
+            self.assertRaises(Exception, pq.pop)
+
+    def testUpdateAndRemove(self):
+        for pq in (PriorityQueue(), PriorityQueue(levels=4)):
+            a = pq.push("a", 3)
+            b = pq.push("b", 2)
+            pq.push("c", 1)
+            pq.updatePriority(a, 0)
+            pq.remove(b)
+            self.assertEqual(len(pq), 2)
+            self.assertEqual([pq.pop(), pq.pop()], ["a", "c"])
+            self.assertRaises(Exception, pq.remove, b)
+
+    def testBucketedRejectsInvalidPriority(self):
+        pq = PriorityQueue(levels=2)
+        self.assertRaises(ValueError, pq.push, "a", 2)
+        self.assertRaises(ValueError, pq.push, "a", 0.5)
+
+
+# Deque test cases:
+class DequeTests(unittest.TestCase):
+    def testBothEnds(self):
+        dq = Deque()
+        for i in range(20):
+            dq.append(i)
+            dq.appendLeft(-i)
+        self.assertEqual(len(dq), 40)
+        self.assertEqual((dq.pop(), dq.popLeft()), (19, -19))
+        self.assertEqual((dq[0], dq[-1]), (-18, 18))
+        self.assertRaises(IndexError, dq.__getitem__, 38)
+
+    def testExtendAndRotate(self):
+        dq = Deque()
+        dq.extend([1, 2, 3])
+        dq.extendLeft([0, -1])
+        self.assertEqual([dq[i] for i in range(len(dq))], [-1, 0, 1, 2, 3])
+        dq.rotate(2)
+        self.assertEqual([dq[i] for i in range(len(dq))], [2, 3, -1, 0, 1])
+        dq.rotate(-3)
+        self.assertEqual([dq[i] for i in range(len(dq))], [0, 1, 2, 3, -1])
+
+    def testPopEmpty(self):
+        dq = Deque()
+        self.assertRaises(Exception, dq.pop)
+        self.assertRaises(Exception, dq.popLeft)
+
+
+# Circular queue test cases:
+class CircularQueueTests(unittest.TestCase):
+    def testFifoAndGrowth(self):
+        q = CircularQueue(2, int)
+        for i in range(10):
+            q.enqueue(i)
+        self.assertEqual((q.getfront(), q.getRear()), (0, 9))
+        self.assertEqual([q.dequeue() for _ in range(10)], list(range(10)))
+        self.assertRaises(Exception, q.dequeue)
+        self.assertRaises(TypeError, q.enqueue, "a")
+
+
+# Iteration & view test cases:
+class ProtocolTests(unittest.TestCase):
+    def testContainersIterate(self):
+        stack, ll, queue, dq = Stack(), SinglyLL(), Queue(), Deque()
+        for i in range(5):
+            stack.push(i)
+            ll.insertTail(i)
+            queue.enqueue(i)
+            dq.append(i)
+        for container in (stack, ll, queue, dq):
+            self.assertEqual(list(container), [0, 1, 2, 3, 4])
+            self.assertEqual((len(container), container[-1]), (5, 4))
+            self.assertIn(3, container)
+            self.assertNotIn(7, container)
+
+    def testSliceViewsDoNotCopy(self):
+        stack = Stack()
+        for i in range(6):
+            stack.push(i)
+        view = stack[1:5]
+        stack.stack[2] = 20
+        self.assertEqual(list(view), [1, 20, 3, 4])
+        self.assertEqual(list(view[::-2]), [4, 20])
+
+        dq = Deque()
+        dq.extend(range(6))
+        dq.appendLeft(-1)
+        view = dq[::2]
+        view[1] = 10
+        self.assertEqual((list(view), dq[2]), ([-1, 10, 3, 5], 10))
+
+    def testSliceViewsAllowResizing(self):
+        stack = Stack(type=int)
+        stack.pushMany([1, 2, 3])
+        view = stack[0:2]
+        stack.push(4)
+        view[0] = 9
+        self.assertEqual((list(view), stack.pop(), stack[0]), ([9, 2], 4, 9))
+        stack.clear()
+        stack.pushMany([5, 6])
+        self.assertEqual(list(view), [5, 6])
+
+    def testLengthAndIndexingAfterRemovals(self):
+        linked = DoublyLL()
+        for i in range(4):
+            linked.insertTail(i)
+        linked.removeHead()
+        linked.removeTail()
+        self.assertEqual((len(linked), linked[0], linked[-1], list(linked)), (2, 1, 2, [1, 2]))
+        self.assertRaises(IndexError, linked.__getitem__, 2)
+        linked.removeHead()
+        linked.removeTail()
+        self.assertEqual((len(linked), linked.head, linked.tail), (0, None, None))
+        self.assertRaises(IndexError, linked.__getitem__, 0)
+
+    def testMatrixRowsAndCells(self):
+        m = Matrix(2, 2)
+        m.insert(7, 1, 0)
+        self.assertEqual(m[1, 0], 7)
+        self.assertEqual(list(m[1]), [7, None])
+        self.assertEqual(m[1][0], 7)
+        self.assertIn(7, m)
+        self.assertRaises(IndexError, m.__getitem__, (2, 0))
+
+
+# Circular buffer test cases:
+class CircularBufferTests(unittest.TestCase):
+    def testOverwritesOldest(self):
+        cb = CircularBuffer(4, int)
+        for i in range(6):
+            cb.insert(i)
+        self.assertEqual(list(cb), [2, 3, 4, 5])
+        self.assertEqual((cb.getFirst(), cb.getLast()), (2, 5))
+
+    def testBulkWriteAndRead(self):
+        cb = CircularBuffer(5, float)
+        cb.write([1.0, 2.0, 3.0])
+        self.assertEqual(list(cb.read(2)), [1.0, 2.0])
+        cb.write([4.0, 5.0, 6.0, 7.0, 8.0])
+        self.assertEqual(list(cb.peek(10)), [4.0, 5.0, 6.0, 7.0, 8.0])
+        self.assertEqual(list(cb.read(3)), [4.0, 5.0, 6.0])
+        self.assertEqual(len(cb), 2)
+
+    def testNoOverwriteMode(self):
+        cb = CircularBuffer(2, str, overwrite=False)
+        cb.write(["a", "b"])
+        self.assertRaises(MemoryError, cb.insert, "c")
+        self.assertRaises(MemoryError, cb.write, ["c"])
+        self.assertRaises(TypeError, CircularBuffer(2, str).insert, 1)
+
+    def testTypedStorage(self):
+        self.assertIsInstance(CircularBuffer(4, int).buffer, array.array)
+        self.assertIsInstance(CircularBuffer(4, bytes).buffer, bytearray)
+        cb = CircularBuffer(4, bytes)
+        cb.write(b"hello")
+        self.assertEqual(cb.read(4), bytearray(b"ello"))
+
+    def testTypedStorageChecksValues(self):
+        cb = CircularBuffer(4, bytes)
+        cb.insert(b"a")
+        cb.write([b"b", b"c"])
+        self.assertEqual(cb.read(3), bytearray(b"abc"))
+        self.assertRaises(TypeError, cb.insert, 97)
+        self.assertRaises(TypeError, cb.insert, b"ab")
+        self.assertRaises(TypeError, CircularBuffer(4, float).insert, 1)
+        self.assertRaises(TypeError, CircularBuffer(4, float).write, [1.0, 2])
+        self.assertRaises(TypeError, CircularBuffer(4, "d").insert, 1)
+
+
+# Blocking queue & SPSC ring test cases:
+class ConcurrentQueueTests(unittest.TestCase):
+    def testBlockingQueueTimeouts(self):
+        q = BlockingQueue(2)
+        self.assertRaises(TimeoutError, q.get, 0.01)
+        q.putMany([1, 2])
+        self.assertRaises(TimeoutError, q.put, 3, 0.01)
+        self.assertEqual(q.getMany(5), [1, 2])
+
+    def testBlockingQueueAcrossThreads(self):
+        q = BlockingQueue(8)
+        received = []
+
+        def consume():
+            while len(received) < 1000:
+                received.extend(q.getMany(16))
+
+        consumer = threading.Thread(target=consume)
+        consumer.start()
+        q.putMany(range(500))
+        for i in range(500, 1000):
+            q.put(i)
+        consumer.join(timeout=5)
+        self.assertEqual(received, list(range(1000)))
+
+    def testSPSCRing(self):
+        ring = SPSCRing(4, int)
+        self.assertEqual(ring.write([1, 2, 3, 4, 5]), 4)
+        self.assertFalse(ring.tryPut(6))
+        self.assertEqual(list(ring.read(3)), [1, 2, 3])
+        ring.put(5)
+        self.assertEqual(ring.write([6, 7]), 2)
+        self.assertEqual([ring.get() for _ in range(4)], [4, 5, 6, 7])
+        self.assertRaises(TimeoutError, ring.get, 0.01)
+
+    def testSPSCRingWriteLeavesRestOfIterator(self):
+        ring = SPSCRing(3, int)
+        values = iter(range(10))
+        self.assertEqual(ring.write(values), 3)
+        self.assertEqual(next(values), 3)
+        self.assertEqual(ring.write(range(5)), 0)
+        ring = SPSCRing(4, bytes)
+        self.assertEqual(ring.write(b"hello"), 4)
+        self.assertEqual(ring.read(4), bytearray(b"hell"))
+
+
+# Async adapter test cases:
+class AsyncQueueTests(unittest.IsolatedAsyncioTestCase):
+    async def testBackpressure(self):
+        q = AsyncQueue(1)
+        await q.put(1)
+        pending = asyncio.create_task(q.put(2))
+        await asyncio.sleep(0)
+        self.assertFalse(pending.done())
+        self.assertEqual(await q.get(), 1)
+        await pending
+        self.assertEqual(await q.getMany(5), [2])
+        with self.assertRaises(TimeoutError):
+            await q.getMany(5, timeout=0.01)
+
+    async def testCancelledGetDoesNotLoseElements(self):
+        q = AsyncQueue()
+        getter = asyncio.create_task(q.get())
+        await asyncio.sleep(0)
+        getter.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await getter
+        q.putNowait("a")
+        self.assertEqual(await q.get(), "a")
+
+    async def testPriorityAndBufferAdapters(self):
+        pq = AsyncPriorityQueue()
+        await pq.put("low", 5)
+        await pq.put("high", 1)
+        self.assertEqual(await pq.getMany(2), ["high", "low"])
+
+        cb = AsyncCircularBuffer(3, int, overwrite=True)
+        for i in range(5):
+            await cb.put(i)
+        self.assertEqual(list(await cb.getMany(10)), [2, 3, 4])
+
+
+# Sliding window test cases:
+class SlidingWindowTests(unittest.TestCase):
+    def testMonotonicQueue(self):
+        values = [4, 2, 12, 3, 8, 1, 7]
+        self.assertEqual(MonotonicQueue(3).pushMany(values), [4, 2, 2, 2, 3, 1, 1])
+        window = MonotonicQueue(3, maximum=True)
+        self.assertEqual(window.pushMany(values), [4, 4, 12, 12, 12, 8, 8])
+        self.assertEqual((window.get(), len(window)), (8, 3))
+        self.assertRaises(Exception, MonotonicQueue(2).get)
+
+    def testSlidingWindowAggregator(self):
+        window = SlidingWindowAggregator(3, lambda a, b: a + b)
+        self.assertEqual(window.pushMany([1, 2, 3, 4, 5]), [1, 3, 6, 9, 12])
+        self.assertEqual(window.popLeft(), 3)
+        self.assertEqual(window.get(), 9)
+
+        # Non-commutative operations are combined from oldest to newest
+        window = SlidingWindowAggregator(2, lambda a, b: a + b)
+        self.assertEqual(window.pushMany(["a", "b", "c"]), ["a", "ab", "bc"])
+
+
+# Persistent structure test cases:
+class PersistentTests(unittest.TestCase):
+    def testPersistentStackSharesNodes(self):
+        base = PersistentStack([1, 2])
+        pushed = base.push(3)
+        self.assertEqual((list(base), list(pushed)), ([2, 1], [3, 2, 1]))
+        self.assertIs(pushed.pop().head, base.head)
+        self.assertRaises(Exception, PersistentStack().pop)
+
+    def testPersistentVectorVersions(self):
+        v1 = PersistentVector(range(1000))
+        v2 = v1.set(500, -1).append(1000)
+        self.assertEqual((v1[500], v2[500], v2[-1], len(v2)), (500, -1, 1000, 1001))
+        v3 = v2
+        for _ in range(968):
+            v3 = v3.pop()
+        self.assertEqual(list(v3), [i if i != 500 else -1 for i in range(33)])
+        self.assertEqual(list(v1), list(range(1000)))
+
+    def testPersistentHashMapVersions(self):
+        m1 = PersistentHashMap({"a": 1, "b": 2})
+        m2 = m1.set("c", 3).remove("a")
+        self.assertEqual(dict(m1.items()), {"a": 1, "b": 2})
+        self.assertEqual(dict(m2.items()), {"b": 2, "c": 3})
+        self.assertNotIn("a", m2)
+        self.assertRaises(KeyError, m2.remove, "a")
+        big = PersistentHashMap((i, i * i) for i in range(5000))
+        self.assertEqual((len(big), big[4321], big.get(-1)), (5000, 4321 * 4321, None))
+
+    def testPersistentHashMapCollisions(self):
+        # hash(-1) == hash(-2), so they share a collision node that other keys must not join
+        m = PersistentHashMap({-1: "a", -2: "b"})
+        for i in range(2000):
+            m = m.set(i, i)
+        self.assertEqual((len(m), m[-1], m[-2], m[1999]), (2002, "a", "b", 1999))
+        stack, longest = [m.root], 0
+        while stack:
+            node = stack.pop()
+            if type(node) == datastructs._CollisionNode:
+                longest = max(longest, len(node.entries))
+                self.assertTrue(all(hash(key) == hash(-1) for key, _ in node.entries))
+            stack.extend(entry for entry in node.entries if type(entry) != tuple)
+        self.assertEqual(longest, 2)
+        m = m.remove(-1)
+        self.assertEqual((len(m), -1 in m, m[-2], m[0]), (2001, False, "b", 0))
+
+
+# Vector test cases:
+class VectorTests(unittest.TestCase):
+    backend = "python"
+
+    def testArithmeticAndNorms(self):
+        u, v = Vector([3, 4], self.backend), Vector([1, -2], self.backend)
+        self.assertEqual((u.dot(v), u.norm(), u.norm(1), u.norm(float("inf"))), (-5.0, 5.0, 7.0, 4.0))
+        self.assertEqual((u + v).tolist(), [4.0, 2.0])
+        self.assertEqual((2 * u - v / 2).tolist(), [5.5, 9.0])
+        u.axpy(2, v)
+        self.assertEqual(u.tolist(), [5.0, 0.0])
+        self.assertAlmostEqual(Vector([1, 1], self.backend).cosine(Vector([2, 2], self.backend)), 1.0)
+        self.assertRaises(Exception, u.dot, Vector([1, 2, 3], self.backend))
+
+    def testTopKAndRowViews(self):
+        m = Matrix.fromList([[1, 0], [0, 1], [3, 1], [-2, 5]], backend=self.backend)
+        query = Vector([1, 0.5], self.backend)
+        self.assertEqual(query.topK(m, 2), [(2, 3.5), (0, 1.0)])
+        row = Vector.fromRow(m, 1)
+        row.axpy(1, query)
+        self.assertEqual(m.tolist()[1], [1.0, 1.5])
+        self.assertRaises(TypeError, Vector.fromRow, Matrix(1, 1, "q", self.backend), 0)
+
+
+@unittest.skipUnless(np is not None, "numpy is not installed")
+class NumpyVectorTests(VectorTests):
+    backend = "numpy"
+
+
+# Matrix test cases:
+class MatrixTests(unittest.TestCase):
+    backend = "python"
+
+    def testArithmeticAndBroadcasting(self):
+        m = Matrix.fromList([[1, 2], [3, 4]], backend=self.backend)
+        m.add(Matrix.fromList([[10, 20]], backend=self.backend))
+        self.assertEqual(m.tolist(), [[11, 22], [13, 24]])
+        m.subtract(Matrix.fromList([[1], [3]], backend=self.backend))
+        m.scalarMultiply(2)
+        self.assertEqual(m.tolist(), [[20, 42], [20, 42]])
+        self.assertRaises(Exception, m.add, Matrix(3, 3, backend=self.backend))
+
+    def testMultiplyAndTranspose(self):
+        a = Matrix.fromList([[1, 2, 3], [4, 5, 6]], backend=self.backend)
+        b = Matrix.fromList([[7, 8], [9, 10], [11, 12]], backend=self.backend)
+        self.assertEqual((a @ b).tolist(), [[58, 64], [139, 154]])
+        self.assertEqual(a.transpose().tolist(), [[1, 4], [2, 5], [3, 6]])
+        self.assertRaises(Exception, a.multiply, a)
+
+    def testTiledAndStrassenMultiply(self):
+        rng = random.Random(3)
+        a = Matrix.fromList([[rng.randint(-9, 9) for _ in range(37)] for _ in range(41)], "q", self.backend)
+        b = Matrix.fromList([[rng.randint(-9, 9) for _ in range(35)] for _ in range(37)], "q", self.backend)
+        expected = [[sum(x * y for x, y in zip(row, col)) for col in zip(*b.tolist())] for row in a.tolist()]
+        for blockSize, threshold in ((1, None), (8, None), (5, 4), (64, 9)):
+            self.assertEqual(a.multiply(b, blockSize, threshold).tolist(), expected)
+        # A lopsided product must not be padded out to a large square for Strassen's algorithm
+        wide = Matrix.fromList([[rng.randint(-9, 9) for _ in range(600)] for _ in range(37)], "q", self.backend)
+        expected = [[sum(x * y for x, y in zip(row, col)) for col in zip(*wide.tolist())] for row in a.tolist()]
+        self.assertEqual(a.multiply(wide, 64, 4).tolist(), expected)
+
+    def testParallelMatchesSerial(self):
+        rng = random.Random(4)
+        values = [[rng.randint(-9, 9) for _ in range(6)] for _ in range(11)]
+        serial, parallel = Matrix.fromList(values, backend=self.backend), Matrix.fromList(values, backend=self.backend)
+        row = Matrix.fromList([values[0]], backend=self.backend)
+        serial.add(row)
+        parallel.add(row, workers=3)
+        serial.scalarMultiply(0.5)
+        parallel.scalarMultiply(0.5, workers=2)
+        self.assertEqual(parallel.tolist(), serial.tolist())
+        self.assertEqual(serial.multiply(serial.transpose()).tolist(), serial.multiply(serial.transpose(), workers=4).tolist())
+        pool = datastructs._POOL
+        parallel.add(row, workers=2)
+        self.assertEqual((datastructs._POOL, datastructs._POOL_WORKERS), (pool, 4))
+        shutdownPool()
+        self.assertIsNone(datastructs._POOL)
+
+    def testMmapWritesThrough(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "features.bin")
+            m = Matrix.openMmap(path, 3, 2, backend=self.backend)
+            m.insert(1.5, 0, 1)
+            m.add(1)
+            m[2][0] = 7
+            m.close()
+
+            m = Matrix.openMmap(path, 3, 2, backend=self.backend)
+            self.assertEqual(m.tolist(), [[1, 2.5], [1, 1], [7, 1]])
+            self.assertEqual(len(m[1:]), 2 if self.backend == "numpy" else 4)
+            m.close()
+            self.assertRaises(ValueError, Matrix.openMmap, path, 2, 3, backend=self.backend)
+            counts = Matrix.openMmap(os.path.join(directory, "counts.bin"), 2, 2, "q", self.backend)
+            self.assertRaises(TypeError, counts.scalarMultiply, 0.5)
+            counts.close()
+
+    def testReductionsIgnoreEmptyCells(self):
+        m = Matrix(2, 3, backend=self.backend)
+        m.insert(1.0, 0, 0)
+        m.insert(5.0, 1, 0)
+        m.insert(3.0, 1, 2)
+        self.assertEqual((m.sum(), m.min(), m.max(), m.mean()), (9.0, 1.0, 5.0, 3.0))
+        self.assertEqual(m.sum(axis=0).tolist()[0][0], 6.0)
+        self.assertEqual(m.max(axis=1).tolist(), [[1.0], [5.0]])
+        self.assertTrue(m.search(None))
+        m.remove(0, 0)
+        self.assertIsNone(m[0, 0])
+
+    def testRowsAndReductionsAgreeAcrossBackends(self):
+        m = Matrix(2, 2, backend=self.backend)
+        m.insert(4.0, 0, 1)
+        self.assertEqual((list(m[0]), list(m[1])), ([None, 4.0], [None, None]))
+        self.assertEqual((sum(filter(None, m[0])), m.sum(), Matrix(2, 2, backend=self.backend).sum()), (4.0, 4.0, 0.0))
+        m[1][0] = 2.0
+        m[0][1] = None
+        self.assertEqual(m.tolist(), [[None, None], [2.0, None]])
+
+
+# Sparse matrix test cases:
+class SparseMatrixTests(unittest.TestCase):
+    dense = [[0, 2, 0, 0], [1, 0, 0, 3], [0, 0, 0, 0]]
+
+    def testConversions(self):
+        coo = COOMatrix(3, 4, "q")
+        for i, row in enumerate(self.dense):
+            for j, val in enumerate(row):
+                if val:
+                    coo.insert(val, i, j)
+        coo.insert(1, 0, 1)
+        csr, csc = coo.toCSR(), coo.toCSC()
+        self.assertEqual((list(csr.indptr), list(csr.indices), list(csr.values)), ([0, 1, 3, 3], [1, 0, 3], [3, 1, 3]))
+        self.assertEqual((list(csc.indptr), list(csc.indices)), ([0, 1, 2, 2, 3], [1, 0, 1]))
+        self.assertEqual((csr[0, 1], csr[2, 2], csc[1, 3]), (3, 0, 3))
+        self.assertEqual(csc.toCSR().toMatrix().tolist(), [[0, 3, 0, 0], [1, 0, 0, 3], [0, 0, 0, 0]])
+        m = Matrix.fromList([[None, 2.0], [0.0, 4.0]])
+        self.assertEqual(CSRMatrix.fromMatrix(m).nnz(), 2)
+
+    def testProductsAndSlicing(self):
+        a = CSRMatrix.fromMatrix(Matrix.fromList(self.dense, "q"))
+        b = Matrix.fromList([[1, 2], [3, 4], [5, 6], [7, 8]], "q")
+        expected = [[6, 8], [22, 26], [0, 0]]
+        self.assertEqual((a @ b).tolist(), expected)
+        self.assertEqual((a @ CSCMatrix.fromMatrix(b)).toMatrix().tolist(), expected)
+        self.assertEqual(a.transpose().toMatrix().tolist(), [list(col) for col in zip(*self.dense)])
+        self.assertEqual(a[1:].toMatrix().tolist(), self.dense[1:])
+        self.assertRaises(Exception, a.multiply, a)
+
+    def testElementwise(self):
+        a = CSRMatrix.fromMatrix(Matrix.fromList(self.dense, "q"))
+        b = a.transpose().transpose().toCOO()
+        self.assertEqual((a - b).nnz(), 0)
+        self.assertEqual((a + b).toMatrix().tolist(), [[2 * val for val in row] for row in self.dense])
+        self.assertEqual((a * b)[1, 3], 9)
+        self.assertEqual(((a / 2).dtype, (a / 2)[0, 1]), ("d", 1.0))
+        self.assertRaises(Exception, a.elementwise, a.transpose(), operator.add)
+
+    def testScalarOnlyScalesStoredValues(self):
+        coo = COOMatrix(2, 2, "q")
+        coo.insert(1, 0, 0)
+        self.assertEqual((3 * coo).toMatrix().tolist(), [[3, 0], [0, 0]])
+        self.assertEqual((coo + 0).toMatrix().tolist(), [[1, 0], [0, 0]])
+        self.assertRaises(TypeError, operator.add, coo, 5)
+        self.assertRaises(TypeError, operator.sub, coo, 1)
+
+
+@unittest.skipUnless(np is not None, "numpy is not installed")
+class NumpyMatrixTests(MatrixTests):
+    backend = "numpy"
+
+
+# Serialization test cases:
+class SerializationTests(unittest.TestCase):
+    def roundTrip(self, structure, **kwargs):
+        f = io.BytesIO()
+        structure.dump(f)
+        f.seek(0)
+        return type(structure).load(f, **kwargs)
+
+    def testLinkedStructures(self):
+        linked = SinglyLL()
+        for i in range(50000):
+            linked.insertTail(i)
+        self.assertEqual(list(self.roundTrip(linked)), list(range(50000)))
+
+        queue = Queue()
+        for val in ("a", 1, None):
+            queue.enqueue(val)
+        self.assertEqual(list(self.roundTrip(queue)), ["a", 1, None])
+
+        skip = IndexableSkipList()
+        for i in range(1000):
+            skip.insertTail(i)
+        copy = self.roundTrip(skip)
+        copy.insertAt(-1, 500)
+        self.assertEqual(([copy.get(i) for i in (0, 499, 500, 501, 1000)], len(copy)), ([0, 499, -1, 500, 999], 1001))
+
+    def testTreeShapeIsPreserved(self):
+        tree = BST()
+        for val in [50, 30, 70, 20, 40, 60, 80, 35] + list(range(81, 3000)):
+            tree.insert(val)
+        copy = self.roundTrip(tree)
+        self.assertEqual((copy.root.left.right.left.val, copy.root.right.right.right.val), (35, 81))
+        self.assertTrue(copy.search(2999))
+        self.assertIsNone(self.roundTrip(BST()).root)
+
+    def testTypedAndKeyedContainers(self):
+        stack = MinMaxStack(10, int)
+        stack.pushMany([3, 1, 2])
+        copy = self.roundTrip(stack)
+        self.assertEqual((list(copy), copy.min(), type(copy.stack)), ([3, 1, 2], 1, array.array))
+
+        table = HashTable(5)
+        for item in (1, 6, "ab", 3):
+            table.insert(item)
+        self.assertEqual(self.roundTrip(table).table, table.table)
+
+        heap = DAryHeap(range(20, 0, -1), d=3)
+        copy = self.roundTrip(heap)
+        self.assertEqual((copy.d, copy.delete()), (3, 1))
+
+        for queue in (PriorityQueue(), PriorityQueue(3)):
+            entries = queue.pushMany([("a", 2), ("b", 0), ("c", 2), ("d", 1)])
+            queue.remove(entries[3])
+            copy = self.roundTrip(queue)
+            self.assertEqual((copy.levels, copy.popMany(5)), (queue.levels, ["b", "a", "c"]))
+
+        tree = ArrayBinaryTree()
+        for val in (4, 2, 6):
+            tree.insert(val)
+        copy = self.roundTrip(tree)
+        self.assertEqual((copy.tree, copy.size), ([0, 4, 2, 6], 3))
+
+        m = Matrix.fromList([[1.5, None], [3, 4]], backend="python")
+        self.assertEqual(self.roundTrip(m).tolist(), m.tolist())
+        self.assertRaises(ValueError, Queue.load, io.BytesIO(b"DSBF\x01l\x05\x00Stack\x00\x00\x00\x00"))
+
+
+# Graph test cases:
+class GraphTests(unittest.TestCase):
+    frozen = False
+
+    def build(self, edges, n=0, directed=False):
+        graph = Graph.fromEdges(edges, n, directed)
+        return graph.freeze() if self.frozen else graph
+
+    def testEdgesAndTranspose(self):
+        graph = Graph(2, directed=True)
+        graph.addEdge(0, 3, 2.5)
+        graph.addEdge(0, 3, 4)
+        graph.addEdge(1, 0)
+        self.assertEqual((len(graph), graph.edgeCount), (4, 2))
+        graph = graph.freeze() if self.frozen else graph
+        self.assertEqual((graph.hasEdge(0, 3), graph.hasEdge(3, 0)), (True, False))
+        self.assertEqual(sorted(graph.neighbors(0)), [(3, 4)])
+        self.assertEqual(list(graph.transpose().neighbors(3)), [(0, 4)])
+        self.assertRaises(IndexError, graph.neighbors, 4)
+        undirected = self.build([(0, 1), (1, 1)])
+        self.assertEqual((undirected.edgeCount, undirected.hasEdge(1, 0)), (2, True))
+        self.assertIs(undirected.transpose(), undirected)
+
+    def testTraversals(self):
+        graph = self.build([(0, 1), (0, 2), (1, 3), (2, 3), (3, 4)], 6)
+        self.assertEqual(list(algorithms.bfs(graph, 0)), [(0, 0), (1, 1), (2, 1), (3, 2), (4, 3)])
+        self.assertEqual(list(algorithms.dfs(graph, 0)), [0, 1, 3, 2, 4])
+        self.assertEqual(list(algorithms.connectedComponents(graph)), [[0, 1, 2, 3, 4], [5]])
+        path = algorithms.bidirectionalSearch(graph, 0, 4)
+        self.assertEqual((len(path), path[0], path[-1]), (4, 0, 4))
+        self.assertEqual(algorithms.bidirectionalSearch(graph, 0, 5), [])
+
+    def testShortestPaths(self):
+        graph = self.build([(0, 1, 4), (0, 2, 1), (2, 1, 2), (1, 3, 1), (2, 3, 5)], 5, directed=True)
+        self.assertEqual([(u, d, p) for u, d, p in algorithms.dijkstra(graph, 0)], [(0, 0, None), (2, 1, 0), (1, 3, 2), (3, 4, 1)])
+        self.assertEqual(algorithms.shortestPath(graph, 0, 3), (4, [0, 2, 1, 3]))
+        self.assertEqual(algorithms.aStar(graph, 0, 3, lambda v: 0 if v == 3 else 1), (4, [0, 2, 1, 3]))
+        self.assertEqual(algorithms.shortestPath(graph, 0, 4), (float("inf"), []))
+        self.assertEqual(algorithms.bidirectionalSearch(graph, 3, 0), [])
+        negative = self.build([(0, 1, -1)], directed=True)
+        self.assertRaises(ValueError, list, algorithms.dijkstra(negative, 0))
+
+    def testTopologicalSort(self):
+        graph = self.build([(3, 1), (1, 0), (3, 2), (2, 0)], directed=True)
+        self.assertEqual(list(algorithms.topologicalSort(graph)), [3, 1, 2, 0])
+        self.assertRaises(ValueError, list, algorithms.topologicalSort(self.build([(0, 1), (1, 0)], directed=True)))
+        self.assertRaises(ValueError, list, algorithms.topologicalSort(self.build([(0, 1)])))
+
+
+class FrozenGraphTests(GraphTests):
+    frozen = True
+
+
+# Disjoint set test cases:
+class DisjointSetTests(unittest.TestCase):
+    def testUnionFindAndSizes(self):
+        sets = DisjointSet(6)
+        self.assertEqual(sets.unionMany([(0, 1), (2, 3), (1, 3), (0, 2)]), 3)
+        self.assertEqual((sets.connected(0, 3), sets.connected(0, 4), sets.size(2), sets.count), (True, False, 4, 3))
+        self.assertEqual(sets.add(), 6)
+        self.assertEqual(sets.groups(), [[0, 1, 2, 3], [4], [5], [6]])
+        self.assertRaises(IndexError, sets.find, 7)
+
+    def testKeyedDisjointSet(self):
+        sets = KeyedDisjointSet(["a"])
+        sets.union("b", "c")
+        sets.union(("x", 1), "a")
+        self.assertEqual((sets.connected("b", "c"), sets.connected("a", "b"), sets.connected("a", "z")), (True, False, False))
+        self.assertEqual((sets.size(("x", 1)), sets.count, len(sets)), (2, 2, 4))
+        self.assertIn(sets.find("c"), ("b", "c"))
+        self.assertEqual(sets.groups(), [["a", ("x", 1)], ["b", "c"]])
+        self.assertRaises(KeyError, sets.find, "z")
+
+    def testKruskal(self):
+        graph = Graph.fromEdges([(0, 1, 4), (0, 2, 1), (1, 2, 2), (1, 3, 5), (2, 3, 8), (4, 5, 3)])
+        for g in (graph, graph.freeze()):
+            self.assertEqual([tuple(edge) for edge in algorithms.kruskal(g)], [(0, 2, 1), (1, 2, 2), (4, 5, 3), (1, 3, 5)])
+        self.assertRaises(ValueError, list, algorithms.kruskal(Graph(2, directed=True)))
+
+
+# Prefix tree test cases:
+class TrieTests(unittest.TestCase):
+    tree = Trie
+
+    def testInsertSearchAndPrefixes(self):
+        tree = self.tree(["car", "cart", "care", "dog"])
+        tree.insert("cat", 7)
+        tree.insert("car", 1)
+        self.assertEqual((len(tree), tree.search("car"), tree.search("ca"), tree.get("cat"), tree.get("ca", -1)), (5, True, False, 7, -1))
+        self.assertEqual((tree.startsWith("ca"), tree.startsWith("cb"), "dog" in tree, 5 in tree), (True, False, True, False))
+        self.assertEqual(list(tree.keysWithPrefix("car")), ["car", "care", "cart"])
+        self.assertEqual(list(tree), ["car", "care", "cart", "cat", "dog"])
+        self.assertEqual((tree.longestPrefix("carton"), tree.longestPrefix("cab"), tree.longestPrefix("dogs")), ("cart", None, "dog"))
+        self.assertRaises(TypeError, tree.insert, 5)
+
+    def testRemoveAndBulkBuild(self):
+        keys = ["", "a", "ab", "abc", "abd", "b"]
+        tree = self.tree.fromSorted(keys, range(len(keys)))
+        self.assertEqual(list(tree.items("ab")), [("ab", 2), ("abc", 3), ("abd", 4)])
+        tree.remove("ab")
+        tree.remove("abc")
+        self.assertEqual((list(tree), tree.longestPrefix("abx"), tree.startsWith("abc")), (["", "a", "abd", "b"], "a", False))
+        self.assertRaises(KeyError, tree.remove, "ab")
+        self.assertRaises(ValueError, self.tree.fromSorted, ["b", "a"])
+        self.assertRaises(ValueError, self.tree.fromSorted, ["a", "b"], [1])
+
+
+class RadixTreeTests(TrieTests):
+    tree = RadixTree
+
+    def testEdgesAreCompressed(self):
+        tree = RadixTree(["romane", "romanus", "romulus", "rubens"])
+        self.assertEqual([child.label for child in tree.root.children], ["r"])
+        self.assertEqual([child.label for child in tree.root.children[0].children], ["om", "ubens"])
+        tree.remove("romulus")
+        self.assertEqual([child.label for child in tree.root.children[0].children], ["oman", "ubens"])
+
+
+# Range query test cases:
+class RangeQueryTests(unittest.TestCase):
+    def testFenwickTree(self):
+        arr = Array(5, int)
+        for val in [3, 1, 4, 1, 5]:
+            arr.append(val)
+        tree = FenwickTree(arr)
+        tree.add(1, 2)
+        tree.set(4, 0)
+        self.assertEqual((tree.prefixSum(3), tree.rangeSum(1, 4), tree[1], len(tree)), (10, 8, 3, 5))
+        self.assertEqual((tree.lowerBound(7), tree.lowerBound(11), tree.lowerBound(12), tree.lowerBound(0)), (3, 4, None, 0))
+        tree.add(0, 0.5)
+        self.assertEqual((tree.tree.typecode, tree.prefixSum(5)), ("d", 11.5))
+        self.assertRaises(IndexError, tree.rangeSum, 2, 6)
+
+    def testFenwickTreeOutgrowsTypedSums(self):
+        tree = FenwickTree([2**70, 1])
+        self.assertEqual((tree.prefixSum(2), tree[0]), (2**70 + 1, 2**70))
+        tree = FenwickTree([2**61, 2**61, 1])
+        tree.add(0, 2**62)
+        self.assertEqual((tree.prefixSum(2), tree.prefixSum(3), tree[1]), (2**63, 2**63 + 1, 2**61))
+
+    def testFenwickTreeOtherNumbers(self):
+        tree = FenwickTree([Decimal("1.5"), Decimal("2")])
+        tree.add(0, Decimal("0.25"))
+        self.assertEqual((tree.prefixSum(2), type(tree.tree)), (Decimal("3.75"), list))
+        tree = FenwickTree([1, 2])
+        tree.add(1, Fraction(1, 2))
+        self.assertEqual(tree.prefixSum(2), Fraction(7, 2))
+        ranged = RangeFenwickTree([Fraction(1, 2), 1])
+        ranged.rangeAdd(0, 2, 1)
+        self.assertEqual(ranged.rangeSum(0, 2), Fraction(7, 2))
+
+    def testRangeFenwickTree(self):
+        tree = RangeFenwickTree([1, 2, 3, 4, 5])
+        tree.rangeAdd(1, 4, 10)
+        tree.add(0, -1)
+        self.assertEqual(([tree[i] for i in range(5)], tree.rangeSum(0, 5), tree.rangeSum(2, 5)), ([0, 12, 13, 14, 5], 44, 32))
+
+    def testSegmentTreeLazyUpdates(self):
+        sums = SegmentTree([5, 2, 8, 1, 9, 3])
+        mins = SegmentTree([5, 2, 8, 1, 9, 3], min)
+        for tree in (sums, mins):
+            tree.rangeAdd(1, 4, 2)
+            tree.rangeAssign(3, 6, 4)
+            tree.rangeAdd(0, 5, -1)
+        self.assertEqual(list(sums), [4, 3, 9, 3, 3, 4])
+        self.assertEqual((sums.query(1, 5), mins.query(0, 3), mins.query(2, 2), mins[5]), (18, 3, float("inf"), 4))
+
+    def testSegmentTreeAnyAssociativeOperation(self):
+        concat = SegmentTree(["a", "b", "c", "d", "e"], operator.add, "")
+        concat.rangeAssign(1, 4, "x")
+        concat.set(0, "z")
+        self.assertEqual((concat.query(0, 5), concat.query(2, 4)), ("zxxxe", "xx"))
+        self.assertRaises(ValueError, concat.rangeAdd, 0, 3, "x")
+        gcds = SegmentTree([12, 18, 30, 7], math.gcd, 0)
+        self.assertEqual((gcds.query(0, 3), gcds.query(0, 4)), (6, 1))
+        self.assertRaises(ValueError, gcds.rangeAdd, 0, 2, 1)
+        self.assertRaises(ValueError, SegmentTree, [1, 2], math.gcd)
+
+    def testSparseTable(self):
+        arr = Array(6, int)
+        for val in [5, 2, 8, 1, 9, 3]:
+            arr.append(val)
+        mins, maxs = SparseTable(arr), SparseTable(arr, max)
+        self.assertEqual((mins.query(0, 6), mins.query(2, 4), maxs.query(0, 3), mins[4]), (1, 1, 8, 9))
+        self.assertEqual(mins.queryMany([(0, 2), (2, 3), (4, 6)]), [2, 8, 3])
+        self.assertEqual((mins.levels[0].typecode, SparseTable([0.5, 1], max).query(0, 2)), ("q", 1))
+        self.assertEqual(SparseTable([12, 18, 30], math.gcd).query(0, 3), 6)
+        self.assertRaises(ValueError, mins.query, 3, 3)
+        self.assertRaises(IndexError, mins.queryMany, [(0, 7)])
+        self.assertRaises(ValueError, mins.queryMany, [(0, 2), (3, 3)])
+        mixed = SparseTable([3, 1.5, 2], max)
+        self.assertEqual((type(mixed[0]), type(mixed.query(0, 1)), type(mixed.query(0, 3)), mixed.query(1, 3)), (int, int, int, 2))
+        self.assertEqual(SparseTable([0.5, 2.5]).levels[0].typecode, "d")
+        big = SparseTable([2**70, 1, 2**65])
+        self.assertEqual((type(big.levels[0]), big.query(0, 1), big.queryMany([(0, 3), (2, 3)])), (list, 2**70, [1, 2**65]))
+
+    def testSqrtDecomposition(self):
+        sums = SqrtDecomposition([5, 2, 8, 1, 9, 3, 7], blockSize=3)
+        mins = SqrtDecomposition([5, 2, 8, 1, 9, 3, 7], min)
+        for arr in (sums, mins):
+            arr.rangeAdd(1, 6, 2)
+            arr.set(3, 0)
+        self.assertEqual(list(sums), [5, 4, 10, 0, 11, 5, 7])
+        self.assertEqual(sums.queryMany([(0, 7), (2, 5), (4, 4)]), [42, 21, 0])
+        self.assertEqual(mins.queryMany([(0, 3), (4, 7), (0, 7)]), [4, 5, 0])
+        words = SqrtDecomposition(["a", "b", "c", "d"], operator.add, "")
+        words.set(1, "x")
+        self.assertEqual(words.query(0, 4), "axcd")
+        self.assertRaises(ValueError, words.rangeAdd, 0, 2, "y")